@@ -1,7 +1,15 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
+from fast_rafa.core.broker import close_broker
+from fast_rafa.core.query_counter import QueryCounterMiddleware
+from fast_rafa.core.settings import settings
+from fast_rafa.core.static import STATIC_DIR, PrecompressedStaticFiles
+from fast_rafa.core.templates import precompile_templates, templates
+from fast_rafa.modules.admin.routes import router as admin_router
 from fast_rafa.modules.auth.routes import router as token_router
 from fast_rafa.modules.calendars.routes import router as calendar_router
 from fast_rafa.modules.categories.routes import router as category_router
@@ -11,22 +19,36 @@ from fast_rafa.modules.categories_main.routes import (
 from fast_rafa.modules.deliveries.routes import router as delivery_router
 from fast_rafa.modules.events.routes import router as event_router
 from fast_rafa.modules.favorites.routes import router as favorite_router
+from fast_rafa.modules.feed.routes import router as feed_router
 from fast_rafa.modules.main.routes import router as main_router
 from fast_rafa.modules.messages.routes import router as message_router
 from fast_rafa.modules.organizations.routes import (
     router as organization_router,
 )
 from fast_rafa.modules.posts.routes import router as post_router
+from fast_rafa.modules.search.routes import router as search_router
+from fast_rafa.modules.search.services import warm_autocomplete_index
 from fast_rafa.modules.seeds.routes import router as seed_router
 from fast_rafa.modules.uploads.routes import router as upload_router
+from fast_rafa.modules.uploads.services import shutdown_image_executor
 from fast_rafa.modules.users.routes import router as user_router
 from fast_rafa.modules.watchlists.routes import router as watchlist_router
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    precompile_templates(templates.env)
+    await warm_autocomplete_index()
+    yield
+    shutdown_image_executor()
+    await close_broker()
+
+
 app = FastAPI(
     title='fast_rafa',
     version='0.1.0',
     description='API para o projeto fast_rafa',
+    lifespan=lifespan,
 )
 
 
@@ -38,13 +60,18 @@ app.add_middleware(
     allow_headers=['*'],
 )
 
+app.add_middleware(
+    QueryCounterMiddleware,
+    repeat_threshold=settings.DATABASE_QUERY_REPEAT_WARNING,
+)
+
 
 app.version = '1'
 
 
 app.mount(
     '/static',
-    StaticFiles(directory='fast_rafa/static'),
+    PrecompressedStaticFiles(directory=STATIC_DIR),
     name='static',
 )
 app.mount(
@@ -83,6 +110,11 @@ app.include_router(
 )
 
 
+app.include_router(
+    feed_router, prefix='/api/v' + app.version + '/feed', tags=['Feed']
+)
+
+
 app.include_router(
     calendar_router,
     prefix='/api/v' + app.version + '/calendars',
@@ -130,4 +162,14 @@ app.include_router(
     upload_router, prefix='/api/v' + app.version + '/uploads', tags=['Uploads']
 )
 
+app.include_router(
+    admin_router, prefix='/api/v' + app.version + '/admin', tags=['Admin']
+)
+
+app.include_router(
+    search_router,
+    prefix='/api/v' + app.version + '/autocomplete',
+    tags=['Search'],
+)
+
 app.include_router(main_router, tags=['Main'])
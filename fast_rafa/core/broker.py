@@ -0,0 +1,99 @@
+import asyncio
+from collections import defaultdict
+from functools import lru_cache
+
+from redis import asyncio as redis
+
+from fast_rafa.core.logger import setup_logger
+from fast_rafa.core.settings import settings
+
+logger = setup_logger()
+
+
+class MemoryPubSub:
+    """
+    Assinatura no MemoryBroker, com a mesma interface do PubSub do
+    redis.asyncio (subscribe, unsubscribe, listen, aclose).
+    """
+
+    def __init__(self, broker: 'MemoryBroker', max_pending: int):
+        self.broker = broker
+        self.channels = set()
+        self.queue = asyncio.Queue(maxsize=max_pending)
+
+    async def subscribe(self, *channels: str):
+        for channel in channels:
+            self.broker.subscribers[channel].add(self)
+            self.channels.add(channel)
+
+    async def unsubscribe(self, *channels: str):
+        for channel in channels or tuple(self.channels):
+            subscribers = self.broker.subscribers.get(channel)
+            if subscribers is not None:
+                subscribers.discard(self)
+                if not subscribers:
+                    del self.broker.subscribers[channel]
+            self.channels.discard(channel)
+
+    async def listen(self):
+        while True:
+            yield await self.queue.get()
+
+    async def aclose(self):
+        await self.unsubscribe()
+
+    def deliver(self, message: dict) -> bool:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Assinante lento: descarta em vez de travar quem publica
+            logger.warning(
+                f'Mensagem descartada no canal {message["channel"]}'
+            )
+            return False
+        return True
+
+
+class MemoryBroker:
+    """
+    Pub/sub em memória para um único processo: cada publicação é
+    entregue à fila de cada assinante do canal. Segue a interface do
+    cliente redis.asyncio (publish e pubsub), que o substitui quando
+    settings.MESSAGE_BROKER_URL é definido.
+    """
+
+    def __init__(self, max_pending: int = 100):
+        self.max_pending = max_pending
+        self.subscribers = defaultdict(set)
+
+    async def publish(self, channel: str, data: str) -> int:
+        message = {'type': 'message', 'channel': channel, 'data': data}
+        return sum(
+            subscriber.deliver(message)
+            for subscriber in tuple(self.subscribers.get(channel, ()))
+        )
+
+    def pubsub(self) -> MemoryPubSub:
+        return MemoryPubSub(self, self.max_pending)
+
+    async def aclose(self):
+        self.subscribers.clear()
+
+
+@lru_cache(maxsize=1)
+def get_broker():
+    """
+    Broker da aplicação: Redis quando MESSAGE_BROKER_URL está definido
+    (necessário com mais de um worker), senão o broker em memória.
+    """
+    if settings.MESSAGE_BROKER_URL:
+        return redis.from_url(
+            settings.MESSAGE_BROKER_URL, decode_responses=True
+        )
+    return MemoryBroker(settings.MESSAGE_BROKER_MAX_PENDING)
+
+
+async def close_broker():
+    if get_broker.cache_info().currsize:
+        await get_broker().aclose()
+        get_broker.cache_clear()
@@ -0,0 +1,70 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Optional
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Cache em memória com expiração por tempo (TTL), compartilhado entre as
+    requisições do mesmo processo. Usado para dados de página que são
+    iguais para a maioria dos usuários (categorias, sugestões da lateral)
+    e para os fragmentos de template renderizados. Ao atingir maxsize,
+    descarta a entrada usada há mais tempo (LRU).
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at <= monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl: Optional[float] = None):
+        """Guarda o valor; ttl substitui o tempo padrão do cache."""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+            elif len(self._data) >= self.maxsize:
+                # Respeita o limite descartando a menos usada
+                self._data.popitem(last=False)
+            expires_in = self.ttl if ttl is None else ttl
+            self._data[key] = (monotonic() + expires_in, value)
+
+    def invalidate(self, key=_MISSING):
+        """Remove uma chave, ou todas quando nenhuma é informada."""
+        with self._lock:
+            if key is _MISSING:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def invalidate_where(self, predicate):
+        """Remove as chaves para as quais predicate(chave) é verdadeiro."""
+        with self._lock:
+            for key in [key for key in self._data if predicate(key)]:
+                del self._data[key]
+
+    async def get_or_load(self, key, loader):
+        """
+        Retorna o valor em cache ou executa a corrotina loader() e guarda o
+        resultado.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = await loader()
+            self.set(key, value)
+        return value
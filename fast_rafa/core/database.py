@@ -1,11 +1,101 @@
+from typing import Optional
+
 from sqlalchemy import create_engine
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, sessionmaker
+
+from fast_rafa.core.pool import get_engine_options
+from fast_rafa.core.settings import settings
+
+# Driver assíncrono equivalente para cada driver síncrono suportado
+ASYNC_DRIVERS = {
+    'sqlite': 'sqlite+aiosqlite',
+    'sqlite+pysqlite': 'sqlite+aiosqlite',
+    'postgresql': 'postgresql+psycopg',
+    'postgresql+psycopg2': 'postgresql+psycopg',
+}
+
+
+def get_async_database_url(database_url: str) -> str:
+    """
+    Converte a URL de conexão síncrona para o driver assíncrono
+    equivalente (psycopg async para Postgres, aiosqlite para SQLite).
+    """
+    scheme, separator, rest = database_url.partition('://')
+    return f'{ASYNC_DRIVERS.get(scheme, scheme)}{separator}{rest}'
+
+
+def build_engine(database_url: str):
+    return create_engine(database_url, **get_engine_options(database_url))
+
+
+def build_async_engine(database_url: str):
+    return create_async_engine(
+        get_async_database_url(database_url),
+        **get_engine_options(database_url, is_async=True),
+    )
+
+
+def build_engines(
+    database_url: str, replica_url: Optional[str] = None
+) -> dict:
+    """
+    Cria os engines da aplicação. Sem réplica configurada, as leituras
+    usam os mesmos engines (e pools) do banco primário.
+    """
+    engines = {
+        'primary': build_engine(database_url),
+        'primary_async': build_async_engine(database_url),
+    }
+    if replica_url:
+        engines['replica'] = build_engine(replica_url)
+        engines['replica_async'] = build_async_engine(replica_url)
+    else:
+        engines['replica'] = engines['primary']
+        engines['replica_async'] = engines['primary_async']
+    return engines
 
-from fast_rafa.core.settings import Settings
 
-engine = create_engine(Settings().DATABASE_URL)
+engines = build_engines(settings.DATABASE_URL, settings.DATABASE_REPLICA_URL)
+
+engine = engines['primary']
+replica_engine = engines['replica']
+async_engine = engines['primary_async']
+async_replica_engine = engines['replica_async']
+
+SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+ReadSessionLocal = sessionmaker(
+    bind=replica_engine, autocommit=False, autoflush=False
+)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, expire_on_commit=False
+)
+AsyncReadSessionLocal = async_sessionmaker(
+    async_replica_engine, class_=AsyncSession, expire_on_commit=False
+)
 
 
 def get_session():  # pragma: no cover
+    """Sessão no banco primário, usada pelas rotas que escrevem."""
     with Session(engine) as session:
         yield session
+
+
+def get_read_session():  # pragma: no cover
+    """Sessão de leitura, roteada para a réplica quando configurada."""
+    with ReadSessionLocal() as session:
+        yield session
+
+
+async def get_async_session():  # pragma: no cover
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+async def get_async_read_session():  # pragma: no cover
+    async with AsyncReadSessionLocal() as session:
+        yield session
@@ -1,10 +1,4 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-
-from fast_rafa.core.settings import Settings
-
-engine = create_engine(Settings().DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+from fast_rafa.core.database import SessionLocal
 
 
 def get_session():
@@ -0,0 +1,148 @@
+import time
+from threading import Lock
+
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from fast_rafa.core.logger import setup_logger
+from fast_rafa.core.settings import settings
+
+logger = setup_logger()
+
+
+class PoolWaitStats:
+    """
+    Acumula o tempo gasto esperando uma conexão do pool
+    (inclui a abertura de novas conexões de overflow).
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.last_wait = 0.0
+
+    def record(self, wait: float, timed_out: bool = False):
+        with self._lock:
+            self.checkouts += 1
+            self.timeouts += int(timed_out)
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            self.last_wait = wait
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            avg_wait = (
+                self.total_wait / self.checkouts if self.checkouts else 0
+            )
+            return {
+                'checkouts': self.checkouts,
+                'timeouts': self.timeouts,
+                'avg_wait_ms': round(avg_wait * 1000, 3),
+                'max_wait_ms': round(self.max_wait * 1000, 3),
+                'last_wait_ms': round(self.last_wait * 1000, 3),
+            }
+
+
+class MonitoredPoolMixin:
+    """Mede o tempo de espera de cada checkout do pool."""
+
+    wait_warning = settings.DATABASE_POOL_WAIT_WARNING
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.wait_stats.record(time.perf_counter() - start, True)
+            logger.error(
+                f'Timeout ao obter conexão do pool: {format_pool_status(self)}'
+            )
+            raise
+
+        wait = time.perf_counter() - start
+        self.wait_stats.record(wait)
+        if wait >= self.wait_warning:
+            logger.warning(
+                f'Espera de {wait * 1000:.1f} ms por conexão do pool: '
+                f'{format_pool_status(self)}'
+            )
+        return connection
+
+
+class MonitoredQueuePool(MonitoredPoolMixin, QueuePool):
+    pass
+
+
+class MonitoredAsyncQueuePool(MonitoredPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def get_engine_options(database_url: str, is_async: bool = False) -> dict:
+    """
+    Monta os parâmetros do pool de conexões a partir do settings.
+    O SQLite usa pools próprios, então recebe apenas pre-ping e recycle.
+    """
+    options = {
+        'pool_pre_ping': settings.DATABASE_POOL_PRE_PING,
+        'pool_recycle': settings.DATABASE_POOL_RECYCLE,
+    }
+
+    if make_url(database_url).get_backend_name() != 'sqlite':
+        options.update({
+            'poolclass': MonitoredAsyncQueuePool
+            if is_async
+            else MonitoredQueuePool,
+            'pool_size': settings.DATABASE_POOL_SIZE,
+            'max_overflow': settings.DATABASE_MAX_OVERFLOW,
+            'pool_timeout': settings.DATABASE_POOL_TIMEOUT,
+        })
+
+    return options
+
+
+def get_pool_status(pool) -> dict:
+    """Retorna o estado atual do pool: conexões em uso, ociosas e overflow."""
+    status = {'pool': pool.__class__.__name__}
+
+    if isinstance(pool, QueuePool):
+        status.update({
+            'size': pool.size(),
+            'checked_out': pool.checkedout(),
+            'idle': pool.checkedin(),
+            'overflow': max(pool.overflow(), 0),
+            # Todos os pools são criados com o limite do settings
+            'max_overflow': settings.DATABASE_MAX_OVERFLOW,
+            'timeout': pool.timeout(),
+        })
+
+    if isinstance(pool, MonitoredPoolMixin):
+        status['wait'] = pool.wait_stats.to_dict()
+
+    return status
+
+
+def format_pool_status(pool) -> str:
+    status = get_pool_status(pool)
+    if 'size' not in status:
+        return status['pool']
+
+    line = (
+        f'{status["pool"]} size={status["size"]} '
+        f'checked_out={status["checked_out"]} idle={status["idle"]} '
+        f'overflow={status["overflow"]}/{status["max_overflow"]}'
+    )
+    if 'wait' in status:
+        line += (
+            f' avg_wait={status["wait"]["avg_wait_ms"]}ms'
+            f' max_wait={status["wait"]["max_wait_ms"]}ms'
+            f' timeouts={status["wait"]["timeouts"]}'
+        )
+    return line
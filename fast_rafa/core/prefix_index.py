@@ -0,0 +1,99 @@
+import re
+from bisect import bisect_left
+from operator import itemgetter
+from time import monotonic
+from typing import Optional
+
+from fast_rafa.utils.funcs import remover_acentos
+
+_WORD = re.compile(r'\w+')
+
+
+def fold_text(text: str) -> str:
+    """Normaliza para comparação: sem acentos, minúsculo, só palavras."""
+    return ' '.join(_WORD.findall(remover_acentos(text or '').lower()))
+
+
+class PrefixIndex:
+    """
+    Índice de prefixos em memória: um array ordenado de chaves consultado
+    com bisect. Cada palavra do texto indexado gera uma chave (o texto a
+    partir dela), então "banco" e "alimentos" encontram "Banco de
+    Alimentos". Os valores precisam ser hasheáveis.
+
+    Cada invalidação avança a geração; uma reconstrução que começou antes
+    dela não deixa o índice em dia, e a próxima consulta pede outra.
+    """
+
+    def __init__(self):
+        # Chaves e valores são trocados juntos, em uma única atribuição
+        self._data = ([], [])
+        self._built_at = None
+        self._generation = 0
+        self._built_generation = None
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    @property
+    def built(self) -> bool:
+        """Indica se já existe uma versão do índice para consultar."""
+        return self._built_at is not None
+
+    def build(self, entries, generation: Optional[int] = None):
+        """
+        Reconstrói o índice a partir de pares (texto, valor). generation é
+        a geração lida antes de carregar as entradas.
+        """
+        pairs = []
+        for text, value in entries:
+            words = fold_text(text).split()
+            pairs.extend(
+                (' '.join(words[start:]), value) for start in range(len(words))
+            )
+        pairs.sort(key=itemgetter(0))
+
+        self._data = (
+            [key for key, _ in pairs],
+            [value for _, value in pairs],
+        )
+        self._built_at = monotonic()
+        self._built_generation = (
+            self._generation if generation is None else generation
+        )
+
+    def invalidate(self):
+        """
+        Marca o índice para ser reconstruído; a versão atual continua
+        respondendo até a nova ficar pronta.
+        """
+        self._generation += 1
+
+    def expired(self, ttl: float) -> bool:
+        return (
+            self._built_at is None
+            or self._built_generation != self._generation
+            or monotonic() - self._built_at > ttl
+        )
+
+    def search(self, prefix: str, limit: int = 10) -> list:
+        prefix = fold_text(prefix)
+        if not prefix:
+            return []
+
+        keys, values = self._data
+        results = []
+        seen = set()
+        for position in range(bisect_left(keys, prefix), len(keys)):
+            if not keys[position].startswith(prefix):
+                break
+            value = values[position]
+            if value in seen:
+                continue
+            seen.add(value)
+            results.append(value)
+            if len(results) >= limit:
+                break
+
+        return results
@@ -0,0 +1,117 @@
+import re
+from collections import Counter
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from fast_rafa.core.logger import setup_logger
+
+logger = setup_logger()
+
+_WHITESPACE = re.compile(r'\s+')
+# Listas IN expandidas ("IN (?, ?, ?)") contam como o mesmo formato
+_PARAM_LIST = re.compile(r'\((?:\s*(?:\?|%\(\w+\)s|%s|:\w+)\s*,?)+\)')
+
+
+class QueryStats:
+    """Consultas executadas durante uma requisição."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = Counter()
+
+    def record(self, statement: str, duration: float):
+        self.count += 1
+        self.duration += duration
+        self.statements[normalize_statement(statement)] += 1
+
+    def repeated(self, threshold: int) -> list:
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count > threshold
+        ]
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    'query_stats', default=None
+)
+
+
+def normalize_statement(statement: str) -> str:
+    statement = _WHITESPACE.sub(' ', statement).strip()
+    return _PARAM_LIST.sub('(?)', statement)
+
+
+def get_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+@event.listens_for(Engine, 'before_cursor_execute', named=True)
+def _before_cursor_execute(conn, **kw):
+    if _current_stats.get() is not None:
+        conn.info.setdefault('query_start_time', []).append(perf_counter())
+
+
+@event.listens_for(Engine, 'after_cursor_execute', named=True)
+def _after_cursor_execute(conn, statement, **kw):
+    stats = _current_stats.get()
+    start_times = conn.info.get('query_start_time')
+    if stats is None or not start_times:
+        return
+    stats.record(statement, perf_counter() - start_times.pop())
+
+
+@event.listens_for(Engine, 'handle_error')
+def _handle_error(context):
+    # Sem o after_cursor_execute, o início da consulta que falhou ficaria
+    # na conexão do pool e atrasaria a medição das próximas
+    start_times = context.connection is not None and (
+        context.connection.info.get('query_start_time')
+    )
+    if context.statement is None or not start_times:
+        return
+    start_time = start_times.pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(context.statement, perf_counter() - start_time)
+
+
+class QueryCounterMiddleware(BaseHTTPMiddleware):
+    """
+    Conta as consultas SQL e o tempo gasto no banco em cada requisição,
+    devolvendo os valores nos cabeçalhos X-DB-Queries e Server-Timing.
+    Registra um aviso quando o mesmo formato de consulta se repete mais
+    de repeat_threshold vezes (sinal de N+1).
+    """
+
+    def __init__(self, app, repeat_threshold: int = 10):
+        super().__init__(app)
+        self.repeat_threshold = repeat_threshold
+
+    async def dispatch(self, request, call_next):
+        stats = QueryStats()
+        token = _current_stats.set(stats)
+        try:
+            response = await call_next(request)
+        finally:
+            _current_stats.reset(token)
+
+        duration_ms = stats.duration * 1000
+        response.headers['X-DB-Queries'] = str(stats.count)
+        response.headers['Server-Timing'] = (
+            f'db;dur={duration_ms:.1f};desc="{stats.count} queries"'
+        )
+
+        for statement, count in stats.repeated(self.repeat_threshold):
+            logger.warning(
+                f'Possível N+1 em {request.method} {request.url.path}: '
+                f'consulta executada {count} vezes: {statement}'
+            )
+
+        return response
@@ -1,3 +1,5 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from http import HTTPStatus
 from typing import Optional, Tuple
@@ -7,28 +9,46 @@ from fastapi.security import OAuth2PasswordBearer
 from jwt import decode, encode
 from jwt.exceptions import PyJWTError
 from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
 from zoneinfo import ZoneInfo
 
+from fast_rafa.core.cache import TTLCache
 from fast_rafa.core.database import get_session
+from fast_rafa.core.settings import settings
 from fast_rafa.modules.auth.schemas import TokenData
 from fast_rafa.modules.users.models import User
 
-pwd_context = PasswordHash.recommended()
+# Custos do Argon2 vindos das configurações. Hashes gravados com outros
+# parâmetros continuam válidos e são refeitos no próximo login.
+pwd_context = PasswordHash((
+    Argon2Hasher(
+        time_cost=settings.ARGON2_TIME_COST,
+        memory_cost=settings.ARGON2_MEMORY_COST,
+        parallelism=settings.ARGON2_PARALLELISM,
+    ),
+))
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl='auth/token')
 
 SECRET_KEY = 'secret'
 ALGORITHM = 'HS256'
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# Usuários autenticados por (username, iat do token): cada dispositivo
+# logado tem a sua entrada, e um token novo não descarta as demais.
+# A cópia em cache fica desanexada de qualquer sessão; cada requisição
+# recebe uma cópia própria via merge(load=False).
+user_cache = TTLCache(
+    settings.AUTH_USER_CACHE_TTL, settings.AUTH_USER_CACHE_SIZE
+)
+
 
 class CustomOAuth2PasswordBearer(OAuth2PasswordBearer):
     async def __call__(self, request: Request) -> Optional[str]:
         try:
-            token = await super().__call__(request)
-            print(f'Token recebido: {token}')  # Adicione este log
-            return token
+            return await super().__call__(request)
         except HTTPException as e:
             if e.status_code == status.HTTP_401_UNAUTHORIZED:
                 raise HTTPException(
@@ -48,6 +68,58 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+class PasswordHashPool:
+    """
+    Executa o Argon2 em threads dedicadas (a biblioteca libera o GIL), fora
+    do event loop. Acima de max_pending operações em andamento ou na fila,
+    novas chamadas recebem 503 em vez de aumentar a espera de todos.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix='argon2'
+        )
+        self.max_pending = max_pending
+        # Alterado apenas no event loop, dispensa lock
+        self.pending = 0
+
+    async def run(self, func, *args):
+        if self.pending >= self.max_pending:
+            raise HTTPException(
+                status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+                detail='Servidor ocupado, tente novamente em instantes',
+                headers={'Retry-After': '1'},
+            )
+
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, func, *args)
+        finally:
+            self.pending -= 1
+
+
+password_hash_pool = PasswordHashPool(
+    settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_PENDING
+)
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await password_hash_pool.run(pwd_context.hash, password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verifica a senha no pool. O segundo valor é um novo hash quando o
+    atual foi gerado com parâmetros diferentes dos configurados.
+    """
+    return await password_hash_pool.run(
+        pwd_context.verify_and_update, plain_password, hashed_password
+    )
+
+
 def create_access_token(
     data_payload: dict, expires_delta: Optional[timedelta] = None
 ) -> str:
@@ -60,11 +132,93 @@ def create_access_token(
             minutes=ACCESS_TOKEN_EXPIRE_MINUTES
         )
 
-    to_encode.update({'exp': expire})
+    to_encode.update({
+        'exp': expire,
+        'iat': datetime.now(tz=ZoneInfo('UTC')),
+    })
     encoded_jwt = encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
+def select_user_by_username(username: str):
+    # A organização é carregada junto, pois as páginas a acessam
+    # e a sessão assíncrona não faz lazy load
+    return (
+        select(User)
+        .options(joinedload(User.organization))
+        .where(User.username == username)
+    )
+
+
+def get_cached_user(username: str, issued_at) -> Optional[User]:
+    return user_cache.get((username, issued_at))
+
+
+def cache_user(db, user: User, issued_at) -> None:
+    """Desanexa o usuário recém-carregado da sessão e o guarda no cache."""
+    if user.organization is not None:
+        db.expunge(user.organization)
+    db.expunge(user)
+    user_cache.set((user.username, issued_at), user)
+
+
+def invalidate_cached_user(*usernames: str) -> None:
+    """
+    Remove o usuário do cache, em todos os tokens, após alterações na linha.
+    Só vale para este processo: nos demais workers a cópia antiga continua
+    aceita por até AUTH_USER_CACHE_TTL segundos, por isso esse tempo é curto.
+    """
+    usernames = set(usernames)
+    user_cache.invalidate_where(lambda key: key[0] in usernames)
+
+
+def update_password_hash(db: Session, user: User, new_hash: Optional[str]):
+    """Grava o hash refeito no login, quando os parâmetros mudaram."""
+    if new_hash:
+        user.senha_hash = new_hash
+        db.commit()
+        invalidate_cached_user(user.username)
+
+
+def load_user(db: Session, username: str, issued_at) -> Optional[User]:
+    user = get_cached_user(username, issued_at)
+    if user is None:
+        user = db.scalar(select_user_by_username(username))
+        if user is None:
+            return None
+        cache_user(db, user, issued_at)
+    return db.merge(user, load=False)
+
+
+async def load_user_async(
+    db: AsyncSession, username: str, issued_at
+) -> Optional[User]:
+    user = get_cached_user(username, issued_at)
+    if user is None:
+        user = await db.scalar(select_user_by_username(username))
+        if user is None:
+            return None
+        cache_user(db, user, issued_at)
+    return await db.merge(user, load=False)
+
+
+async def get_user_from_token_async(
+    db: AsyncSession, token: Optional[str]
+) -> Optional[User]:
+    """Usuário do token JWT, ou None se ausente ou inválido."""
+    if not token:
+        return None
+    try:
+        payload = decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except PyJWTError:
+        return None
+
+    username = payload.get('sub')
+    if not username:
+        return None
+    return await load_user_async(db, username, payload.get('iat'))
+
+
 async def get_current_user(
     db: Session = Depends(get_session),
     token: str = Depends(CustomOAuth2PasswordBearer(tokenUrl='auth/token')),
@@ -77,7 +231,6 @@ async def get_current_user(
 
     try:
         payload = decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        print(f'Payload do Token: {payload}')
         username: str = payload.get('sub')
         if username is None:
             raise credentials_exception
@@ -85,7 +238,7 @@ async def get_current_user(
     except PyJWTError:
         raise credentials_exception
 
-    user = db.scalar(select(User).where(User.username == token_data.username))
+    user = load_user(db, token_data.username, payload.get('iat'))
     if user is None:
         raise credentials_exception
     return user
@@ -118,7 +271,7 @@ async def get_user_from_cookie(
         if not username:
             return None, 'Username não encontrado no token'
 
-        user = db.scalar(select(User).where(User.username == username))
+        user = load_user(db, username, payload.get('iat'))
         if not user:
             return None, 'Usuário não encontrado'
 
@@ -131,7 +284,7 @@ async def get_user_from_cookie(
 
 
 async def get_user_and_access_token_from_cookie(
-    request: Request, db: Session
+    request: Request, db: AsyncSession
 ) -> Tuple[Optional[User], Optional[str], Optional[str]]:
     """
     Tenta obter o usuário atual e o access_token a partir do token no cookie.
@@ -150,7 +303,7 @@ async def get_user_and_access_token_from_cookie(
         if not username:
             return None, None, 'Username não encontrado no token'
 
-        user = db.scalar(select(User).where(User.username == username))
+        user = await load_user_async(db, username, payload.get('iat'))
         if not user:
             return None, None, 'Usuário não encontrado'
 
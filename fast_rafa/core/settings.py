@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -8,3 +10,67 @@ class Settings(BaseSettings):
     }
 
     DATABASE_URL: str
+    # Réplica de leitura opcional: rotas GET e páginas passam a ler dela
+    DATABASE_REPLICA_URL: Optional[str] = None
+
+    # Pool de conexões (aplicado apenas a bancos servidor, ex.: Postgres).
+    # workers * (POOL_SIZE + MAX_OVERFLOW) deve caber em max_connections.
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30.0
+    DATABASE_POOL_RECYCLE: int = 1800
+    DATABASE_POOL_PRE_PING: bool = True
+    # Esperas por conexão acima deste valor (segundos) geram um aviso no log
+    DATABASE_POOL_WAIT_WARNING: float = 0.5
+
+    # Consultas com o mesmo formato repetidas mais vezes que isso em uma
+    # única requisição geram um aviso de possível N+1 no log
+    DATABASE_QUERY_REPEAT_WARNING: int = 10
+
+    # Tempo (segundos) que categorias e sugestões da lateral ficam em cache
+    PAGE_CACHE_TTL: float = 60.0
+    # Diretório do cache de bytecode dos templates (None = pasta temporária)
+    TEMPLATE_BYTECODE_CACHE_DIR: Optional[str] = None
+
+    # Cache de usuários autenticados (segundos e número máximo de entradas).
+    # A invalidação é por processo: um usuário excluído ou desativado ainda
+    # autentica nos outros workers até o TTL vencer.
+    AUTH_USER_CACHE_TTL: float = 10.0
+    AUTH_USER_CACHE_SIZE: int = 1024
+
+    # Fuso horário da aplicação (ex.: 'America/Sao_Paulo'); None usa o
+    # fuso do sistema. Resolvido uma única vez por processo.
+    TIMEZONE: Optional[str] = None
+    # Grava criado_em/atualizado_em das organizações em UTC, e os templates
+    # passam a exibi-los no fuso local (filtro organization_localtime). Ao
+    # ativar, rode `task organizations_to_utc` para converter as linhas
+    # existentes; a conversão é registrada e não se repete.
+    TIMESTAMPS_UTC: bool = False
+
+    # Uploads de imagem: tamanho máximo (bytes) e processos que geram os
+    # derivados WebP redimensionados
+    UPLOAD_MAX_BYTES: int = 5 * 1024 * 1024
+    IMAGE_WORKERS: int = 2
+
+    # Argon2: custo de tempo, memória (KiB) e paralelismo dos hashes de
+    # senha. Alterações valem para novos hashes e para o próximo login.
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST: int = 65536
+    ARGON2_PARALLELISM: int = 4
+    # Threads que calculam os hashes e limite de operações pendentes
+    # antes de responder 503
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 32
+
+    # Pub/sub das mensagens do chat. Sem URL, usa o broker em memória (um
+    # único worker); com vários workers, aponte para um Redis.
+    MESSAGE_BROKER_URL: Optional[str] = None
+    # Mensagens enfileiradas por conexão antes de descartar as novas
+    MESSAGE_BROKER_MAX_PENDING: int = 100
+
+    # Índice de autocomplete: reconstruído após escritas ou a cada TTL
+    AUTOCOMPLETE_INDEX_TTL: float = 300.0
+
+
+# Instância única, compartilhada pelo restante da aplicação
+settings = Settings()
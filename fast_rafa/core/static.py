@@ -0,0 +1,168 @@
+import gzip
+import hashlib
+import json
+import os
+import shutil
+
+import anyio
+import brotli
+from fastapi.staticfiles import StaticFiles
+from jinja2 import pass_context
+from starlette.datastructures import Headers
+
+from fast_rafa.core.logger import setup_logger
+
+STATIC_DIR = 'fast_rafa/static'
+# Cópias com hash no nome geradas por `task build_static` (fora do git)
+BUILD_DIR = 'dist'
+MANIFEST_FILE = 'manifest.json'
+
+# Pastas que não passam pelo build (conteúdo enviado pelos usuários)
+SKIP_DIRS = {BUILD_DIR, 'uploads', '__pycache__'}
+COMPRESSIBLE = {'.css', '.js', '.svg', '.json', '.txt', '.html', '.map'}
+
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
+# Ordem de preferência quando o navegador aceita mais de uma codificação
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+logger = setup_logger()
+
+
+def fingerprint(path: str, content: bytes) -> str:
+    """css/output.css -> css/output.<hash>.css"""
+    digest = hashlib.blake2b(content, digest_size=6).hexdigest()
+    root, ext = os.path.splitext(path)
+    return f'{root}.{digest}{ext}'
+
+
+def compress_variants(content: bytes) -> dict:
+    """Versões comprimidas do arquivo, só as que ficam menores."""
+    variants = {
+        '.br': brotli.compress(content, quality=11),
+        '.gz': gzip.compress(content, compresslevel=9, mtime=0),
+    }
+    return {
+        suffix: data
+        for suffix, data in variants.items()
+        if len(data) < len(content)
+    }
+
+
+def build_static(source: str = STATIC_DIR) -> dict:
+    """
+    Gera em <source>/dist uma cópia de cada arquivo estático com o hash do
+    conteúdo no nome, mais as versões .gz/.br dos arquivos de texto, e
+    grava o manifest (caminho original -> caminho com hash).
+    """
+    target = os.path.join(source, BUILD_DIR)
+    shutil.rmtree(target, ignore_errors=True)
+
+    manifest = {}
+    for directory, subdirs, files in os.walk(source):
+        subdirs[:] = [name for name in subdirs if name not in SKIP_DIRS]
+        for name in files:
+            if name.endswith('.py'):
+                continue
+            full_path = os.path.join(directory, name)
+            path = os.path.relpath(full_path, source).replace(os.sep, '/')
+            with open(full_path, 'rb') as file:
+                content = file.read()
+
+            hashed = fingerprint(path, content)
+            files_to_write = {hashed: content}
+            if os.path.splitext(name)[1] in COMPRESSIBLE:
+                files_to_write.update(
+                    (hashed + suffix, data)
+                    for suffix, data in compress_variants(content).items()
+                )
+
+            for relative, data in files_to_write.items():
+                destination = os.path.join(target, relative)
+                os.makedirs(os.path.dirname(destination), exist_ok=True)
+                with open(destination, 'wb') as file:
+                    file.write(data)
+
+            manifest[path] = f'{BUILD_DIR}/{hashed}'
+
+    with open(
+        os.path.join(target, MANIFEST_FILE), 'w', encoding='utf-8'
+    ) as file:
+        json.dump(manifest, file, indent=2, sort_keys=True)
+    return manifest
+
+
+def load_manifest(source: str = STATIC_DIR) -> dict:
+    """Manifest do último build; vazio se o build ainda não foi feito."""
+    try:
+        path = os.path.join(source, BUILD_DIR, MANIFEST_FILE)
+        with open(path, encoding='utf-8') as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+
+
+static_manifest = load_manifest()
+
+
+@pass_context
+def static_url(context, path: str) -> str:
+    """
+    Helper dos templates: URL do arquivo estático com hash no nome, ou a
+    URL normal quando o arquivo não está no manifest.
+    """
+    return context['request'].url_for(
+        'static', path=static_manifest.get(path, path)
+    )
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    StaticFiles que entrega a variante .br/.gz gerada no build quando o
+    navegador aceita a codificação, e marca os arquivos com hash no nome
+    como imutáveis (o nome muda quando o conteúdo muda).
+    """
+
+    @staticmethod
+    def accepted_encodings(scope) -> set:
+        header = Headers(scope=scope).get('accept-encoding', '')
+        return {
+            value.split(';')[0].strip().lower() for value in header.split(',')
+        }
+
+    async def precompressed_response(self, path: str, scope):
+        accepted = self.accepted_encodings(scope)
+        for encoding, suffix in ENCODINGS:
+            if encoding not in accepted:
+                continue
+            full_path, stat_result = await anyio.to_thread.run_sync(
+                self.lookup_path, path + suffix
+            )
+            if stat_result is None:
+                continue
+            # O tipo é deduzido do nome (ex.: .css.gz -> text/css)
+            response = self.file_response(full_path, stat_result, scope)
+            response.headers['content-encoding'] = encoding
+            return response
+        return None
+
+    async def get_response(self, path: str, scope):
+        immutable = path.startswith(f'{BUILD_DIR}/')
+        response = None
+        if immutable and scope['method'] in {'GET', 'HEAD'}:
+            response = await self.precompressed_response(path, scope)
+        if response is None:
+            response = await super().get_response(path, scope)
+
+        if immutable:
+            response.headers['cache-control'] = IMMUTABLE_CACHE
+            response.headers['vary'] = 'Accept-Encoding'
+        return response
+
+
+def run_task_build_static():
+    """
+    Gera os arquivos estáticos com hash e comprimidos.
+    Uso: task build_static
+    """
+    manifest = build_static()
+    print(f'{len(manifest)} arquivo(s) estático(s) gerado(s).')
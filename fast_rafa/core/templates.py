@@ -0,0 +1,101 @@
+import os
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    TemplateSyntaxError,
+    nodes,
+)
+from jinja2.ext import Extension
+
+from fast_rafa.core.cache import TTLCache
+from fast_rafa.core.logger import setup_logger
+from fast_rafa.core.settings import settings
+from fast_rafa.core.static import static_url
+from fast_rafa.modules.uploads.services import image_variant
+from fast_rafa.utils.timezone import localtime, organization_localtime
+
+TEMPLATES_DIR = 'fast_rafa/templates'
+
+logger = setup_logger()
+
+# HTML dos fragmentos marcados com {% cache %}, compartilhado entre usuários
+fragment_cache = TTLCache(settings.PAGE_CACHE_TTL)
+
+
+class FragmentCacheExtension(Extension):
+    """
+    Tag {% cache chave, ttl %} ... {% endcache %}: o trecho é renderizado
+    uma vez por TTL e reaproveitado nas requisições seguintes. A URL base
+    da requisição entra na chave, pois url_for gera endereços absolutos.
+    """
+
+    tags = {'cache'}
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        args = [parser.parse_expression()]
+        parser.stream.expect('comma')
+        args.append(parser.parse_expression())
+        args.append(nodes.ContextReference())
+
+        body = parser.parse_statements(['name:endcache'], drop_needle=True)
+        return nodes.CallBlock(
+            self.call_method('_cache_support', args), [], [], body
+        ).set_lineno(lineno)
+
+    @staticmethod
+    def _cache_support(key, ttl, context, caller):
+        request = context.get('request')
+        key = (str(request.base_url) if request else '', key)
+
+        html = fragment_cache.get(key)
+        if html is None:
+            html = caller()
+            fragment_cache.set(key, html, ttl)
+        return html
+
+
+def invalidate_fragments():
+    fragment_cache.invalidate()
+
+
+def create_environment(directory: str = TEMPLATES_DIR) -> Environment:
+    cache_dir = settings.TEMPLATE_BYTECODE_CACHE_DIR
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+
+    env = Environment(
+        loader=FileSystemLoader(directory),
+        autoescape=True,
+        # Templates compilados ficam em disco e são reaproveitados pelos
+        # outros workers e reinícios, sem novo parse
+        bytecode_cache=FileSystemBytecodeCache(cache_dir),
+        extensions=[FragmentCacheExtension],
+    )
+    env.globals['page_cache_ttl'] = settings.PAGE_CACHE_TTL
+    env.globals['static_url'] = static_url
+    env.filters['localtime'] = localtime
+    env.filters['organization_localtime'] = organization_localtime
+    env.filters['image_variant'] = image_variant
+    return env
+
+
+def precompile_templates(env: Environment) -> int:
+    """
+    Compila todos os templates na inicialização, preenchendo o cache em
+    memória do Jinja e o cache de bytecode. Retorna quantos compilaram.
+    """
+    total = 0
+    for name in env.list_templates(extensions=['html']):
+        try:
+            env.get_template(name)
+            total += 1
+        except TemplateSyntaxError as e:
+            logger.warning(f'Template {name} não compilado: {e}')
+    return total
+
+
+templates = Jinja2Templates(env=create_environment())
@@ -10,3 +10,7 @@ from fast_rafa.modules.events.models import Event  # noqa
 from fast_rafa.modules.watchlists.models import Watchlist  # noqa
 from fast_rafa.modules.messages.models import Message  # noqa
 from fast_rafa.modules.messages_it.models import MessageItem  # noqa
+from fast_rafa.modules.feed.models import FeedEntry  # noqa
+from fast_rafa.modules.leaderboards.models import LeaderboardEntry  # noqa
+from fast_rafa.modules.maintenance.models import MaintenanceRun  # noqa
+from fast_rafa.modules.search import models as search_models  # noqa
@@ -0,0 +1,44 @@
+from http import HTTPStatus
+
+from fastapi import APIRouter, Depends, HTTPException
+
+from fast_rafa.core.database import engines
+from fast_rafa.core.logger import setup_logger
+from fast_rafa.core.pool import format_pool_status, get_pool_status
+from fast_rafa.core.security import get_current_active_user
+from fast_rafa.modules.users.models import User
+
+router = APIRouter()
+logger = setup_logger()
+
+
+async def get_current_manager(
+    current_user: User = Depends(get_current_active_user),
+) -> User:
+    if not current_user.eh_gerente:
+        raise HTTPException(
+            status_code=HTTPStatus.FORBIDDEN,
+            detail='Você não tem permissão para acessar este recurso',
+        )
+    return current_user
+
+
+@router.get('/pool', status_code=HTTPStatus.OK, response_model=dict)
+def read_pool_status(current_user: User = Depends(get_current_manager)):
+    """
+    Estado dos pools de conexão do primário e da réplica (em uso, ociosas,
+    overflow e tempo de espera), usado para dimensionar os workers contra
+    o max_connections do Postgres.
+    """
+    status = {}
+    reported = set()
+    for name, engine in engines.items():
+        # Sem réplica configurada, a leitura reaproveita o engine primário
+        if id(engine) in reported:
+            continue
+        reported.add(id(engine))
+
+        logger.info(f'Pool {name}: {format_pool_status(engine.pool)}')
+        status[name] = get_pool_status(engine.pool)
+
+    return status
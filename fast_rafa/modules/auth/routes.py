@@ -12,19 +12,20 @@ from fastapi import (
 )
 from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
 from fastapi.security import OAuth2PasswordRequestForm
-from fastapi.templating import Jinja2Templates
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 from zoneinfo import ZoneInfo
 
-from fast_rafa.core.database import get_session
+from fast_rafa.core.database import get_read_session, get_session
 from fast_rafa.core.logger import setup_logger
 from fast_rafa.core.security import (
     ACCESS_TOKEN_EXPIRE_MINUTES,
     create_access_token,
     get_user_from_cookie,
-    verify_password,
+    update_password_hash,
+    verify_and_update_password_async,
 )
+from fast_rafa.core.templates import templates
 from fast_rafa.modules.auth.schemas import Auth
 from fast_rafa.modules.organizations.models import Organization
 from fast_rafa.modules.users.models import User
@@ -33,9 +34,6 @@ router = APIRouter(prefix='/auth')
 logger = setup_logger()
 
 
-templates = Jinja2Templates(directory='fast_rafa/templates')
-
-
 class LoginForm:
     def __init__(self, request: Request):
         self.request = (
@@ -83,12 +81,16 @@ async def login_for_access_token(
             headers={'WWW-Authenticate': 'Bearer'},
         )
 
-    if not verify_password(form_data.password, user.senha_hash):
+    valid, new_hash = await verify_and_update_password_async(
+        form_data.password, user.senha_hash
+    )
+    if not valid:
         raise HTTPException(
             status_code=HTTPStatus.UNAUTHORIZED,  # Mudado para 401
             detail='Incorrect username or password',
             headers={'WWW-Authenticate': 'Bearer'},
         )
+    update_password_hash(db, user, new_hash)
 
     access_token = create_access_token(data_payload={'sub': user.username})
 
@@ -110,9 +112,15 @@ async def login(request: Request, db: Session = Depends(get_session)):
         await form.create_oauth_form()
 
         user = db.scalar(select(User).where(User.username == form.username))
-        if not user or not verify_password(form.password, user.senha_hash):
+        valid, new_hash = False, None
+        if user:
+            valid, new_hash = await verify_and_update_password_async(
+                form.password, user.senha_hash
+            )
+        if not valid:
             message = 'Usuário ou senha inválidos'
             return JSONResponse(content={'message': message}, status_code=401)
+        update_password_hash(db, user, new_hash)
 
         access_token = create_access_token(data_payload={'sub': user.username})
 
@@ -136,7 +144,10 @@ async def login(request: Request, db: Session = Depends(get_session)):
 
         return response
 
-    except HTTPException:
+    except HTTPException as e:
+        # Pool de hash saturado: repassa o 503 com Retry-After
+        if e.status_code == HTTPStatus.SERVICE_UNAVAILABLE:
+            raise
         message = 'Erro desconhecido'
         return JSONResponse(content={'message': message}, status_code=500)
 
@@ -144,7 +155,7 @@ async def login(request: Request, db: Session = Depends(get_session)):
 @router.get('/logout')
 async def logout(
     request: Request,
-    db: Session = Depends(get_session),
+    db: Session = Depends(get_read_session),
 ):
     try:
         # Tenta obter o usuário atual antes de fazer logout
@@ -181,7 +192,9 @@ async def logout(
 
 
 @router.get('/register', response_class=HTMLResponse)
-async def register_page(request: Request, db: Session = Depends(get_session)):
+async def register_page(
+    request: Request, db: Session = Depends(get_read_session)
+):
     organizations = db.query(Organization).all()
 
     if not organizations:
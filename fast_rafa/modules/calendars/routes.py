@@ -2,11 +2,11 @@ import re
 from http import HTTPStatus
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from fast_rafa.core.database import get_session
+from fast_rafa.core.database import get_read_session, get_session
 from fast_rafa.modules.calendars.models import Calendar
 from fast_rafa.modules.organizations.models import Organization
 from fast_rafa.utils.error_messages import (
@@ -18,6 +18,7 @@ from fast_rafa.utils.error_messages import (
     get_unexpected_error_message,
     get_update_error_message,
 )
+from fast_rafa.utils.pagination import NEXT_CURSOR_HEADER, CursorPage
 
 router = APIRouter()
 
@@ -72,22 +73,32 @@ def create_calendar(
 
 @router.get('/', response_model=List[Calendar], status_code=HTTPStatus.OK)
 def read_calendars(
-    skip: int = 0, limit: int = 10, db: Session = Depends(get_session)
+    response: Response,
+    page: CursorPage = Depends(),
+    db: Session = Depends(get_read_session),
 ):
-    calendarios = db.query(Calendar).offset(skip).limit(limit).all()
+    calendarios, next_cursor = page.split(
+        page.apply(db.query(Calendar), Calendar).all()
+    )
 
     if not calendarios:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND,
             detail=get_not_found_message('Calendário'),
         )
+
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
     return calendarios
 
 
 @router.get(
     '/{calendar_id}', response_model=Calendar, status_code=HTTPStatus.OK
 )
-def read_calendar_by_id(calendar_id: int, db: Session = Depends(get_session)):
+def read_calendar_by_id(
+    calendar_id: int, db: Session = Depends(get_read_session)
+):
     calendario = db.query(Calendar).filter(Calendar.id == calendar_id).first()
 
     if not calendario:
@@ -104,7 +115,7 @@ def read_calendar_by_id(calendar_id: int, db: Session = Depends(get_session)):
     status_code=HTTPStatus.OK,
 )
 def read_calendars_by_organization(
-    organization_id: int, db: Session = Depends(get_session)
+    organization_id: int, db: Session = Depends(get_read_session)
 ):
     calendarios = (
         db.query(Calendar)
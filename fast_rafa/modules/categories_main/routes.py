@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from fast_rafa.core.database import get_session
+from fast_rafa.core.database import get_read_session, get_session
 from fast_rafa.modules.categories_main.models import CategoryMain
 from fast_rafa.modules.categories_main.schemas import (
     CategoryMainCreate,
@@ -14,6 +14,7 @@ from fast_rafa.modules.categories_main.schemas import (
     CategoryMainUpdateRequest,
     CategoryMainUpdateResponse,
 )
+from fast_rafa.modules.categories_main.services import invalidate_categories
 from fast_rafa.utils.error_messages import (
     get_conflict_message,
     get_creation_error_message,
@@ -36,6 +37,7 @@ def create_category(
     try:
         db.add(nova_categoria)
         db.commit()
+        invalidate_categories()
         db.refresh(nova_categoria)
     except IntegrityError as e:
         db.rollback()
@@ -66,7 +68,7 @@ def create_category(
 
 @router.get('/', status_code=HTTPStatus.OK, response_model=list[CategoryMain])
 def read_categories(
-    skip: int = 0, limit: int = 10, db: Session = Depends(get_session)
+    skip: int = 0, limit: int = 10, db: Session = Depends(get_read_session)
 ):
     todas_categorias = db.query(CategoryMain).offset(skip).limit(limit).all()
 
@@ -80,7 +82,9 @@ def read_categories(
 
 
 @router.get('/{category_id}', status_code=HTTPStatus.OK)
-def read_category_by_id(category_id: int, db: Session = Depends(get_session)):
+def read_category_by_id(
+    category_id: int, db: Session = Depends(get_read_session)
+):
     categoria_db = (
         db.query(CategoryMain).filter(CategoryMain.id == category_id).first()
     )
@@ -100,7 +104,7 @@ def read_category_by_id(category_id: int, db: Session = Depends(get_session)):
     response_model=List[CategoryMain],
 )
 def read_category_by_name(
-    category_name: str, db: Session = Depends(get_session)
+    category_name: str, db: Session = Depends(get_read_session)
 ):
     categorias = (
         db.query(CategoryMain)
@@ -139,6 +143,7 @@ def update_category(
 
     try:
         db.commit()
+        invalidate_categories()
         db.refresh(categoria_atualizada)
     except IntegrityError as e:
         db.rollback()
@@ -187,6 +192,7 @@ def delete_category(category_id: int, db: Session = Depends(get_session)):
     try:
         db.delete(category)
         db.commit()
+        invalidate_categories()
     except IntegrityError as e:
         db.rollback()
         error_message = str(e.orig)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class CategoryMainCreate(BaseModel):
@@ -23,3 +23,14 @@ class CategoryMainUpdateResponse(BaseModel):
 
 class CategoryMainDeleteResponse(BaseModel):
     message: str
+
+
+class CategoryMainSummary(BaseModel):
+    """Categoria da lateral, guardada em cache."""
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    id: int
+    categoria: str
+    slug: str
+    icon: str | None = None
@@ -1,7 +1,32 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from fast_rafa.core.cache import TTLCache
+from fast_rafa.core.settings import settings
+from fast_rafa.core.templates import invalidate_fragments
 from fast_rafa.modules.categories_main.models import CategoryMain
+from fast_rafa.modules.categories_main.schemas import CategoryMainSummary
 
+categories_cache = TTLCache(settings.PAGE_CACHE_TTL)
 
-def get_categories(db: Session):
-    return db.query(CategoryMain).all()
+
+async def get_categories(db: AsyncSession):
+    # O cache guarda cópias imutáveis, e não as instâncias da sessão, pois a
+    # mesma lista é lida por várias requisições
+    async def load():
+        result = await db.execute(
+            select(
+                CategoryMain.id,
+                CategoryMain.categoria,
+                CategoryMain.slug,
+                CategoryMain.icon,
+            )
+        )
+        return [CategoryMainSummary.model_validate(row) for row in result]
+
+    return await categories_cache.get_or_load('all', load)
+
+
+def invalidate_categories():
+    categories_cache.invalidate()
+    invalidate_fragments()
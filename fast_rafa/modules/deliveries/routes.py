@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from fast_rafa.core.database import get_session
+from fast_rafa.core.database import get_read_session, get_session
 from fast_rafa.modules.deliveries.models import Delivery
 from fast_rafa.modules.organizations.models import Organization
 from fast_rafa.modules.users.models import User
@@ -84,7 +84,7 @@ def create_delivery(
 
 
 @router.get('/', status_code=HTTPStatus.OK, response_model=List[Delivery])
-def get_deliveries(db: Session = Depends(get_session)):
+def get_deliveries(db: Session = Depends(get_read_session)):
     deliveries = db.query(Delivery).all()
 
     if not deliveries:
@@ -1,7 +1,14 @@
 from datetime import datetime
 from typing import Dict, Optional
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from fast_rafa.modules.base.models import table_registry
@@ -42,6 +49,8 @@ class Event:
         UniqueConstraint(
             'id_organizacao', 'data', name='uix_organizacao_data'
         ),
+        Index('ix_events_slug', 'slug'),
+        Index('ix_events_fechado', 'fechado'),
     )
 
     organization = relationship('Organization', back_populates='events')
@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from fast_rafa.core.database import get_session
+from fast_rafa.core.database import get_read_session, get_session
 from fast_rafa.modules.events.models import Event
 from fast_rafa.modules.events.schemas import (
     EventCreate,
@@ -15,7 +15,10 @@ from fast_rafa.modules.events.schemas import (
     EventUpdateRequest,
     EventUpdateResponse,
 )
+from fast_rafa.modules.events.services import invalidate_suggested_events
+from fast_rafa.modules.leaderboards.services import refresh_event_scores
 from fast_rafa.modules.organizations.models import Organization
+from fast_rafa.modules.search.services import invalidate_autocomplete
 from fast_rafa.modules.users.models import User
 from fast_rafa.utils.error_messages import (
     get_conflict_message,
@@ -65,7 +68,12 @@ def create_event(evento: EventCreate, db: Session = Depends(get_session)):
     novo_evento = Event.create(EventCreate(**novo_evento_data))
     try:
         db.add(novo_evento)
+        # O ranking é gravado na mesma transação do evento
+        db.flush()
+        refresh_event_scores(db, [novo_evento.id])
         db.commit()
+        invalidate_suggested_events()
+        invalidate_autocomplete()
         db.refresh(novo_evento)
     except IntegrityError as e:
         db.rollback()
@@ -90,7 +98,7 @@ def create_event(evento: EventCreate, db: Session = Depends(get_session)):
 
 
 @router.get('/', status_code=HTTPStatus.OK, response_model=List[Event])
-def get_events(db: Session = Depends(get_session)):
+def get_events(db: Session = Depends(get_read_session)):
     eventos = db.query(Event).all()
 
     if not eventos:
@@ -121,7 +129,11 @@ def update_event(
 
     try:
         evento = Event.update(evento, event_data.dict(exclude_unset=True))
+        db.flush()
+        refresh_event_scores(db, [event_id])
         db.commit()
+        invalidate_suggested_events()
+        invalidate_autocomplete()
         db.refresh(evento)
     except IntegrityError as e:
         db.rollback()
@@ -168,7 +180,11 @@ def delete_event(event_id: int, db: Session = Depends(get_session)):
 
     try:
         db.delete(evento)
+        db.flush()
+        refresh_event_scores(db, [event_id])
         db.commit()
+        invalidate_suggested_events()
+        invalidate_autocomplete()
     except Exception as e:
         db.rollback()
         raise HTTPException(
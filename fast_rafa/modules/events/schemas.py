@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class EventCreate(BaseModel):
@@ -82,3 +82,15 @@ class EventResponse(BaseModel):
             criado_em=evento.criado_em,
             atualizado_em=evento.atualizado_em,
         )
+
+
+class EventSummary(BaseModel):
+    """Evento em destaque na lateral, guardado em cache."""
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    id: int
+    id_organizacao: int
+    titulo: str
+    slug: str
+    url_imagem: Optional[str] = None
@@ -1,42 +1,78 @@
-from sqlalchemy import func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
+from fast_rafa.core.cache import TTLCache
+from fast_rafa.core.settings import settings
+from fast_rafa.core.templates import invalidate_fragments
 from fast_rafa.modules.events.models import Event
-from fast_rafa.modules.organizations.models import Organization
-from fast_rafa.modules.users.models import User
-
-
-def get_suggested_events(db: Session, user_organization_id: int):
-    return (
-        db.query(Event, func.count(User.id).label('user_count'))
-        .join(Organization, Organization.id == Event.id_organizacao)
-        .join(User, User.id == Event.id_usuario)
-        .filter(
-            Event.fechado >= func.now(),
-            Event.id_organizacao != user_organization_id,
+from fast_rafa.modules.events.schemas import EventSummary
+from fast_rafa.modules.leaderboards.services import (
+    EVENTS,
+    leaderboard_query,
+)
+
+SUGGESTED_EVENTS = 3
+
+# Ranking compartilhado por todos os usuários, guardado como cópias
+# imutáveis (EventSummary, total). Os eventos da organização do usuário são
+# removidos na leitura, por isso a lista carregada é maior
+suggested_events_cache = TTLCache(settings.PAGE_CACHE_TTL)
+
+
+async def get_suggested_events(db: AsyncSession, user_organization_id: int):
+    ranking = await suggested_events_cache.get_or_load(
+        EVENTS, lambda: load_suggested_events(db)
+    )
+    return [
+        (event, user_count)
+        for event, user_count in ranking
+        if event.id_organizacao != user_organization_id
+    ][:SUGGESTED_EVENTS]
+
+
+def invalidate_suggested_events():
+    suggested_events_cache.invalidate()
+    invalidate_fragments()
+
+
+async def load_suggested_events(db: AsyncSession):
+    result = await db.execute(
+        leaderboard_query(
+            Event,
+            EVENTS,
+            SUGGESTED_EVENTS * 2,
+            Event.id,
+            Event.id_organizacao,
+            Event.titulo,
+            Event.slug,
+            Event.url_imagem,
         )
-        .group_by(Event.id)
-        .order_by(func.count(User.id).desc())
-        .options(joinedload(Event.organization), joinedload(Event.manager))
-        .limit(3)
-        .all()
+        # Eventos encerrados desde a última atualização do ranking
+        .where(Event.fechado >= func.now())
     )
+    return [
+        (EventSummary.model_validate(row), row.pontuacao) for row in result
+    ]
 
 
-def get_events(
-    db: Session,
+async def get_events(
+    db: AsyncSession,
     event_slug: str = None,
     user_organization_id: int = None,
     user_eh_gerente: bool = None,
 ):
-    query = db.query(Event)
+    # O template acessa event.organization, que precisa estar carregado
+    # antes da renderização, pois a sessão assíncrona não faz lazy load
+    query = select(Event).options(joinedload(Event.organization))
     gerente = False
     if user_eh_gerente is not None:
         gerente = user_eh_gerente
 
     if event_slug:
-        query = query.filter(Event.slug == event_slug)
-        events = query.first()
+        query = query.where(Event.slug == event_slug)
+        result = await db.scalars(query)
+        events = result.unique().first()
 
         if events:
             events.pode_editar = (
@@ -47,7 +83,8 @@ def get_events(
             return []
 
     else:
-        events = query.all()
+        result = await db.scalars(query)
+        events = result.unique().all()
 
         result = []
         for event in events:
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Dict, Optional
 
 from pydantic import BaseModel
-from sqlalchemy import DateTime, ForeignKey, Integer
+from sqlalchemy import DateTime, ForeignKey, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from fast_rafa.modules.base.models import table_registry
@@ -25,6 +25,16 @@ class Favorite:
         DateTime, default=datetime.utcnow()
     )
 
+    __table_args__ = (
+        Index(
+            'uix_favorites_usuario_postagem',
+            'id_usuario',
+            'id_postagem',
+            unique=True,
+        ),
+        Index('ix_favorites_id_postagem', 'id_postagem'),
+    )
+
     def __init__(
         self,
         id_postagem: int,
@@ -1,12 +1,24 @@
 import re
 from http import HTTPStatus
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from fast_rafa.core.database import get_session
+from fast_rafa.core.database import get_read_session, get_session
 from fast_rafa.modules.favorites.models import Favorite
+from fast_rafa.modules.favorites.schemas import (
+    MAX_BATCH_SIZE,
+    FavoriteBatchRequest,
+    FavoriteBatchResponse,
+    FavoriteStatusResponse,
+)
+from fast_rafa.modules.favorites.services import (
+    apply_favorite_operations,
+    favorited_post_ids,
+)
+from fast_rafa.modules.feed.services import update_feed_likes
 from fast_rafa.modules.posts.models import Post
 from fast_rafa.modules.users.models import User
 from fast_rafa.utils.error_messages import (
@@ -17,10 +29,54 @@ from fast_rafa.utils.error_messages import (
     get_success_message,
     get_unexpected_error_message,
 )
+from fast_rafa.utils.pagination import NEXT_CURSOR_HEADER, CursorPage
 
 router = APIRouter()
 
 
+# Rotas com segmento fixo antes de /{id_usuario}/{id_postagem}
+@router.post(
+    '/{id_usuario}/batch',
+    status_code=HTTPStatus.OK,
+    response_model=FavoriteBatchResponse,
+)
+def toggle_favorites(
+    id_usuario: int,
+    data: FavoriteBatchRequest,
+    db: Session = Depends(get_session),
+):
+    try:
+        total_likes, favoritos = apply_favorite_operations(
+            db, id_usuario, data.operacoes
+        )
+        update_feed_likes(db, total_likes)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            detail=get_unexpected_error_message('atualizar favoritos', str(e)),
+        )
+
+    return FavoriteBatchResponse(
+        total_likes=total_likes, favoritos=sorted(favoritos)
+    )
+
+
+@router.get(
+    '/{id_usuario}/status',
+    status_code=HTTPStatus.OK,
+    response_model=FavoriteStatusResponse,
+)
+def read_favorites_status(
+    id_usuario: int,
+    ids: list[int] = Query(max_length=MAX_BATCH_SIZE),
+    db: Session = Depends(get_read_session),
+):
+    favoritos = favorited_post_ids(db, id_usuario, ids)
+    return FavoriteStatusResponse(favoritos=sorted(favoritos))
+
+
 @router.post(
     '/{id_usuario}/{id_postagem}',
     status_code=HTTPStatus.CREATED,
@@ -57,16 +113,17 @@ def create_favorite(
     novo_favorito = Favorite(id_usuario=id_usuario, id_postagem=id_postagem)
     try:
         db.add(novo_favorito)
+        # Incrementa o contador na mesma transação do favorito
+        total_likes = db.scalar(
+            update(Post)
+            .where(Post.id == id_postagem)
+            .values(total_likes=Post.total_likes + 1)
+            .returning(Post.total_likes)
+        )
+        update_feed_likes(db, {id_postagem: total_likes})
         db.commit()
         db.refresh(novo_favorito)
 
-        # Conta o número total de likes para esta postagem
-        total_likes = (
-            db.query(Favorite)
-            .filter(Favorite.id_postagem == id_postagem)
-            .count()
-        )
-
         return {'favorite': novo_favorito, 'total_likes': total_likes}
 
     except IntegrityError as e:
@@ -95,7 +152,9 @@ def create_favorite(
 
 
 @router.get('/{id_favorite}', status_code=HTTPStatus.OK)
-def read_favorite_by_id(id_favorite: int, db: Session = Depends(get_session)):
+def read_favorite_by_id(
+    id_favorite: int, db: Session = Depends(get_read_session)
+):
     favorito = db.query(Favorite).filter(Favorite.id == id_favorite).first()
     if not favorito:
         raise HTTPException(
@@ -113,9 +172,9 @@ def read_favorite_by_id(id_favorite: int, db: Session = Depends(get_session)):
 )
 def read_favorites_by_user(
     id_usuario: int,
-    skip: int = 0,
-    limit: int = 10,
-    db: Session = Depends(get_session),
+    response: Response,
+    page: CursorPage = Depends(),
+    db: Session = Depends(get_read_session),
 ):
     usuario = db.query(User).filter(User.id == id_usuario).first()
     if not usuario:
@@ -124,25 +183,23 @@ def read_favorites_by_user(
             detail=get_not_found_message('Usuário'),
         )
 
-    favoritos = (
-        db.query(Favorite)
-        .filter(Favorite.id_usuario == id_usuario)
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    query = db.query(Favorite).filter(Favorite.id_usuario == id_usuario)
+    favoritos, next_cursor = page.split(page.apply(query, Favorite).all())
     if not favoritos:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND,
             detail=get_not_found_message('Favorito'),
         )
 
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
     return favoritos
 
 
 @router.get('/post/{id_postagem}', status_code=HTTPStatus.OK)
 def read_favorites_by_post(
-    id_postagem: int, db: Session = Depends(get_session)
+    id_postagem: int, db: Session = Depends(get_read_session)
 ):
     postagem = db.query(Post).filter(Post.id == id_postagem).first()
     if not postagem:
@@ -179,18 +236,20 @@ def delete_favorite(id_favorite: int, db: Session = Depends(get_session)):
     try:
         id_postagem = favorito.id_postagem
         db.delete(favorito)
-        db.commit()
-
-        # Conta o número total de likes após a remoção
-        total_likes = (
-            db.query(Favorite)
-            .filter(Favorite.id_postagem == id_postagem)
-            .count()
+        # Decrementa o contador na mesma transação da remoção
+        total_likes = db.scalar(
+            update(Post)
+            .where(Post.id == id_postagem, Post.total_likes > 0)
+            .values(total_likes=Post.total_likes - 1)
+            .returning(Post.total_likes)
         )
+        if total_likes is not None:
+            update_feed_likes(db, {id_postagem: total_likes})
+        db.commit()
 
         return {
             'message': get_success_message('Favorito excluído'),
-            'total_likes': total_likes,
+            'total_likes': total_likes or 0,
         }
     except IntegrityError as e:
         db.rollback()
@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field
+
+# Limite de operações/ids por requisição nas rotas em lote
+MAX_BATCH_SIZE = 100
+
+
+class FavoriteOperation(BaseModel):
+    id_postagem: int
+    curtido: bool
+
+
+class FavoriteBatchRequest(BaseModel):
+    operacoes: list[FavoriteOperation] = Field(
+        min_length=1, max_length=MAX_BATCH_SIZE
+    )
+
+
+class FavoriteBatchResponse(BaseModel):
+    # Contador atualizado de cada post enviado
+    total_likes: dict[int, int]
+    # Posts do lote que ficaram curtidos pelo usuário
+    favoritos: list[int]
+
+
+class FavoriteStatusResponse(BaseModel):
+    favoritos: list[int]
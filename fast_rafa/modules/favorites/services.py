@@ -0,0 +1,114 @@
+from datetime import datetime
+
+from sqlalchemy import and_, case, delete, literal, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from fast_rafa.modules.favorites.models import Favorite
+from fast_rafa.modules.posts.models import Post
+from fast_rafa.modules.users.models import User
+
+
+def favorited_posts_query(user_id: int, post_ids):
+    """
+    Quais dos posts informados o usuário curtiu. Uma consulta só, coberta
+    pelo índice único (id_usuario, id_postagem).
+    """
+    return select(Favorite.id_postagem).where(
+        Favorite.id_usuario == user_id,
+        Favorite.id_postagem.in_(list(post_ids)),
+    )
+
+
+def favorited_post_ids(db: Session, user_id: int, post_ids) -> set:
+    post_ids = list(post_ids)
+    if not post_ids:
+        return set()
+    return set(db.scalars(favorited_posts_query(user_id, post_ids)))
+
+
+def insert_favorites_query(dialect_name: str, user_id: int, post_ids: list):
+    """
+    INSERT ... SELECT ... ON CONFLICT DO NOTHING: o SELECT só devolve
+    usuário e posts existentes, e curtidas repetidas são ignoradas pelo
+    índice único. Retorna os posts realmente inseridos.
+    """
+    insert = (
+        postgresql_insert if dialect_name == 'postgresql' else sqlite_insert
+    )
+    rows = select(
+        literal(user_id),
+        Post.id,
+        literal(datetime.utcnow(), Favorite.criado_em.type),
+    ).where(
+        Post.id.in_(post_ids),
+        select(User.id).where(User.id == user_id).exists(),
+    )
+
+    return (
+        insert(Favorite)
+        .from_select(['id_usuario', 'id_postagem', 'criado_em'], rows)
+        .on_conflict_do_nothing(index_elements=['id_usuario', 'id_postagem'])
+        .returning(Favorite.id_postagem)
+    )
+
+
+def apply_favorite_operations(
+    db: Session, user_id: int, operations: list
+) -> tuple[dict, set]:
+    """
+    Aplica um lote de curtidas/descurtidas do usuário: um INSERT para as
+    curtidas, um DELETE para as descurtidas e um UPDATE com CASE nos
+    contadores. Quando o mesmo post aparece mais de uma vez, vale a última
+    operação. Retorna os contadores e os posts curtidos; o commit fica com
+    quem chama, junto com a pontuação do feed.
+    """
+    desired = {}
+    for operation in operations:
+        desired[operation.id_postagem] = operation.curtido
+    liked = [post_id for post_id, curtido in desired.items() if curtido]
+    unliked = [post_id for post_id, curtido in desired.items() if not curtido]
+
+    changes = {}
+    if liked:
+        inserted = db.scalars(
+            insert_favorites_query(db.get_bind().dialect.name, user_id, liked)
+        )
+        changes.update(dict.fromkeys(inserted, 1))
+    if unliked:
+        deleted = db.scalars(
+            delete(Favorite)
+            .where(
+                Favorite.id_usuario == user_id,
+                Favorite.id_postagem.in_(unliked),
+            )
+            .returning(Favorite.id_postagem)
+        )
+        changes.update(dict.fromkeys(deleted, -1))
+
+    if changes:
+        db.execute(
+            update(Post)
+            .where(Post.id.in_(list(changes)))
+            .values(
+                total_likes=Post.total_likes + case(changes, value=Post.id)
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    # Contadores e estado final lidos juntos, com o favorito em LEFT JOIN
+    rows = db.execute(
+        select(Post.id, Post.total_likes, Favorite.id.is_not(None))
+        .outerjoin(
+            Favorite,
+            and_(
+                Favorite.id_postagem == Post.id,
+                Favorite.id_usuario == user_id,
+            ),
+        )
+        .where(Post.id.in_(list(desired)))
+    ).all()
+    total_likes = {post_id: total for post_id, total, _ in rows}
+    favoritos = {post_id for post_id, _, curtido in rows if curtido}
+    return total_likes, favoritos
@@ -0,0 +1,17 @@
+from fast_rafa.core.database_seed import get_session
+from fast_rafa.modules.feed.services import refresh_feed_entries
+
+
+def run_task_refresh_feed():
+    """
+    Reconstrói o feed da home a partir dos posts, tirando os que venceram.
+    Rode uma vez após a migração e depois periodicamente (ex.: cron diário).
+    Uso: task refresh_feed
+    """
+    session = next(get_session())
+    try:
+        total = refresh_feed_entries(session)
+        session.commit()
+        print(f'Feed reconstruído com {total} post(s).')
+    finally:
+        session.close()
@@ -0,0 +1,39 @@
+from datetime import date
+
+from sqlalchemy import Boolean, Date, Float, ForeignKey, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from fast_rafa.modules.base.models import table_registry
+
+
+@table_registry.mapped_as_dataclass
+class FeedEntry:
+    """
+    Feed da home pré-calculado: uma linha por post visível, com o público
+    (organizações governamentais ou não) e a pontuação do ranking. Mantido
+    na escrita (criação, edição e likes dos posts) pelo feed.services.
+    """
+
+    __tablename__ = 'feed_entries'
+
+    id_postagem: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey('posts.id', ondelete='CASCADE'),
+        primary_key=True,
+    )
+    # Público do post: o nao_governamental da organização que publicou
+    nao_governamental: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    id_organizacao: Mapped[int] = mapped_column(Integer, nullable=False)
+    data_validade: Mapped[date] = mapped_column(Date, nullable=False)
+    # Recência e validade; os likes são somados em pontuacao
+    pontuacao_base: Mapped[float] = mapped_column(Float, nullable=False)
+    pontuacao: Mapped[float] = mapped_column(Float, nullable=False)
+
+    __table_args__ = (
+        Index(
+            'ix_feed_entries_publico_pontuacao',
+            'nao_governamental',
+            'pontuacao',
+            'id_postagem',
+        ),
+    )
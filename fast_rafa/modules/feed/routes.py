@@ -0,0 +1,36 @@
+from http import HTTPStatus
+
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.orm import Session
+
+from fast_rafa.core.database import get_read_session
+from fast_rafa.core.security import get_current_user
+from fast_rafa.modules.feed.services import get_feed
+from fast_rafa.modules.organizations.models import Organization
+from fast_rafa.modules.posts.schemas import PostResponse, post_list_serializer
+from fast_rafa.utils.pagination import NEXT_CURSOR_HEADER, CursorPage
+
+router = APIRouter()
+
+
+@router.get('/', status_code=HTTPStatus.OK, response_model=list[PostResponse])
+def read_feed(
+    request: Request,
+    page: CursorPage = Depends(),
+    db: Session = Depends(get_read_session),
+    current_user=Depends(get_current_user),
+):
+    """
+    Feed da home do usuário, do mais relevante para o menos relevante.
+    A próxima página vem no cabeçalho X-Next-Cursor.
+    """
+    organizacao = db.get(Organization, current_user.id_organizacao)
+    if not organizacao:
+        return post_list_serializer.response([])
+
+    language = request.headers.get('Accept-Language', 'pt').split(',')[0]
+    posts, next_cursor = get_feed(
+        db, current_user.id, organizacao, page, language
+    )
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return post_list_serializer.response(posts, headers)
@@ -0,0 +1,233 @@
+import math
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import (
+    bindparam,
+    delete,
+    exists,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
+
+from fast_rafa.modules.favorites.models import Favorite
+from fast_rafa.modules.feed.models import FeedEntry
+from fast_rafa.modules.organizations.models import Organization
+from fast_rafa.modules.posts.models import Post
+from fast_rafa.modules.posts.services import set_created_at_labels
+from fast_rafa.utils.pagination import CursorPage, decode_cursor, encode_cursor
+
+ACTIVE_STATUS = 1
+EPOCH = datetime(1970, 1, 1)
+
+# Pesos do ranking, em horas de recência: cada dia a menos até a validade
+# vale 12 horas, e cada vez que os likes dobram, mais 12 horas
+EXPIRY_WEIGHT = 0.5
+LIKES_WEIGHT = 12.0
+# Validades além deste prazo (contado da criação) não pesam mais
+EXPIRY_HORIZON = timedelta(days=30)
+
+
+def hours_since_epoch(value) -> float:
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time())
+    return (value - EPOCH).total_seconds() / 3600
+
+
+def base_score(criado_em: datetime, data_validade) -> float:
+    """
+    Pontuação ancorada no tempo: posts mais novos e com validade mais
+    próxima valem mais. Como a ordem entre dois posts não muda com o passar
+    das horas, o feed só é recalculado quando o post muda.
+    """
+    validade = min(
+        hours_since_epoch(data_validade),
+        hours_since_epoch(criado_em + EXPIRY_HORIZON),
+    )
+    return hours_since_epoch(criado_em) - EXPIRY_WEIGHT * validade
+
+
+def likes_score(total_likes: int) -> float:
+    return LIKES_WEIGHT * math.log2(1 + max(total_likes, 0))
+
+
+def upsert_feed_entries_query(dialect_name: str):
+    """
+    INSERT ... ON CONFLICT DO UPDATE pela chave id_postagem: quem recalcula
+    o mesmo post ao mesmo tempo sobrescreve a linha em vez de falhar.
+    """
+    insert = (
+        postgresql_insert if dialect_name == 'postgresql' else sqlite_insert
+    )
+    query = insert(FeedEntry)
+    return query.on_conflict_do_update(
+        index_elements=['id_postagem'],
+        set_={
+            column: query.excluded[column]
+            for column in (
+                'nao_governamental',
+                'id_organizacao',
+                'data_validade',
+                'pontuacao_base',
+                'pontuacao',
+            )
+        },
+    )
+
+
+def refresh_feed_entries(db: Session, *criteria) -> int:
+    """
+    Recalcula as linhas do feed dos posts que atendem aos critérios (todos,
+    se nenhum for passado): grava as dos posts ativos e dentro da validade
+    e remove as dos demais. Retorna quantas linhas foram gravadas; o commit
+    fica com quem chama, junto com a alteração dos posts.
+    """
+    visible = (
+        Post.status == ACTIVE_STATUS,
+        Post.data_validade >= date.today(),
+        *criteria,
+    )
+    rows = db.execute(
+        select(
+            Post.id,
+            Post.id_organizacao,
+            Post.criado_em,
+            Post.data_validade,
+            Post.total_likes,
+            Organization.nao_governamental,
+        )
+        .join(Organization, Organization.id == Post.id_organizacao)
+        .where(*visible)
+    ).all()
+
+    db.execute(
+        delete(FeedEntry).where(
+            FeedEntry.id_postagem.in_(select(Post.id).where(*criteria)),
+            FeedEntry.id_postagem.not_in(select(Post.id).where(*visible)),
+        )
+    )
+    entries = []
+    for row in rows:
+        pontuacao_base = base_score(row.criado_em, row.data_validade)
+        entries.append({
+            'id_postagem': row.id,
+            'nao_governamental': row.nao_governamental,
+            'id_organizacao': row.id_organizacao,
+            'data_validade': row.data_validade,
+            'pontuacao_base': pontuacao_base,
+            'pontuacao': pontuacao_base + likes_score(row.total_likes),
+        })
+    if entries:
+        db.execute(
+            upsert_feed_entries_query(db.get_bind().dialect.name), entries
+        )
+    return len(entries)
+
+
+def remove_feed_entry(db: Session, post_id: int):
+    """Tira o post do feed; o commit fica com quem chama."""
+    db.execute(delete(FeedEntry).where(FeedEntry.id_postagem == post_id))
+
+
+def update_feed_likes(db: Session, total_likes: dict):
+    """
+    Atualiza a pontuação dos posts cujos likes mudaram, a partir do total
+    já calculado ({id_postagem: total}), em um único executemany. Posts
+    fora do feed são ignorados; o commit fica com quem chama.
+    """
+    if not total_likes:
+        return
+    table = FeedEntry.__table__
+    db.execute(
+        update(table)
+        .where(table.c.id_postagem == bindparam('b_id_postagem'))
+        .values(pontuacao=table.c.pontuacao_base + bindparam('b_likes')),
+        [
+            {'b_id_postagem': post_id, 'b_likes': likes_score(total or 0)}
+            for post_id, total in total_likes.items()
+        ],
+    )
+
+
+def feed_query(user_id: int, organization: Organization, page: CursorPage):
+    """
+    Uma página do feed do público da organização do usuário, sem os posts
+    dela, percorrendo o índice (nao_governamental, pontuacao).
+    Traz junto se o usuário curtiu cada post.
+    """
+    eh_favorito = (
+        exists()
+        .where(
+            Favorite.id_usuario == user_id,
+            Favorite.id_postagem == FeedEntry.id_postagem,
+        )
+        .label('eh_favorito')
+    )
+    query = (
+        select(Post, FeedEntry.pontuacao, eh_favorito)
+        .join(FeedEntry, FeedEntry.id_postagem == Post.id)
+        .where(
+            FeedEntry.nao_governamental == organization.nao_governamental,
+            FeedEntry.id_organizacao != organization.id,
+            FeedEntry.data_validade >= date.today(),
+        )
+        .options(
+            joinedload(Post.organizations),
+            joinedload(Post.categories),
+            joinedload(Post.uploader),
+        )
+    )
+
+    if page.cursor:
+        pontuacao, post_id = decode_cursor(page.cursor, FeedEntry.pontuacao)
+        query = query.where(
+            tuple_(FeedEntry.pontuacao, FeedEntry.id_postagem)
+            < tuple_(pontuacao, post_id)
+        )
+    elif page.skip:
+        query = query.offset(page.skip)
+
+    return query.order_by(
+        FeedEntry.pontuacao.desc(), FeedEntry.id_postagem.desc()
+    ).limit(page.limit + 1)
+
+
+def feed_page(rows: list, page: CursorPage, language: str) -> tuple:
+    """Retorna (posts da página, próximo cursor ou None)."""
+    next_cursor = None
+    if len(rows) > page.limit:
+        rows = rows[: page.limit]
+        next_cursor = encode_cursor(rows[-1].pontuacao, rows[-1].Post.id)
+
+    posts = []
+    for row in rows:
+        row.Post.eh_favorito = int(row.eh_favorito)
+        posts.append(row.Post)
+    set_created_at_labels(posts, language)
+    return posts, next_cursor
+
+
+def get_feed(
+    db: Session,
+    user_id: int,
+    organization: Organization,
+    page: CursorPage,
+    language: str = 'pt-BR',
+) -> tuple:
+    rows = db.execute(feed_query(user_id, organization, page)).unique().all()
+    return feed_page(rows, page, language)
+
+
+async def get_feed_async(
+    db: AsyncSession,
+    user_id: int,
+    organization: Organization,
+    page: CursorPage,
+    language: str = 'pt-BR',
+) -> tuple:
+    result = await db.execute(feed_query(user_id, organization, page))
+    return feed_page(result.unique().all(), page, language)
@@ -0,0 +1,25 @@
+from fast_rafa.core.database_seed import get_session
+from fast_rafa.modules.leaderboards.services import (
+    refresh_event_scores,
+    refresh_organization_scores,
+)
+
+
+def run_task_refresh_leaderboards():
+    """
+    Recalcula os rankings das sugestões de organizações e eventos, tirando
+    posts vencidos e eventos encerrados. Rode uma vez após a migração e
+    depois periodicamente (ex.: cron a cada hora).
+    Uso: task refresh_leaderboards
+    """
+    session = next(get_session())
+    try:
+        organizacoes = refresh_organization_scores(session)
+        eventos = refresh_event_scores(session)
+        session.commit()
+        print(
+            f'Rankings recalculados: {organizacoes} organização(ões) e '
+            f'{eventos} evento(s).'
+        )
+    finally:
+        session.close()
@@ -0,0 +1,26 @@
+from sqlalchemy import Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from fast_rafa.modules.base.models import table_registry
+
+
+@table_registry.mapped_as_dataclass
+class LeaderboardEntry:
+    """
+    Rankings das sugestões da lateral, materializados: a contagem de posts
+    ativos por organização e de participantes por evento. Mantidos na
+    escrita pelo leaderboards.services, sem GROUP BY a cada página.
+    """
+
+    __tablename__ = 'leaderboard_entries'
+
+    # 'organizacoes' ou 'eventos'
+    tipo: Mapped[str] = mapped_column(String(20), primary_key=True)
+    id_referencia: Mapped[int] = mapped_column(Integer, primary_key=True)
+    # Organização dona do item, removida na leitura para o próprio usuário
+    id_organizacao: Mapped[int] = mapped_column(Integer, nullable=False)
+    pontuacao: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index('ix_leaderboard_entries_tipo_pontuacao', 'tipo', 'pontuacao'),
+    )
@@ -0,0 +1,136 @@
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import and_, delete, func, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from fast_rafa.modules.events.models import Event
+from fast_rafa.modules.leaderboards.models import LeaderboardEntry
+from fast_rafa.modules.posts.models import Post
+from fast_rafa.modules.users.models import User
+
+ORGANIZATIONS = 'organizacoes'
+EVENTS = 'eventos'
+ACTIVE_STATUS = 1
+
+
+def upsert_entries_query(dialect_name: str):
+    """
+    INSERT ... ON CONFLICT DO UPDATE pela chave (tipo, id_referencia):
+    quem recalcula o mesmo item ao mesmo tempo sobrescreve a linha em vez
+    de falhar.
+    """
+    insert = (
+        postgresql_insert if dialect_name == 'postgresql' else sqlite_insert
+    )
+    query = insert(LeaderboardEntry)
+    return query.on_conflict_do_update(
+        index_elements=['tipo', 'id_referencia'],
+        set_={
+            'id_organizacao': query.excluded.id_organizacao,
+            'pontuacao': query.excluded.pontuacao,
+        },
+    )
+
+
+def replace_entries(db: Session, tipo: str, rows, *scope) -> int:
+    """
+    Grava as linhas recém-calculadas (id, organização, total) e remove as
+    demais do escopo informado (todas do tipo, se nenhum for passado).
+    O commit fica com quem chama, junto com a alteração que as originou.
+    """
+    db.execute(
+        delete(LeaderboardEntry).where(
+            LeaderboardEntry.tipo == tipo,
+            LeaderboardEntry.id_referencia.not_in([row[0] for row in rows]),
+            *scope,
+        )
+    )
+    if rows:
+        db.execute(
+            upsert_entries_query(db.get_bind().dialect.name),
+            [
+                {
+                    'tipo': tipo,
+                    'id_referencia': id_referencia,
+                    'id_organizacao': id_organizacao,
+                    'pontuacao': pontuacao,
+                }
+                for id_referencia, id_organizacao, pontuacao in rows
+            ],
+        )
+    return len(rows)
+
+
+def refresh_organization_scores(
+    db: Session, organization_ids: Optional[list] = None
+) -> int:
+    """
+    Recalcula os posts ativos e dentro da validade das organizações
+    informadas, ou de todas quando organization_ids é None.
+    """
+    query = (
+        select(Post.id_organizacao, Post.id_organizacao, func.count(Post.id))
+        .where(
+            Post.status == ACTIVE_STATUS,
+            Post.data_validade >= date.today(),
+            Post.quantidade != '',  # noqa: PLC1901
+        )
+        .group_by(Post.id_organizacao)
+    )
+    scope = ()
+    if organization_ids is not None:
+        query = query.where(Post.id_organizacao.in_(organization_ids))
+        scope = (LeaderboardEntry.id_referencia.in_(organization_ids),)
+    return replace_entries(db, ORGANIZATIONS, db.execute(query).all(), *scope)
+
+
+def refresh_event_scores(db: Session, event_ids: Optional[list] = None) -> int:
+    """
+    Recalcula os participantes dos eventos ainda abertos informados, ou de
+    todos quando event_ids é None.
+    """
+    query = (
+        select(Event.id, Event.id_organizacao, func.count(User.id))
+        .join(User, User.id == Event.id_usuario)
+        .where(Event.fechado >= func.now())
+        .group_by(Event.id, Event.id_organizacao)
+    )
+    scope = ()
+    if event_ids is not None:
+        query = query.where(Event.id.in_(event_ids))
+        scope = (LeaderboardEntry.id_referencia.in_(event_ids),)
+    return replace_entries(db, EVENTS, db.execute(query).all(), *scope)
+
+
+def remove_organization_entries(db: Session, organization_id: int):
+    """
+    Tira dos rankings a organização excluída e os eventos dela; o commit
+    fica com quem chama.
+    """
+    db.execute(
+        delete(LeaderboardEntry).where(
+            LeaderboardEntry.id_organizacao == organization_id
+        )
+    )
+
+
+def leaderboard_query(model, tipo: str, limit: int, *columns):
+    """
+    Os itens do ranking do tipo, do maior para o menor total. Com columns,
+    carrega só essas colunas do modelo em vez da entidade inteira.
+    """
+    return (
+        select(*(columns or (model,)), LeaderboardEntry.pontuacao)
+        .join(
+            LeaderboardEntry,
+            and_(
+                LeaderboardEntry.tipo == tipo,
+                LeaderboardEntry.id_referencia == model.id,
+            ),
+        )
+        .order_by(LeaderboardEntry.pontuacao.desc(), model.id)
+        .limit(limit)
+    )
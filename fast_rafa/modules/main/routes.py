@@ -1,31 +1,37 @@
-from fastapi import APIRouter, Depends, Request, status
+from fastapi import APIRouter, Depends, Query, Request, status
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.responses import RedirectResponse
 from datetime import datetime
-from fast_rafa.core.database import Session, get_session
+from fast_rafa.core.database import get_async_read_session
 from fast_rafa.core.logger import setup_logger
 from fast_rafa.core.security import (
     get_user_and_access_token_from_cookie,
 )
+from fast_rafa.core.templates import templates
 from fast_rafa.modules.categories_main.services import get_categories
 from fast_rafa.modules.events.services import get_suggested_events, get_events
 from fast_rafa.modules.organizations.services import (
     get_list_organizations,
     get_organizations,
+    get_organizations_page,
     get_suggested_organizations,
 )
+from fast_rafa.modules.feed.services import get_feed_async
 from fast_rafa.modules.posts.services import (
     get_posts_by_category_main,
     get_posts_by_id,
-    get_posts_by_organization,
     get_posts_by_user,
+    set_posts_extras,
 )
+from fast_rafa.modules.search.services import search_posts_async
 from fast_rafa.utils.funcs import iniciais
+from fast_rafa.utils.pagination import CursorPage
 
-templates = Jinja2Templates(directory='fast_rafa/templates')
 logger = setup_logger()
 
+HOME_FEED_SIZE = 5
+
 router = APIRouter()
 
 
@@ -35,7 +41,9 @@ async def index(request: Request):
 
 
 @router.get('/home')
-async def home(request: Request, db: Session = Depends(get_session)):
+async def home(
+    request: Request, db: AsyncSession = Depends(get_async_read_session)
+):
     try:
         (
             user,
@@ -78,7 +86,9 @@ async def home(request: Request, db: Session = Depends(get_session)):
 
 
 @router.get('/profile')
-async def profile(request: Request, db: Session = Depends(get_session)):
+async def profile(
+    request: Request, db: AsyncSession = Depends(get_async_read_session)
+):
     try:
         (
             user,
@@ -102,6 +112,9 @@ async def profile(request: Request, db: Session = Depends(get_session)):
                 url='/auth/login', status_code=status.HTTP_302_FOUND
             )
 
+        # Contadores exibidos no perfil (sem lazy load na sessão assíncrona)
+        await db.refresh(user, ['posts', 'favorites', 'delivery'])
+
     except Exception as e:
         logger.error(f'Erro ao obter usuário: {e}')
         return RedirectResponse(url='/auth/login')
@@ -121,7 +134,9 @@ async def profile(request: Request, db: Session = Depends(get_session)):
 
 
 @router.get('/edit-profile', response_class=HTMLResponse)
-async def edit_profile(request: Request, db: Session = Depends(get_session)):
+async def edit_profile(
+    request: Request, db: AsyncSession = Depends(get_async_read_session)
+):
     try:
         (
             user,
@@ -138,7 +153,7 @@ async def edit_profile(request: Request, db: Session = Depends(get_session)):
             return RedirectResponse(
                 url='/auth/login', status_code=status.HTTP_302_FOUND
             )
-        organizations_data = get_list_organizations(db)
+        organizations_data = await get_list_organizations(db)
     except Exception as e:
         # Caso ocorra algum erro, registra o erro e redireciona para o perfil
         logger.error(f'Erro ao carregar a página de edição de perfil: {e}')
@@ -160,7 +175,9 @@ async def edit_profile(request: Request, db: Session = Depends(get_session)):
 
 
 @router.get('/posts')
-async def user_posts(request: Request, db: Session = Depends(get_session)):
+async def user_posts(
+    request: Request, db: AsyncSession = Depends(get_async_read_session)
+):
     language = request.headers.get('Accept-Language', 'pt').split(',')[0]
 
     try:
@@ -181,7 +198,7 @@ async def user_posts(request: Request, db: Session = Depends(get_session)):
                 url='/auth/login', status_code=status.HTTP_302_FOUND
             )
         user_id = user.id
-        posts = get_posts_by_user(db, user_id, language)
+        posts = await get_posts_by_user(db, user_id, language)
         if not posts:
             posts = []
 
@@ -205,7 +222,9 @@ async def user_posts(request: Request, db: Session = Depends(get_session)):
 
 @router.get('/posts/{post_id}', response_class=HTMLResponse)
 async def post_detail(
-    request: Request, post_id: int, db: Session = Depends(get_session)
+    request: Request,
+    post_id: int,
+    db: AsyncSession = Depends(get_async_read_session),
 ):
     language = request.headers.get('Accept-Language', 'pt').split(',')[0]
 
@@ -226,7 +245,7 @@ async def post_detail(
                 url='/auth/login', status_code=status.HTTP_302_FOUND
             )
 
-        post = get_posts_by_id(db, post_id, user.id, language)
+        post = await get_posts_by_id(db, post_id, user.id, language)
 
         if not post:
             return RedirectResponse(url='/home')
@@ -253,9 +272,9 @@ async def post_detail(
 async def category_posts(
     request: Request,
     category_slug: str,
-    db: Session = Depends(get_session),
-    offset: int = 0,
-    limit: int = 5,
+    db: AsyncSession = Depends(get_async_read_session),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(5, ge=1, le=50),
 ):
     language = request.headers.get('Accept-Language', 'pt').split(',')[0]
     try:
@@ -275,7 +294,7 @@ async def category_posts(
                 url='/auth/login', status_code=status.HTTP_302_FOUND
             )
 
-        posts = get_posts_by_category_main(
+        posts = await get_posts_by_category_main(
             db, category_slug, language, offset, limit
         )
 
@@ -303,7 +322,9 @@ async def category_posts(
 async def organizations_list(
     request: Request,
     organization_id: int = None,
-    db: Session = Depends(get_session),
+    db: AsyncSession = Depends(get_async_read_session),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=50),
 ):
     try:
         (
@@ -322,9 +343,12 @@ async def organizations_list(
                 url='/auth/login', status_code=status.HTTP_302_FOUND
             )
 
-        organizations = get_organizations(
-            db, None, user.id_organizacao, user.eh_gerente
+        # Busca um registro a mais para saber se existe próxima página
+        organizations = await get_organizations_page(
+            db, user.id_organizacao, user.eh_gerente, offset, limit + 1
         )
+        has_next = len(organizations) > limit
+        organizations = organizations[:limit]
     except Exception as e:
         logger.error(f'Erro ao obter organizações: {e}')
         return RedirectResponse(url='/home')
@@ -336,6 +360,9 @@ async def organizations_list(
             'current_user': user,
             'categories': categorias,
             'organizations': organizations,
+            'offset': offset,
+            'limit': limit,
+            'has_next': has_next,
             'suggested_orgs': suggested_orgs,
             'suggested_events': suggested_events,
             'access_token': access_token,
@@ -345,7 +372,9 @@ async def organizations_list(
 
 @router.get('/organizations/{organization_id}', response_class=HTMLResponse)
 async def organizations_detail(
-    request: Request, organization_id: int, db: Session = Depends(get_session)
+    request: Request,
+    organization_id: int,
+    db: AsyncSession = Depends(get_async_read_session),
 ):
     try:
         (
@@ -364,7 +393,7 @@ async def organizations_detail(
                 url='/auth/login', status_code=status.HTTP_302_FOUND
             )
 
-        organizations = get_organizations(
+        organizations = await get_organizations(
             db, organization_id, user.id_organizacao, user.eh_gerente
         )
 
@@ -392,7 +421,9 @@ async def organizations_detail(
     '/organizations/{organization_id}/stats/', response_class=HTMLResponse
 )
 async def organization_stats(
-    request: Request, organization_id: int, db: Session = Depends(get_session)
+    request: Request,
+    organization_id: int,
+    db: AsyncSession = Depends(get_async_read_session),
 ):
     try:
         (
@@ -411,7 +442,7 @@ async def organization_stats(
                 url='/auth/login', status_code=status.HTTP_302_FOUND
             )
 
-        organizations = get_organizations(
+        organizations = await get_organizations(
             db, organization_id, user.id_organizacao, user.eh_gerente
         )
 
@@ -486,7 +517,9 @@ async def organization_stats(
 
 
 @router.get('/events', response_class=HTMLResponse)
-async def events_list(request: Request, db: Session = Depends(get_session)):
+async def events_list(
+    request: Request, db: AsyncSession = Depends(get_async_read_session)
+):
     try:
         (
             user,
@@ -504,7 +537,9 @@ async def events_list(request: Request, db: Session = Depends(get_session)):
                 url='/auth/login', status_code=status.HTTP_302_FOUND
             )
 
-        events = get_events(db, None, user.id_organizacao, user.eh_gerente)
+        events = await get_events(
+            db, None, user.id_organizacao, user.eh_gerente
+        )
         current_time = datetime.now()
 
         for event in events:
@@ -547,7 +582,9 @@ async def events_list(request: Request, db: Session = Depends(get_session)):
 
 @router.get('/events/{event_slug}', response_class=HTMLResponse)
 async def event_detail(
-    request: Request, event_slug: str, db: Session = Depends(get_session)
+    request: Request,
+    event_slug: str,
+    db: AsyncSession = Depends(get_async_read_session),
 ):
     try:
         (
@@ -566,7 +603,7 @@ async def event_detail(
                 url='/auth/login', status_code=status.HTTP_302_FOUND
             )
 
-        events = get_events(
+        events = await get_events(
             db, event_slug, user.id_organizacao, user.eh_gerente
         )
 
@@ -590,8 +627,14 @@ async def event_detail(
 
 @router.get('/search', response_class=HTMLResponse)
 async def search(
-    request: Request, query: str = '', db: Session = Depends(get_session)
+    request: Request,
+    query: str = '',
+    offset: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=50),
+    db: AsyncSession = Depends(get_async_read_session),
 ):
+    language = request.headers.get('Accept-Language', 'pt').split(',')[0]
+
     try:
         (
             user,
@@ -609,7 +652,10 @@ async def search(
                 url='/auth/login', status_code=status.HTTP_302_FOUND
             )
 
-        posts = get_posts_by_category_main(db, query)
+        # Um item a mais indica se existe próxima página
+        posts = await search_posts_async(db, query, offset, limit + 1)
+        has_next = len(posts) > limit
+        posts = await set_posts_extras(db, posts[:limit], user.id, language)
     except Exception as e:
         logger.error(f'Erro ao obter posts por pesquisa: {e}')
         return RedirectResponse(url='/home')
@@ -621,6 +667,10 @@ async def search(
             'current_user': user,
             'categories': categorias,
             'posts': posts,
+            'query': query,
+            'offset': offset,
+            'limit': limit,
+            'has_next': has_next,
             'suggested_orgs': suggested_orgs,
             'suggested_events': suggested_events,
             'access_token': access_token,
@@ -628,7 +678,7 @@ async def search(
     )
 
 
-async def get_common_data(request: Request, db: Session):
+async def get_common_data(request: Request, db: AsyncSession):
     """
     Função para obter dados comuns que são usados nas rotas.
     Retorna também o erro caso o usuário não seja encontrado.
@@ -654,28 +704,31 @@ async def get_common_data(request: Request, db: Session):
 
         # Processar iniciais
         user.iniciais = iniciais(f'{user.primeiro_nome} {user.sobrenome}')
-        organization = get_organizations(
+        organization = await get_organizations(
             db, user.id_organizacao, user.id_organizacao, user.eh_gerente
         )
         if organization:
             user.quantidade_doacoes = organization.quantidade_doacoes
 
         # Obter categorias
-        categorias = get_categories(db)
+        categorias = await get_categories(db)
 
-        # Obter posts da organização do usuário
+        # Primeira página do feed pré-calculado do público do usuário
         posts_organizacoes = []
         if user.organization:
-            posts_organizacoes = get_posts_by_organization(
+            posts_organizacoes, _ = await get_feed_async(
                 db,
-                user.organization.id,
                 user.id,
+                user.organization,
+                CursorPage(limit=HOME_FEED_SIZE),
                 language,
             )
 
         # Obter organizações e eventos sugeridos
-        suggested_orgs = get_suggested_organizations(db, user.id_organizacao)
-        suggested_events = get_suggested_events(db, user.id_organizacao)
+        suggested_orgs = await get_suggested_organizations(
+            db, user.id_organizacao
+        )
+        suggested_events = await get_suggested_events(db, user.id_organizacao)
         return (
             user,
             categorias,
@@ -0,0 +1,21 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from fast_rafa.modules.base.models import table_registry
+
+
+@table_registry.mapped_as_dataclass
+class MaintenanceRun:
+    """
+    Registro das tarefas de manutenção de dados que só podem rodar uma
+    vez por banco (ex.: a conversão dos horários para UTC).
+    """
+
+    __tablename__ = 'maintenance_runs'
+
+    nome: Mapped[str] = mapped_column(String(50), primary_key=True)
+    executado_em: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, init=False, insert_default=datetime.utcnow
+    )
@@ -0,0 +1,12 @@
+from sqlalchemy.orm import Session
+
+from fast_rafa.modules.maintenance.models import MaintenanceRun
+
+
+def has_run(db: Session, nome: str) -> bool:
+    return db.get(MaintenanceRun, nome) is not None
+
+
+def mark_run(db: Session, nome: str):
+    """Registra a tarefa como executada; o commit fica com quem chama."""
+    db.add(MaintenanceRun(nome=nome))
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Dict, Optional
 
 from pydantic import BaseModel
-from sqlalchemy import DateTime, ForeignKey, Integer, String
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from fast_rafa.modules.base.models import table_registry
@@ -31,10 +31,19 @@ class Message:
         String(2048), nullable=True
     )
     criado_em: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow()
+        DateTime, default=datetime.utcnow
     )
     atualizado_em: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow(), onupdate=datetime.utcnow()
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    __table_args__ = (
+        Index(
+            'ix_messages_id_mensagem_it_criado_em',
+            'id_mensagem_it',
+            'criado_em',
+        ),
+        Index('ix_messages_id_mensagem_it_id', 'id_mensagem_it', 'id'),
     )
 
     message_it = relationship('MessageItem', back_populates='messages')
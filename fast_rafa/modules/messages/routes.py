@@ -1,12 +1,45 @@
+import asyncio
+import json
 from http import HTTPStatus
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.websockets import WebSocketState
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
-from fast_rafa.core.database import get_session
-from fast_rafa.core.security import get_current_user
+from fast_rafa.core.broker import get_broker
+from fast_rafa.core.database import (
+    AsyncSessionLocal,
+    get_read_session,
+    get_session,
+)
+from fast_rafa.core.logger import setup_logger
+from fast_rafa.core.security import get_current_user, get_user_from_token_async
 from fast_rafa.modules.messages.models import Message
+from fast_rafa.modules.messages.schemas import (
+    InboxItem,
+    MessageSocketIn,
+    inbox_serializer,
+)
+from fast_rafa.modules.messages.services import (
+    conversation_channel,
+    create_message_async,
+    get_inbox,
+    get_participant_conversation,
+    mark_conversation_read,
+    message_event,
+    participant_conversation_query,
+    publish_message,
+)
 from fast_rafa.modules.messages_it.models import MessageItem
 from fast_rafa.utils.error_messages import (
     get_deletion_error_message,
@@ -14,13 +47,15 @@ from fast_rafa.utils.error_messages import (
     get_success_message,
     get_unexpected_error_message,
 )
+from fast_rafa.utils.pagination import NEXT_CURSOR_HEADER, CursorPage
 
+logger = setup_logger()
 router = APIRouter()
 
 
 @router.get('/', response_model=List[MessageItem])
 def get_messages(
-    db: Session = Depends(get_session),
+    db: Session = Depends(get_read_session),
     current_user_id: int = Depends(get_current_user),
 ):
     mensagens_conversa = (
@@ -34,10 +69,127 @@ def get_messages(
     return mensagens_conversa
 
 
+@router.get('/inbox', response_model=list[InboxItem])
+def get_inbox_conversations(
+    page: CursorPage = Depends(),
+    db: Session = Depends(get_read_session),
+    current_user=Depends(get_current_user),
+):
+    """
+    Caixa de entrada: conversas do usuário com a última mensagem, o outro
+    participante e as não lidas, da atividade mais recente para a mais
+    antiga. A próxima página vem no cabeçalho X-Next-Cursor.
+    """
+    conversas, next_cursor = get_inbox(db, current_user.id, page)
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return inbox_serializer.response(conversas, headers)
+
+
+@router.post('/conversations/{id}/read', response_model=dict)
+def read_conversation(
+    id: int,
+    db: Session = Depends(get_session),
+    current_user=Depends(get_current_user),
+):
+    """Marca as mensagens da conversa como lidas pelo usuário."""
+    conversa = db.scalar(participant_conversation_query(id, current_user.id))
+    if not conversa:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail=get_not_found_message('Conversa'),
+        )
+
+    try:
+        id_ultima_lida = mark_conversation_read(db, conversa, current_user.id)
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            detail=get_unexpected_error_message('marcar conversa', str(e)),
+        )
+
+    return {'id': id, 'id_ultima_lida': id_ultima_lida}
+
+
+async def forward_messages(websocket: WebSocket, pubsub):
+    async for event in pubsub.listen():
+        if event['type'] == 'message':
+            await websocket.send_text(event['data'])
+
+
+async def receive_messages(websocket: WebSocket, id_conversa: int, user):
+    while True:
+        try:
+            data = MessageSocketIn.model_validate_json(
+                await websocket.receive_text()
+            )
+        except ValidationError as e:
+            await websocket.send_json({
+                'erro': json.loads(e.json(include_url=False))
+            })
+            continue
+
+        async with AsyncSessionLocal() as db:
+            message = await create_message_async(
+                db, id_conversa, user.id, data
+            )
+            await publish_message(id_conversa, message_event(message))
+
+
+@router.websocket('/ws/{id_conversa}')
+async def conversation_socket(websocket: WebSocket, id_conversa: int):
+    """
+    Canal em tempo real da conversa: novas mensagens (enviadas por aqui ou
+    pelas rotas REST) são empurradas aos participantes conectados, sem
+    polling. O token vem do cookie access_token ou do parâmetro ?token=.
+    """
+    token = websocket.cookies.get('access_token') or (
+        websocket.query_params.get('token')
+    )
+    async with AsyncSessionLocal() as db:
+        user = await get_user_from_token_async(db, token)
+        conversa = user and await get_participant_conversation(
+            db, id_conversa, user.id
+        )
+    if not conversa:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    channel = conversation_channel(id_conversa)
+    pubsub = get_broker().pubsub()
+    await pubsub.subscribe(channel)
+    # Recebimento e repasse rodam juntos; quando um termina (desconexão ou
+    # erro, inclusive do broker), o outro é cancelado
+    tasks = (
+        asyncio.create_task(receive_messages(websocket, id_conversa, user)),
+        asyncio.create_task(forward_messages(websocket, pubsub)),
+    )
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in tasks:
+            task.cancel()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        await pubsub.unsubscribe(channel)
+        await pubsub.aclose()
+
+    errors = [
+        result
+        for result in results
+        if isinstance(result, Exception)
+        and not isinstance(result, WebSocketDisconnect)
+    ]
+    if errors:
+        logger.error(f'Erro no canal da conversa {id_conversa}: {errors[0]!r}')
+        if websocket.application_state == WebSocketState.CONNECTED:
+            await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+
+
 @router.get('/{id}', response_model=Message)
 def get_message(
     id: int,
-    db: Session = Depends(get_session),
+    db: Session = Depends(get_read_session),
     current_user_id: int = Depends(get_current_user),
 ):
     message = db.query(Message).get(id)
@@ -55,6 +207,7 @@ def get_message(
 @router.post('/', response_model=MessageItem, status_code=HTTPStatus.CREATED)
 def create_conversation(
     message_data: Message.CreateMessage,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_session),
     current_user_id: int = Depends(get_current_user),
 ):
@@ -74,12 +227,16 @@ def create_conversation(
             detail=get_unexpected_error_message('criar mensagem', str(e)),
         )
 
+    background_tasks.add_task(
+        publish_message, message.id_mensagem_it, message_event(message)
+    )
     return nova_conversa
 
 
 @router.post('/reply', response_model=Message, status_code=HTTPStatus.CREATED)
 def reply_to_conversation(
     message_data: Message.CreateMessage,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_session),
     current_user_id: int = Depends(get_current_user),
 ):
@@ -109,6 +266,11 @@ def reply_to_conversation(
             status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
             detail=get_unexpected_error_message('responder mensagem', str(e)),
         )
+
+    # Entregue aos participantes conectados depois da resposta
+    background_tasks.add_task(
+        publish_message, message.id_mensagem_it, message_event(message)
+    )
     return message
 
 
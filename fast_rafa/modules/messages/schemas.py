@@ -0,0 +1,51 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from fast_rafa.utils.serializers import ListSerializer
+
+
+class MessageSocketIn(BaseModel):
+    """Mensagem enviada pelo cliente através do WebSocket da conversa."""
+
+    conteudo: str = Field(min_length=1, max_length=500)
+    url_imagem: Optional[str] = Field(default=None, max_length=2048)
+    id_postagem: Optional[int] = None
+
+
+class MessageEvent(BaseModel):
+    """Mensagem publicada no canal da conversa e entregue aos clientes."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    id_mensagem_it: int
+    id_remetente: int
+    id_postagem: Optional[int] = None
+    conteudo: str
+    url_imagem: Optional[str] = None
+    criado_em: datetime
+
+
+class InboxUser(BaseModel):
+    """Outro participante da conversa, como exibido na caixa de entrada."""
+
+    id: int
+    username: str
+    primeiro_nome: str
+    sobrenome: str
+    url_imagem_perfil: Optional[str] = None
+
+
+class InboxItem(BaseModel):
+    """Conversa na caixa de entrada, com a última mensagem e as não lidas."""
+
+    id: int
+    outro_usuario: InboxUser
+    ultima_mensagem: Optional[MessageEvent] = None
+    mensagens_nao_lidas: int
+    ultima_atividade: datetime
+
+
+inbox_serializer = ListSerializer(InboxItem)
@@ -0,0 +1,222 @@
+from typing import Optional
+
+from sqlalchemy import case, func, or_, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from fast_rafa.core.broker import get_broker
+from fast_rafa.modules.messages.models import Message
+from fast_rafa.modules.messages.schemas import MessageEvent, MessageSocketIn
+from fast_rafa.modules.messages_it.models import MessageItem
+from fast_rafa.modules.users.models import User
+from fast_rafa.utils.pagination import CursorPage, decode_cursor, encode_cursor
+
+
+def conversation_channel(id_conversa: int) -> str:
+    return f'mensagens:{id_conversa}'
+
+
+def message_event(message: Message) -> str:
+    """JSON da mensagem publicado no canal da conversa."""
+    return MessageEvent.model_validate(message).model_dump_json()
+
+
+async def publish_message(id_conversa: int, event: str):
+    """Entrega a mensagem aos participantes conectados à conversa."""
+    await get_broker().publish(conversation_channel(id_conversa), event)
+
+
+def participant_conversation_query(id_conversa: int, user_id: int):
+    return select(MessageItem).where(
+        MessageItem.id == id_conversa,
+        or_(
+            MessageItem.usuario_um == user_id,
+            MessageItem.usuario_dois == user_id,
+        ),
+    )
+
+
+async def get_participant_conversation(
+    db: AsyncSession, id_conversa: int, user_id: int
+) -> Optional[MessageItem]:
+    return await db.scalar(
+        participant_conversation_query(id_conversa, user_id)
+    )
+
+
+async def create_message_async(
+    db: AsyncSession, id_conversa: int, user_id: int, data: MessageSocketIn
+) -> Message:
+    message = Message(
+        id_mensagem_it=id_conversa,
+        id_remetente=user_id,
+        id_postagem=data.id_postagem,
+        conteudo=data.conteudo,
+        url_imagem=data.url_imagem,
+    )
+    db.add(message)
+    await db.commit()
+    return message
+
+
+def inbox_query(user_id: int, page: CursorPage):
+    """
+    Caixa de entrada em uma única consulta. Primeiro pagina as conversas
+    do usuário pela última atividade (max de criado_em no índice
+    id_mensagem_it, criado_em), com cursor (keyset); só para as conversas
+    da página busca a última mensagem e conta as recebidas depois da
+    última lida (índice id_mensagem_it, id), em subconsultas correlatas.
+    """
+    is_usuario_um = MessageItem.usuario_um == user_id
+    ultima_atividade = func.coalesce(
+        select(func.max(Message.criado_em))
+        .where(Message.id_mensagem_it == MessageItem.id)
+        .scalar_subquery(),
+        MessageItem.criado_em,
+    )
+    conversas = select(
+        MessageItem.id,
+        ultima_atividade.label('ultima_atividade'),
+        case(
+            (is_usuario_um, MessageItem.usuario_dois),
+            else_=MessageItem.usuario_um,
+        ).label('id_outro'),
+        func.coalesce(
+            case(
+                (is_usuario_um, MessageItem.id_ultima_lida_um),
+                else_=MessageItem.id_ultima_lida_dois,
+            ),
+            0,
+        ).label('id_ultima_lida'),
+    ).where(
+        or_(
+            MessageItem.usuario_um == user_id,
+            MessageItem.usuario_dois == user_id,
+        )
+    )
+
+    if page.cursor:
+        sort_value, item_id = decode_cursor(page.cursor, MessageItem.criado_em)
+        conversas = conversas.where(
+            tuple_(ultima_atividade, MessageItem.id)
+            < tuple_(sort_value, item_id)
+        )
+    elif page.skip:
+        conversas = conversas.offset(page.skip)
+
+    conversas = (
+        conversas.order_by(ultima_atividade.desc(), MessageItem.id.desc())
+        .limit(page.limit + 1)
+        .subquery('conversas')
+    )
+
+    id_ultima_mensagem = (
+        select(Message.id)
+        .where(Message.id_mensagem_it == conversas.c.id)
+        .order_by(Message.criado_em.desc(), Message.id.desc())
+        .limit(1)
+        .correlate(conversas)
+        .scalar_subquery()
+    )
+    nao_lidas = (
+        select(func.count())
+        .select_from(Message)
+        .where(
+            Message.id_mensagem_it == conversas.c.id,
+            Message.id > conversas.c.id_ultima_lida,
+            Message.id_remetente != user_id,
+        )
+        .correlate(conversas)
+        .scalar_subquery()
+    )
+
+    return (
+        select(
+            conversas.c.id,
+            conversas.c.ultima_atividade,
+            nao_lidas.label('mensagens_nao_lidas'),
+            Message.id.label('id_mensagem'),
+            Message.id_remetente,
+            Message.id_postagem,
+            Message.conteudo,
+            Message.url_imagem,
+            Message.criado_em,
+            User.id.label('id_outro'),
+            User.username,
+            User.primeiro_nome,
+            User.sobrenome,
+            User.url_imagem_perfil,
+        )
+        .select_from(conversas)
+        .join(User, User.id == conversas.c.id_outro)
+        .outerjoin(Message, Message.id == id_ultima_mensagem)
+        .order_by(conversas.c.ultima_atividade.desc(), conversas.c.id.desc())
+    )
+
+
+def inbox_item(row) -> dict:
+    ultima_mensagem = None
+    if row.id_mensagem is not None:
+        ultima_mensagem = {
+            'id': row.id_mensagem,
+            'id_mensagem_it': row.id,
+            'id_remetente': row.id_remetente,
+            'id_postagem': row.id_postagem,
+            'conteudo': row.conteudo,
+            'url_imagem': row.url_imagem,
+            'criado_em': row.criado_em,
+        }
+    return {
+        'id': row.id,
+        'outro_usuario': {
+            'id': row.id_outro,
+            'username': row.username,
+            'primeiro_nome': row.primeiro_nome,
+            'sobrenome': row.sobrenome,
+            'url_imagem_perfil': row.url_imagem_perfil,
+        },
+        'ultima_mensagem': ultima_mensagem,
+        'mensagens_nao_lidas': row.mensagens_nao_lidas,
+        'ultima_atividade': row.ultima_atividade,
+    }
+
+
+def get_inbox(db: Session, user_id: int, page: CursorPage) -> tuple:
+    """Retorna (conversas da página, próximo cursor ou None)."""
+    rows = db.execute(inbox_query(user_id, page)).all()
+    if len(rows) <= page.limit:
+        return [inbox_item(row) for row in rows], None
+
+    rows = rows[: page.limit]
+    last = rows[-1]
+    return (
+        [inbox_item(row) for row in rows],
+        encode_cursor(last.ultima_atividade, last.id),
+    )
+
+
+def mark_conversation_read(
+    db: Session, conversa: MessageItem, user_id: int
+) -> Optional[int]:
+    """
+    Marca como lidas todas as mensagens da conversa para o participante,
+    gravando o id da mais recente; retorna esse id.
+    """
+    column = (
+        MessageItem.id_ultima_lida_um
+        if conversa.usuario_um == user_id
+        else MessageItem.id_ultima_lida_dois
+    )
+    ultima = (
+        select(func.max(Message.id))
+        .where(Message.id_mensagem_it == conversa.id)
+        .scalar_subquery()
+    )
+    id_ultima_lida = db.execute(
+        update(MessageItem)
+        .where(MessageItem.id == conversa.id)
+        .values({column: func.coalesce(ultima, column)})
+        .returning(column)
+    ).scalar_one()
+    db.commit()
+    return id_ultima_lida
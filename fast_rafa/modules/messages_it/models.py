@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Dict, Optional
 
 from pydantic import BaseModel
-from sqlalchemy import DateTime, ForeignKey, Integer
+from sqlalchemy import DateTime, ForeignKey, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from fast_rafa.modules.base.models import table_registry
@@ -22,7 +22,23 @@ class MessageItem:
         Integer, ForeignKey('users.id'), nullable=False
     )
     criado_em: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow()
+        DateTime, default=datetime.utcnow
+    )
+    # Última mensagem lida por cada participante (base das não lidas)
+    id_ultima_lida_um: Mapped[Optional[int]] = mapped_column(
+        Integer, nullable=True, default=None
+    )
+    id_ultima_lida_dois: Mapped[Optional[int]] = mapped_column(
+        Integer, nullable=True, default=None
+    )
+
+    __table_args__ = (
+        Index(
+            'ix_message_its_usuario_um_usuario_dois',
+            'usuario_um',
+            'usuario_dois',
+        ),
+        Index('ix_message_its_usuario_dois', 'usuario_dois'),
     )
 
     messages = relationship(
@@ -0,0 +1,61 @@
+from sqlalchemy import select, update
+
+from fast_rafa.core.database_seed import get_session
+from fast_rafa.core.settings import settings
+from fast_rafa.modules.maintenance.services import has_run, mark_run
+from fast_rafa.modules.organizations.models import Organization
+from fast_rafa.utils.timezone import to_utc_native_many
+
+ORGANIZATIONS_TO_UTC = 'organizations_to_utc'
+
+
+def run_task_organizations_to_utc():
+    """
+    Converte criado_em/atualizado_em das organizações do horário local
+    (settings.TIMEZONE ou fuso do sistema) para UTC. Rode ao ativar
+    TIMESTAMPS_UTC; a conversão fica registrada no banco, e as execuções
+    seguintes não alteram mais nada.
+    Uso: task organizations_to_utc
+    """
+    if not settings.TIMESTAMPS_UTC:
+        print('Ative TIMESTAMPS_UTC antes de converter as organizações.')
+        return
+
+    session = next(get_session())
+    try:
+        if has_run(session, ORGANIZATIONS_TO_UTC):
+            print('Os horários das organizações já estão em UTC.')
+            return
+
+        rows = session.execute(
+            select(
+                Organization.id,
+                Organization.criado_em,
+                Organization.atualizado_em,
+            )
+        ).all()
+        criados = to_utc_native_many(row.criado_em for row in rows)
+        atualizados = to_utc_native_many(row.atualizado_em for row in rows)
+
+        if rows:
+            session.execute(
+                update(Organization),
+                [
+                    {
+                        'id': row.id,
+                        'criado_em': criado,
+                        'atualizado_em': atualizado,
+                    }
+                    for row, criado, atualizado in zip(
+                        rows, criados, atualizados
+                    )
+                ],
+            )
+        # Registrado na mesma transação da conversão
+        mark_run(session, ORGANIZATIONS_TO_UTC)
+        session.commit()
+        print(
+            f'Horários convertidos para UTC em {len(rows)} organização(ões).'
+        )
+    finally:
+        session.close()
@@ -6,10 +6,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from fast_rafa.modules.base.models import table_registry
 from fast_rafa.modules.organizations.schemas import OrganizationCreate
-from fast_rafa.utils.timezone import (
-    get_local_time_native,
-    set_local_time_native,
-)
+from fast_rafa.utils.timezone import get_timestamp_native
 
 
 @table_registry.mapped_as_dataclass
@@ -45,10 +42,10 @@ class Organization:
         String(255), nullable=False, unique=True
     )
     criado_em: Mapped[datetime] = mapped_column(
-        DateTime, default=get_local_time_native
+        DateTime, default=get_timestamp_native
     )
     atualizado_em: Mapped[datetime] = mapped_column(
-        DateTime, default=get_local_time_native, onupdate=set_local_time_native
+        DateTime, default=get_timestamp_native, onupdate=get_timestamp_native
     )
 
     def __init__(self, data: 'OrganizationCreate'):
@@ -92,7 +89,7 @@ class Organization:
     def update(cls, instance: 'Organization', data: Dict):
         for key, value in data.items():
             setattr(instance, key, value)
-        instance.atualizado_em = get_local_time_native()
+        instance.atualizado_em = get_timestamp_native()
         return instance
 
     @classmethod
@@ -5,7 +5,10 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from fast_rafa.core.database import get_session
+from fast_rafa.core.database import get_read_session, get_session
+from fast_rafa.modules.events.services import invalidate_suggested_events
+from fast_rafa.modules.feed.services import refresh_feed_entries
+from fast_rafa.modules.leaderboards.services import remove_organization_entries
 from fast_rafa.modules.organizations.models import Organization
 from fast_rafa.modules.organizations.schemas import (
     OrganizationCreate,
@@ -14,6 +17,11 @@ from fast_rafa.modules.organizations.schemas import (
     OrganizationUpdateRequest,
     OrganizationUpdateResponse,
 )
+from fast_rafa.modules.organizations.services import (
+    invalidate_suggested_organizations,
+)
+from fast_rafa.modules.posts.models import Post
+from fast_rafa.modules.search.services import invalidate_autocomplete
 from fast_rafa.utils.error_messages import (
     get_conflict_message,
     get_creation_error_message,
@@ -42,6 +50,7 @@ def create_organization(
     try:
         db.add(novo_organizacao)
         db.commit()
+        invalidate_autocomplete()
         db.refresh(novo_organizacao)
     except IntegrityError as e:
         db.rollback()
@@ -73,7 +82,7 @@ def create_organization(
 
 @router.get('/', response_model=dict, status_code=HTTPStatus.OK)
 def read_organizations(
-    skip: int = 0, limit: int = 10, db: Session = Depends(get_session)
+    skip: int = 0, limit: int = 10, db: Session = Depends(get_read_session)
 ):
     organizacoes = db.query(Organization).offset(skip).limit(limit).all()
 
@@ -92,7 +101,7 @@ def read_organizations(
 
 @router.get('/{organization_id}', status_code=HTTPStatus.OK)
 def read_organization_by_id(
-    organization_id: int, db: Session = Depends(get_session)
+    organization_id: int, db: Session = Depends(get_read_session)
 ):
     organizacao = (
         db.query(Organization)
@@ -111,7 +120,7 @@ def read_organization_by_id(
 
 @router.get('/federal/{organization_id_federal}', status_code=HTTPStatus.OK)
 def read_organization_by_id_federal(
-    organization_id_federal: str, db: Session = Depends(get_session)
+    organization_id_federal: str, db: Session = Depends(get_read_session)
 ):
     organizacao = (
         db.query(Organization)
@@ -134,7 +143,7 @@ def read_organization_by_id_federal(
     response_model=dict,
 )
 def read_organization_by_name(
-    organization_by_name: str, db: Session = Depends(get_session)
+    organization_by_name: str, db: Session = Depends(get_read_session)
 ):
     organizacoes = get_by_sel(
         db,
@@ -186,7 +195,13 @@ def update_organization(
     organizacao = Organization.update(organizacao, update_data)
 
     try:
+        db.flush()
+        # O público dos posts no feed segue o nao_governamental
+        refresh_feed_entries(db, Post.id_organizacao == organization_id)
         db.commit()
+        invalidate_suggested_organizations()
+        invalidate_suggested_events()
+        invalidate_autocomplete()
         db.refresh(organizacao)
     except IntegrityError as e:
         db.rollback()
@@ -240,7 +255,11 @@ def delete_organization(
 
     try:
         db.delete(organizacao)
+        remove_organization_entries(db, organization_id)
         db.commit()
+        invalidate_suggested_organizations()
+        invalidate_suggested_events()
+        invalidate_autocomplete()
     except IntegrityError as e:
         db.rollback()
         error_message = str(e.orig)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 
 
 class OrganizationCreate(BaseModel):
@@ -83,3 +83,15 @@ class OrganizationUpdateResponse(OrganizationResponse):
 
 class OrganizationDeleteResponse(BaseModel):
     message: str
+
+
+class OrganizationSummary(BaseModel):
+    """Organização sugerida na lateral, guardada em cache."""
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    id: int
+    nome: str
+    url_logo: str
+    cidade: str
+    estado: str
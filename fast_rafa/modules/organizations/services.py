@@ -1,84 +1,159 @@
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from typing import Optional
 
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
+
+from fast_rafa.core.cache import TTLCache
+from fast_rafa.core.settings import settings
+from fast_rafa.core.templates import invalidate_fragments
+from fast_rafa.modules.leaderboards.services import (
+    ORGANIZATIONS,
+    leaderboard_query,
+)
 from fast_rafa.modules.organizations.models import Organization
+from fast_rafa.modules.organizations.schemas import OrganizationSummary
 from fast_rafa.modules.posts.models import Post
 
+SUGGESTED_ORGANIZATIONS = 5
 
-def get_suggested_organizations(db: Session, user_organization_id: int):
-    return (
-        db.query(Organization, func.count(Post.id).label('post_count'))
-        .join(Post, Post.id_organizacao == Organization.id)
-        .filter(
-            Post.status == 1,
-            Post.data_validade >= func.now(),
-            Post.quantidade != '',
-            Post.id_organizacao != user_organization_id,
+# Ranking compartilhado por todos os usuários, guardado como cópias
+# imutáveis (OrganizationSummary, total); a organização do usuário é
+# removida na leitura, por isso é carregada uma posição a mais
+suggested_organizations_cache = TTLCache(settings.PAGE_CACHE_TTL)
+
+
+async def get_suggested_organizations(
+    db: AsyncSession, user_organization_id: int
+):
+    ranking = await suggested_organizations_cache.get_or_load(
+        ORGANIZATIONS, lambda: load_suggested_organizations(db)
+    )
+    suggestions = [
+        (organization, post_count)
+        for organization, post_count in ranking
+        if organization.id != user_organization_id
+    ]
+    return suggestions[:SUGGESTED_ORGANIZATIONS]
+
+
+def invalidate_suggested_organizations():
+    suggested_organizations_cache.invalidate()
+    invalidate_fragments()
+
+
+async def load_suggested_organizations(db: AsyncSession):
+    result = await db.execute(
+        leaderboard_query(
+            Organization,
+            ORGANIZATIONS,
+            SUGGESTED_ORGANIZATIONS + 1,
+            Organization.id,
+            Organization.nome,
+            Organization.url_logo,
+            Organization.cidade,
+            Organization.estado,
         )
-        .group_by(Organization.id)
-        .order_by(func.count(Post.id).desc())
-        .limit(5)
-        .all()
     )
+    return [
+        (OrganizationSummary.model_validate(row), row.pontuacao)
+        for row in result
+    ]
+
 
+def organizations_with_post_count():
+    """
+    Organizações com a quantidade de postagens, calculada em uma única
+    agregação em vez de um COUNT por organização.
+    """
+    post_count = (
+        select(Post.id_organizacao, func.count(Post.id).label('post_count'))
+        .group_by(Post.id_organizacao)
+        .subquery()
+    )
+    return (
+        select(Organization, func.coalesce(post_count.c.post_count, 0))
+        .outerjoin(post_count, post_count.c.id_organizacao == Organization.id)
+        .options(lazyload(Organization.posts))
+    )
+
+
+def set_organization_extras(
+    organization, post_count, user_organization_id, gerente
+):
+    organization.pode_editar = (
+        organization.id == user_organization_id
+    ) and gerente
+    # Quantidade de doações/postagens
+    organization.quantidade_doacoes = post_count
+    return organization
 
-def get_organizations(
-    db: Session,
+
+async def get_organizations_page(
+    db: AsyncSession,
+    user_organization_id: int = None,
+    user_eh_gerente: bool = None,
+    offset: int = 0,
+    limit: Optional[int] = None,
+):
+    """Página de organizações ordenada por nome, com a contagem de posts."""
+    result = await db.execute(
+        organizations_with_post_count()
+        .order_by(Organization.nome, Organization.id)
+        .offset(offset)
+        .limit(limit)
+    )
+    return [
+        set_organization_extras(
+            organization,
+            post_count,
+            user_organization_id,
+            bool(user_eh_gerente),
+        )
+        for organization, post_count in result.all()
+    ]
+
+
+async def get_organizations(
+    db: AsyncSession,
     organization_id: int = None,
     user_organization_id: int = None,
     user_eh_gerente: bool = None,
 ):
-    query = db.query(Organization)
-    gerente = False
-    if user_eh_gerente is not None:
-        gerente = user_eh_gerente
-
-    if organization_id:
-        query = query.filter(Organization.id == organization_id)
-        organization = query.first()
-
-        if organization:
-            post_count = (
-                db.query(func.count(Post.id))
-                .filter(Post.id_organizacao == organization.id)
-                .scalar()
-            )
-            organization.pode_editar = (
-                organization.id == user_organization_id
-            ) and gerente
-            organization.quantidade_doacoes = (
-                post_count or 0
-            )  # Adicionando a quantidade de doações/postagens
-            return organization
-        else:
-            return None
-
-    else:
-        organizations = query.all()
-
-        result = []
-        for organization in organizations:
-            # Contagem de posts para cada organização
-            post_count = (
-                db.query(func.count(Post.id))
-                .filter(Post.id_organizacao == organization.id)
-                .scalar()
-            )
-            organization.pode_editar = (
-                organization.id == user_organization_id
-            ) and gerente
-            organization.quantidade_doacoes = (
-                post_count or 0
-            )  # Definindo a quantidade de doações/postagens
-            result.append(organization)
-
-        return result
-
-
-def get_list_organizations(db: Session):
-    organizations = get_organizations(db)
-    organizations_data = [
-        {'id': org.id, 'display_name': org.display_name}
-        for org in organizations
+    if not organization_id:
+        return await get_organizations_page(
+            db, user_organization_id, user_eh_gerente
+        )
+
+    result = await db.execute(
+        organizations_with_post_count().where(
+            Organization.id == organization_id
+        )
+    )
+    row = result.first()
+    if not row:
+        return None
+
+    organization, post_count = row
+    return set_organization_extras(
+        organization, post_count, user_organization_id, bool(user_eh_gerente)
+    )
+
+
+async def get_list_organizations(db: AsyncSession):
+    """
+    Lista leve (id, display_name) para o campo de seleção de organização,
+    sem carregar as entidades completas.
+    """
+    result = await db.execute(
+        select(
+            Organization.id,
+            Organization.nome,
+            Organization.cidade,
+            Organization.estado,
+        ).order_by(Organization.nome, Organization.id)
+    )
+    return [
+        {'id': org_id, 'display_name': f'{nome} - {cidade}/{estado}'}
+        for org_id, nome, cidade, estado in result.all()
     ]
-    return organizations_data
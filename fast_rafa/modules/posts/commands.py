@@ -0,0 +1,119 @@
+import json
+from datetime import date, datetime
+from time import perf_counter
+
+from sqlalchemy.orm import configure_mappers
+
+from fast_rafa.core.database_seed import get_session
+from fast_rafa.modules.feed.services import refresh_feed_entries
+from fast_rafa.modules.posts.models import Post
+from fast_rafa.modules.posts.schemas import (
+    PostResponse,
+    post_list_serializer,
+)
+from fast_rafa.modules.posts.services import reconcile_total_likes
+from fast_rafa.modules.users.models import User
+from fast_rafa.modules.users.schemas import (
+    UserResponse,
+    user_home_serializer,
+)
+
+
+def run_task_reconcile_likes():
+    """
+    Reconstrói o contador posts.total_likes a partir dos favoritos e,
+    se algum mudou, o feed da home.
+    Uso: task reconcile_likes
+    """
+    session = next(get_session())
+    try:
+        total = reconcile_total_likes(session)
+        # A pontuação do feed depende dos likes: grava os dois juntos
+        if total:
+            refresh_feed_entries(session)
+        session.commit()
+        print(f'Contador de likes corrigido em {total} post(s).')
+    finally:
+        session.close()
+
+
+def build_instance(model, **values):
+    """Instância ORM transitória, sem passar pelo __init__ do modelo."""
+    instance = model.__mapper__.class_manager.new_instance()
+    for key, value in values.items():
+        setattr(instance, key, value)
+    return instance
+
+
+def per_row_microseconds(serialize, items, rounds: int) -> float:
+    start = perf_counter()
+    for _ in range(rounds):
+        serialize(items)
+    return (perf_counter() - start) / (rounds * len(items)) * 1_000_000
+
+
+def run_task_benchmark_serializers(rows: int = 1000, rounds: int = 20):
+    """
+    Compara o custo por linha da serialização em lote (ListSerializer)
+    com o caminho antigo: um schema montado por item em um loop e a
+    revalidação do FastAPI pelo response_model antes do json.dumps.
+    Uso: task bench_serializers
+    """
+    configure_mappers()
+    now = datetime.utcnow()
+    posts = [
+        build_instance(
+            Post,
+            id=i,
+            item=True,
+            id_organizacao=1,
+            id_usuario=1,
+            titulo=f'Arroz {i}',
+            descricao='Arroz integral',
+            quantidade='10',
+            id_categoria=1,
+            url_imagem_post=None,
+            data_validade=date.today(),
+            status=1,
+            total_likes=i,
+            criado_em=now,
+            atualizado_em=now,
+        )
+        for i in range(rows)
+    ]
+    users = [
+        build_instance(
+            User,
+            id=i,
+            primeiro_nome='Ana',
+            sobrenome='Silva',
+            email=f'u{i}@x.com',
+            telefone='81999999999',
+            url_imagem_perfil=None,
+            id_organizacao=1,
+            eh_deletado=False,
+            eh_voluntario=False,
+            eh_gerente=False,
+        )
+        for i in range(rows)
+    ]
+
+    cases = [
+        ('PostResponse', posts, PostResponse.from_home, post_list_serializer),
+        ('UserResponse', users, UserResponse.from_home, user_home_serializer),
+    ]
+    for name, items, from_home, serializer in cases:
+
+        def legacy(items, from_home=from_home, serializer=serializer):
+            content = [from_home(item) for item in items]
+            value = serializer.validate(content)
+            return json.dumps(
+                serializer.adapter.dump_python(value, mode='json')
+            ).encode()
+
+        antes = per_row_microseconds(legacy, items, rounds)
+        depois = per_row_microseconds(serializer.to_json, items, rounds)
+        print(
+            f'{name}: {antes:.1f} µs/linha (loop + response_model) -> '
+            f'{depois:.1f} µs/linha (lote), {antes / depois:.1f}x'
+        )
@@ -6,6 +6,7 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     UniqueConstraint,
@@ -43,11 +44,15 @@ class Post:
         Date, nullable=False, default=lambda: datetime.utcnow().date()
     )
     status: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    # Contador desnormalizado, mantido pelas rotas de favoritos
+    total_likes: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default='0'
+    )
     criado_em: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow()
+        DateTime, default=datetime.utcnow
     )
     atualizado_em: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow(), onupdate=datetime.utcnow()
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
     )
 
     __table_args__ = (
@@ -58,6 +63,9 @@ class Post:
             'data_validade',
             name='uix_usuario_titulo_descricao_data',
         ),
+        Index('ix_posts_id_organizacao_status', 'id_organizacao', 'status'),
+        Index('ix_posts_id_categoria', 'id_categoria'),
+        Index('ix_posts_criado_em', 'criado_em'),
     )
 
     def __init__(self, data: 'CreatePost'):
@@ -1,15 +1,28 @@
 import re
+from datetime import date
 from http import HTTPStatus
+from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from fast_rafa.core.database import get_session
+from fast_rafa.core.database import get_read_session, get_session
 from fast_rafa.core.security import get_current_user
 from fast_rafa.modules.categories.models import Category
+from fast_rafa.modules.feed.services import (
+    refresh_feed_entries,
+    remove_feed_entry,
+)
+from fast_rafa.modules.leaderboards.services import (
+    refresh_organization_scores,
+)
 from fast_rafa.modules.organizations.models import Organization
+from fast_rafa.modules.organizations.services import (
+    invalidate_suggested_organizations,
+)
 from fast_rafa.modules.posts.models import Post
 from fast_rafa.modules.posts.schemas import (
     CreatePost,
@@ -17,7 +30,13 @@ from fast_rafa.modules.posts.schemas import (
     PostResponse,
     UpdatePostRequest,
     UpdatePostResponse,
+    post_list_serializer,
 )
+from fast_rafa.modules.posts.services import (
+    build_posts_export_query,
+    stream_posts_export,
+)
+from fast_rafa.modules.search.services import search_posts
 from fast_rafa.modules.users.models import User
 from fast_rafa.utils.error_messages import (
     get_conflict_message,
@@ -28,6 +47,7 @@ from fast_rafa.utils.error_messages import (
     get_unexpected_error_message,
     get_update_error_message,
 )
+from fast_rafa.utils.pagination import NEXT_CURSOR_HEADER, CursorPage
 from fast_rafa.utils.sel import get_by_sel
 
 router = APIRouter()
@@ -84,7 +104,12 @@ def create_post(post: CreatePost, db: Session = Depends(get_session)):
 
     try:
         db.add(nova_postagem)
+        # Feed e ranking são gravados na mesma transação do post
+        db.flush()
+        refresh_feed_entries(db, Post.id == nova_postagem.id)
+        refresh_organization_scores(db, [post.id_organizacao])
         db.commit()
+        invalidate_suggested_organizations()
         db.refresh(nova_postagem)
     except IntegrityError as e:
         db.rollback()
@@ -116,11 +141,10 @@ def create_post(post: CreatePost, db: Session = Depends(get_session)):
 
 @router.get('/', status_code=HTTPStatus.OK, response_model=list[PostResponse])
 def read_posts(
-    skip: int = 0,
-    limit: int = 10,
     status: int = None,
     order_by: str = 'titulo',
-    db: Session = Depends(get_session),
+    page: CursorPage = Depends(),
+    db: Session = Depends(get_read_session),
 ):
     filters = {}
     if status is not None:
@@ -140,12 +164,9 @@ def read_posts(
             status_code=HTTPStatus.BAD_REQUEST,
             detail='Campo de ordenação inválido.',
         )
-    postagens = (
-        get_by_sel(db, Post, filters={'filter_plus': filters})
-        .order_by(order_by)
-        .offset(skip)
-        .limit(limit)
-        .all()
+    query = get_by_sel(db, Post, filters={'filter_plus': filters})
+    postagens, next_cursor = page.split(
+        page.apply(query, Post, order_by).all(), order_by
     )
 
     if not postagens:
@@ -154,19 +175,54 @@ def read_posts(
             detail=get_not_found_message('Postagem'),
         )
 
-    postagens = [PostResponse.from_home(post) for post in postagens]
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return post_list_serializer.response(postagens, headers)
+
 
-    return postagens
+EXPORT_MEDIA_TYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv; charset=utf-8',
+}
 
 
 @router.get('/export', status_code=HTTPStatus.OK)
-def export_posts(db: Session = Depends(get_session)):
-    postagens = get_by_sel(db, Post, filters={}).all()
-    return {'posts': [PostResponse.from_home(post) for post in postagens]}
+def export_posts(
+    format: str = 'json',
+    status: Optional[int] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    db: Session = Depends(get_read_session),
+):
+    """
+    Exporta as postagens. Com format=ndjson ou format=csv a resposta é
+    enviada em streaming, linha a linha, sem carregar a tabela na memória.
+    O intervalo de datas filtra pela data de criação.
+    """
+    if format != 'json' and format not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail='Formato de exportação inválido.',
+        )
+
+    query = build_posts_export_query(status, start_date, end_date)
+
+    if format == 'json':
+        postagens = db.execute(query).all()
+        return JSONResponse({
+            'posts': post_list_serializer.to_python(postagens)
+        })
+
+    return StreamingResponse(
+        stream_posts_export(query, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            'Content-Disposition': f'attachment; filename=posts.{format}'
+        },
+    )
 
 
 @router.get('/stats', status_code=HTTPStatus.OK)
-def get_post_stats(db: Session = Depends(get_session)):
+def get_post_stats(db: Session = Depends(get_read_session)):
     stats = (
         db.query(Post.status, func.count(Post.id)).group_by(Post.status).all()
     )
@@ -176,7 +232,7 @@ def get_post_stats(db: Session = Depends(get_session)):
 @router.get(
     '/{post_id}', status_code=HTTPStatus.OK, response_model=PostResponse
 )
-def read_post_by_id(post_id: int, db: Session = Depends(get_session)):
+def read_post_by_id(post_id: int, db: Session = Depends(get_read_session)):
     postagem = get_by_sel(
         db, Post, filters={'filter_plus': {'id': post_id}}
     ).first()
@@ -199,20 +255,10 @@ def read_post_by_name(
     post_name: str,
     skip: int = 0,
     limit: int = 10,
-    db: Session = Depends(get_session),
+    db: Session = Depends(get_read_session),
     current_user=Depends(get_current_user),
 ):
-    filters = {
-        'filter_plus': {'status': 1},
-        'like_filters': {'titulo': post_name, 'descricao': post_name},
-    }
-
-    postagens = (
-        get_by_sel(db=db, model=Post, filters=filters)
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    postagens = search_posts(db, post_name, skip, limit)
 
     if not postagens:
         raise HTTPException(
@@ -220,8 +266,7 @@ def read_post_by_name(
             detail=get_not_found_message('Postagem'),
         )
 
-    post_by_name = [PostResponse.from_home(post) for post in postagens]
-    return post_by_name
+    return post_list_serializer.response(postagens)
 
 
 @router.put('/{post_id}', status_code=HTTPStatus.OK, response_model=Post)
@@ -278,10 +323,16 @@ def update_post(
             detail=get_not_found_message('Usuário'),
         )
 
+    # O post pode mudar de organização: as duas entram no ranking
+    organizacoes = list({postagem.id_organizacao, organizacao.id})
     post_atualizado = Post.update(postagem, post.dict())
 
     try:
+        db.flush()
+        refresh_feed_entries(db, Post.id == post_id)
+        refresh_organization_scores(db, organizacoes)
         db.commit()
+        invalidate_suggested_organizations()
         db.refresh(post_atualizado)
     except IntegrityError as e:
         db.rollback()
@@ -354,7 +405,11 @@ def update_post_status(
         )
 
     postagem.status = status
+    db.flush()
+    refresh_feed_entries(db, Post.id == post_id)
+    refresh_organization_scores(db, [postagem.id_organizacao])
     db.commit()
+    invalidate_suggested_organizations()
     return UpdatePostResponse(
         message=get_success_message('Postagem atualizada')
     )
@@ -379,8 +434,13 @@ def delete_post(post_id: int, db: Session = Depends(get_session)):
         )
 
     try:
+        id_organizacao = postagem.id_organizacao
+        remove_feed_entry(db, post_id)
         db.delete(postagem)
+        db.flush()
+        refresh_organization_scores(db, [id_organizacao])
         db.commit()
+        invalidate_suggested_organizations()
     except IntegrityError as e:
         db.rollback()
         error_message = str(e.orig)
@@ -1,7 +1,9 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+from fast_rafa.utils.serializers import ListSerializer
 
 
 class CreatePost(BaseModel):
@@ -51,35 +53,15 @@ class PostResponse(BaseModel):
     url_imagem_post: Optional[str] = ''
     data_validade: datetime
     status: int
+    total_likes: int = 0
     criado_em: datetime
     atualizado_em: datetime
 
+    model_config = ConfigDict(from_attributes=True)
+
     @classmethod
     def from_home(cls, post):
-        return cls(
-            id=post.id,
-            item=post.item if hasattr(post, 'item') else False,
-            id_organizacao=post.id_organizacao
-            if hasattr(post, 'id_organizacao')
-            else 0,
-            id_usuario=post.id_usuario if hasattr(post, 'id_usuario') else 0,
-            titulo=post.titulo if hasattr(post, 'titulo') else '',
-            descricao=post.descricao if hasattr(post, 'descricao') else '',
-            quantidade=post.quantidade if hasattr(post, 'quantidade') else '',
-            id_categoria=post.id_categoria
-            if hasattr(post, 'id_categoria')
-            else 0,
-            url_imagem_post=post.url_imagem_post
-            if hasattr(post, 'url_imagem_post')
-            else '',
-            data_validade=post.data_validade
-            if hasattr(post, 'data_validade')
-            else datetime.utcnow(),
-            status=post.status if hasattr(post, 'status') else 0,
-            criado_em=post.criado_em
-            if hasattr(post, 'criado_em')
-            else datetime.utcnow(),
-            atualizado_em=post.atualizado_em
-            if hasattr(post, 'atualizado_em')
-            else datetime.utcnow(),
-        )
+        return cls.model_validate(post)
+
+
+post_list_serializer = ListSerializer(PostResponse)
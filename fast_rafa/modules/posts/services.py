@@ -1,138 +1,100 @@
-from sqlalchemy import func
-from sqlalchemy.orm import Query, Session, joinedload
+import csv
+import io
+import json
+from datetime import date, datetime, timedelta
+from typing import Optional
 
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
+
+from fast_rafa.core.database import ReadSessionLocal
 from fast_rafa.modules.categories.models import Category
 from fast_rafa.modules.categories_main.models import CategoryMain
 from fast_rafa.modules.favorites.models import Favorite
-from fast_rafa.modules.organizations.models import Organization
+from fast_rafa.modules.favorites.services import favorited_posts_query
 from fast_rafa.modules.posts.models import Post
-from fast_rafa.utils.funcs import formatar_data
+from fast_rafa.modules.posts.schemas import PostResponse
+from fast_rafa.utils.funcs import formatar_data, formatar_datas
 
 
-def add_likes_count(query: Query, db: Session) -> Query:
-    """Adiciona uma subquery para contar likes de cada post"""
-    likes_subquery = (
-        db.query(func.count(Favorite.id))
-        .filter(Favorite.id_postagem == Post.id)
+def count_likes_query():
+    """Total real de likes por post, usado na reconciliação do contador"""
+    return (
+        select(func.count(Favorite.id))
+        .where(Favorite.id_postagem == Post.id)
         .correlate(Post)
         .scalar_subquery()
-        .label('total_likes')
     )
 
-    return query.add_columns(likes_subquery)
 
+def reconcile_total_likes(db: Session) -> int:
+    """
+    Recalcula posts.total_likes a partir da tabela de favoritos, corrigindo
+    divergências (ex.: favoritos removidos em cascata com o usuário).
+    Retorna quantos posts foram corrigidos; o commit fica com quem chama.
+    """
+    likes = count_likes_query()
+    result = db.execute(
+        update(Post)
+        .where(Post.total_likes != likes)
+        .values(total_likes=likes)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
 
-def get_posts_by_organization(
-    db: Session,
-    user_organization_id: int,
-    user_id: int,
-    is_ngo: bool,
-    language: str = 'pt-BR',
-):
-    query = db.query(Post).join(Organization).join(Category)
-    if is_ngo:
-        governamental = True
-        query = query.filter(
-            Organization.nao_governamental == governamental,
-            user_organization_id != Organization.id,
-        )
-    else:
-        nao_governamental = False
-        query = query.filter(
-            Organization.nao_governamental == nao_governamental,
-            user_organization_id != Organization.id,
-        )
 
-    posts_with_likes = []
+def set_created_at_labels(posts: list, language: str):
+    """Formata a data de criação de uma página de posts em uma passada."""
+    labels = formatar_datas([post.criado_em for post in posts], language)
+    for post, label in zip(posts, labels):
+        post.criado_em_formatada = label
 
-    posts = (
+
+async def get_posts_by_id(
+    db: AsyncSession, post_id: int, user_id: int, language: str = 'pt-BR'
+):
+    query = select(Post).where(Post.id == post_id)
+
+    result = await db.scalars(
         query.options(
             joinedload(Post.organizations),
             joinedload(Post.categories),
             joinedload(Post.uploader),
         )
-        .offset(0)
-        .limit(5)
-        .all()
     )
+    post = result.unique().first()
 
-    favoritos = (
-        db.query(Favorite.id_postagem)
-        .filter(Favorite.id_usuario == user_id)
-        .all()
-    )
+    favoritos = await db.scalars(favorited_posts_query(user_id, [post_id]))
 
-    favoritos_set = {fav.id_postagem for fav in favoritos}
-
-    for post in posts:
-        total_likes = (
-            db.query(Favorite).filter(Favorite.id_postagem == post.id).count()
-        )
-        eh_favorito = 1 if post.id in favoritos_set else 0
-        post.criado_em_formatada = formatar_data(post.criado_em, language)
-        post.total_likes = total_likes
-        post.eh_favorito = eh_favorito
-
-        posts_with_likes.append(post)
-
-    return posts_with_likes
-
-
-def get_posts_by_id(
-    db: Session, post_id: int, user_id: int, language: str = 'pt-BR'
-):
-    query = db.query(Post).filter(Post.id == post_id)
-
-    post = query.options(
-        joinedload(Post.organizations),
-        joinedload(Post.categories),
-        joinedload(Post.uploader),
-    ).first()
-
-    favoritos = (
-        db.query(Favorite)
-        .filter(
-            Favorite.id_usuario == user_id, Favorite.id_postagem == post_id
-        )
-        .all()
-    )
-
-    favoritos_set = {fav.id_postagem for fav in favoritos}
+    favoritos_set = set(favoritos.all())
 
     if post:
-        total_likes = (
-            db.query(Favorite).filter(Favorite.id_postagem == post.id).count()
-        )
         post.criado_em_formatada = formatar_data(post.criado_em, language)
         eh_favorito = 1 if post.id in favoritos_set else 0
-        post.total_likes = total_likes
         post.eh_favorito = eh_favorito
     return post
 
 
-def get_posts_by_category_main(
-    db: Session,
+async def get_posts_by_category_main(
+    db: AsyncSession,
     category_slug: str,
     language: str = 'pt-BR',
     offset: int = 0,
     limit: int = 5,
 ):
-    category_main = (
-        db.query(CategoryMain)
-        .filter(CategoryMain.slug == category_slug)
-        .first()
+    category_main = await db.scalar(
+        select(CategoryMain).where(CategoryMain.slug == category_slug)
     )
     if not category_main:
         return []
 
-    categories = (
-        db.query(Category).filter(Category.id == category_main.id).all()
+    category_ids = await db.scalars(
+        select(Category.id).where(Category.id == category_main.id)
     )
-    category_ids = [category.id for category in categories]
 
-    query = db.query(Post).filter(Post.id_categoria.in_(category_ids))
-    query = add_likes_count(query, db)
-    posts = (
+    query = select(Post).where(Post.id_categoria.in_(category_ids.all()))
+    result = await db.scalars(
         query.options(
             joinedload(Post.organizations),
             joinedload(Post.categories),
@@ -141,22 +103,38 @@ def get_posts_by_category_main(
         .order_by(Post.criado_em.desc())
         .offset(offset)
         .limit(limit)
-        .all()
     )
+    posts = result.unique().all()
+
+    set_created_at_labels(posts, language)
+    return posts
 
-    if posts:
-        for post, total_likes in posts:
-            post.criado_em_formatada = formatar_data(post.criado_em, language)
-            post.total_likes = total_likes
 
-    return [post for post, _ in posts]
+async def set_posts_extras(
+    db: AsyncSession, posts: list, user_id: int, language: str = 'pt-BR'
+):
+    """Marca os favoritos do usuário e formata a data de criação."""
+    if not posts:
+        return posts
+
+    favoritos = await db.scalars(
+        favorited_posts_query(user_id, [post.id for post in posts])
+    )
+    favoritos_set = set(favoritos.all())
+
+    set_created_at_labels(posts, language)
+    for post in posts:
+        post.eh_favorito = 1 if post.id in favoritos_set else 0
 
+    return posts
 
-def get_posts_by_user(db: Session, user_id: int, language: str = 'pt-BR'):
-    query = db.query(Post).filter(Post.id_usuario == user_id)
-    query = add_likes_count(query, db)
 
-    posts = (
+async def get_posts_by_user(
+    db: AsyncSession, user_id: int, language: str = 'pt-BR'
+):
+    query = select(Post).where(Post.id_usuario == user_id)
+
+    result = await db.scalars(
         query.options(
             joinedload(Post.organizations),
             joinedload(Post.categories),
@@ -165,27 +143,19 @@ def get_posts_by_user(db: Session, user_id: int, language: str = 'pt-BR'):
         )
         .offset(0)
         .limit(5)
-        .all()
     )
+    posts = result.unique().all()
 
-    if posts:
-        for post, total_likes in posts:
-            post.criado_em_formatada = formatar_data(post.criado_em, language)
-            post.total_likes = total_likes
-
-    return [post for post, _ in posts]
+    set_created_at_labels(posts, language)
+    return posts
 
 
-def get_posts_favorite_by_user(
-    db: Session, user_id: int, language: str = 'pt-BR'
+async def get_posts_favorite_by_user(
+    db: AsyncSession, user_id: int, language: str = 'pt-BR'
 ):
-    query = (
-        db.query(Post).join(Favorite).filter(Favorite.id_usuario == user_id)
-    )
-
-    query = add_likes_count(query, db)
+    query = select(Post).join(Favorite).where(Favorite.id_usuario == user_id)
 
-    posts = (
+    result = await db.scalars(
         query.options(
             joinedload(Post.organizations),
             joinedload(Post.categories),
@@ -194,12 +164,76 @@ def get_posts_favorite_by_user(
         )
         .offset(0)
         .limit(5)
-        .all()
     )
+    posts = result.unique().all()
 
-    if posts:
-        for post, total_likes in posts:
-            post.criado_em_formatada = formatar_data(post.criado_em, language)
-            post.total_likes = total_likes
+    set_created_at_labels(posts, language)
+    return posts
 
-    return [post for post, _ in posts]
+
+EXPORT_BATCH_SIZE = 1000
+
+
+def build_posts_export_query(
+    status: Optional[int] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+):
+    """
+    Seleciona apenas as colunas de PostResponse, sem montar entidades do
+    ORM, filtrando por status e pelo intervalo de criação (inclusivo).
+    """
+    query = select(*[
+        getattr(Post, field) for field in PostResponse.model_fields
+    ])
+    if status is not None:
+        query = query.where(Post.status == status)
+    if start_date:
+        query = query.where(Post.criado_em >= start_date)
+    if end_date:
+        query = query.where(Post.criado_em < end_date + timedelta(days=1))
+    return query.order_by(Post.id)
+
+
+def export_value(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def stream_posts_export(query, export_format: str):
+    """
+    Gera a exportação em blocos de EXPORT_BATCH_SIZE linhas lidas com
+    yield_per (cursor do lado do servidor no Postgres), para que a memória
+    não cresça com o tamanho da tabela.
+
+    A sessão é aberta aqui, e não recebida da rota, porque o gerador
+    continua rodando depois que as dependências da requisição terminam.
+    """
+    with ReadSessionLocal() as session:
+        result = session.execute(
+            query.execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        columns = list(result.keys())
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if export_format == 'csv':
+            writer.writerow(columns)
+
+        for rows in result.partitions():
+            for row in rows:
+                values = [export_value(value) for value in row]
+                if export_format == 'csv':
+                    writer.writerow(values)
+                else:
+                    buffer.write(json.dumps(dict(zip(columns, values))))
+                    buffer.write('\n')
+
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+        # Sem nenhuma linha, o CSV ainda devolve o cabeçalho
+        if buffer.tell():
+            yield buffer.getvalue()
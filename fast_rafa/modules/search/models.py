@@ -0,0 +1,71 @@
+from sqlalchemy import DDL, event
+
+from fast_rafa.modules.posts.models import Post
+
+# Configuração de texto do Postgres (stemming em português)
+SEARCH_CONFIG = 'portuguese'
+# Coluna tsvector gerada em posts (somente Postgres, fora do ORM)
+SEARCH_COLUMN = 'busca'
+# Tabela FTS5 espelhando titulo e descricao (somente SQLite)
+SEARCH_TABLE = 'posts_fts'
+
+POSTGRES_DDL = (
+    f'ALTER TABLE posts ADD COLUMN IF NOT EXISTS {SEARCH_COLUMN} tsvector '
+    'GENERATED ALWAYS AS ('
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(titulo, '')), 'A')"
+    ' || '
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(descricao, '')), 'B')"
+    ') STORED',
+    f'CREATE INDEX IF NOT EXISTS ix_posts_{SEARCH_COLUMN} '
+    f'ON posts USING gin ({SEARCH_COLUMN})',
+)
+
+SQLITE_DDL = (
+    f'CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} '
+    "USING fts5(titulo, descricao, content='posts', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    f'CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_ai AFTER INSERT ON posts '
+    f'BEGIN INSERT INTO {SEARCH_TABLE}(rowid, titulo, descricao) '
+    'VALUES (new.id, new.titulo, new.descricao); END',
+    f'CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_ad AFTER DELETE ON posts '
+    f'BEGIN INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, titulo, '
+    "descricao) VALUES ('delete', old.id, old.titulo, old.descricao); END",
+    f'CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_au '
+    'AFTER UPDATE OF titulo, descricao ON posts '
+    f'BEGIN INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, titulo, '
+    "descricao) VALUES ('delete', old.id, old.titulo, old.descricao); "
+    f'INSERT INTO {SEARCH_TABLE}(rowid, titulo, descricao) '
+    'VALUES (new.id, new.titulo, new.descricao); END',
+)
+
+
+def is_search_object(name: str, type_: str) -> bool:
+    """
+    Indica se o objeto pertence à busca textual. Essas estruturas são
+    criadas à mão na migração e ficam fora da comparação do autogenerate.
+    """
+    if type_ == 'table':
+        return name.startswith(SEARCH_TABLE)
+    return name in {SEARCH_COLUMN, f'ix_posts_{SEARCH_COLUMN}'}
+
+
+# Cria as estruturas junto com a tabela posts no create_all (testes)
+for statement in POSTGRES_DDL:
+    event.listen(
+        Post.__table__,
+        'after_create',
+        DDL(statement).execute_if(dialect='postgresql'),
+    )
+
+for statement in SQLITE_DDL:
+    event.listen(
+        Post.__table__,
+        'after_create',
+        DDL(statement).execute_if(dialect='sqlite'),
+    )
+
+event.listen(
+    Post.__table__,
+    'after_drop',
+    DDL(f'DROP TABLE IF EXISTS {SEARCH_TABLE}').execute_if(dialect='sqlite'),
+)
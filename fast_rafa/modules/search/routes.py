@@ -0,0 +1,28 @@
+from http import HTTPStatus
+
+from fastapi import APIRouter, Depends, Query
+
+from fast_rafa.core.security import get_current_user
+from fast_rafa.modules.search.schemas import AutocompleteItem
+from fast_rafa.modules.search.services import autocomplete
+
+router = APIRouter()
+
+
+@router.get(
+    '/', status_code=HTTPStatus.OK, response_model=list[AutocompleteItem]
+)
+async def read_autocomplete(
+    q: str,
+    limit: int = Query(10, ge=1, le=50),
+    current_user=Depends(get_current_user),
+):
+    """
+    Sugestões de organizações, categorias e eventos para a busca
+    conforme o usuário digita.
+    """
+    results = await autocomplete(q, limit)
+    return [
+        AutocompleteItem(tipo=tipo, id=item_id, nome=nome, detalhe=detalhe)
+        for tipo, item_id, nome, detalhe in results
+    ]
@@ -0,0 +1,11 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel
+
+
+class AutocompleteItem(BaseModel):
+    tipo: Literal['organizacao', 'categoria', 'evento']
+    id: int
+    nome: str
+    # Cidade da organização ou slug da categoria/evento
+    detalhe: Optional[str] = None
@@ -0,0 +1,198 @@
+import asyncio
+import re
+
+from sqlalchemy import (
+    cast,
+    column,
+    func,
+    literal_column,
+    select,
+    table,
+    text,
+)
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
+
+from fast_rafa.core.database import AsyncReadSessionLocal
+from fast_rafa.core.logger import setup_logger
+from fast_rafa.core.prefix_index import PrefixIndex
+from fast_rafa.core.settings import settings
+from fast_rafa.modules.categories.models import Category
+from fast_rafa.modules.events.models import Event
+from fast_rafa.modules.organizations.models import Organization
+from fast_rafa.modules.posts.models import Post
+from fast_rafa.modules.search.models import (
+    SEARCH_COLUMN,
+    SEARCH_CONFIG,
+    SEARCH_TABLE,
+)
+
+logger = setup_logger()
+
+# Palavras sem o sublinhado, que os dois parsers tratam como separador
+_TOKEN = re.compile(r'[^\W_]+')
+# Pesos do bm25 por coluna do FTS5 (titulo, descricao), como A/B no Postgres
+_FTS5_WEIGHTS = (10.0, 1.0)
+
+# Organizações (nome e cidade), categorias e eventos para o autocomplete.
+# Valores: (tipo, id, nome, detalhe)
+autocomplete_index = PrefixIndex()
+
+
+class IndexRebuild:
+    """
+    Reconstrói o índice de autocomplete fora da requisição, uma vez por
+    vez: chamadas concorrentes recebem a mesma tarefa, e as consultas
+    seguem usando a versão anterior até a nova ficar pronta.
+    """
+
+    def __init__(self, index: PrefixIndex):
+        self.index = index
+        self.task = None
+
+    def schedule(self) -> asyncio.Task:
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.run())
+        return self.task
+
+    async def run(self):
+        generation = self.index.generation
+        try:
+            async with AsyncReadSessionLocal() as db:
+                entries = await load_autocomplete_entries(db)
+        except Exception as e:
+            logger.warning(f'Índice de autocomplete não carregado: {e}')
+            return
+        self.index.build(entries, generation)
+
+
+autocomplete_rebuild = IndexRebuild(autocomplete_index)
+
+
+def build_fts5_match(term: str) -> str:
+    """
+    Converte o termo digitado em uma expressão MATCH do FTS5: cada palavra
+    vira um prefixo entre aspas, o que evita erros de sintaxe com
+    caracteres especiais e aproxima o stemming do Postgres.
+    """
+    return ' '.join(f'"{token}"*' for token in _TOKEN.findall(term))
+
+
+def build_tsquery(term: str) -> str:
+    """
+    Expressão do to_tsquery equivalente à do FTS5: todas as palavras, cada
+    uma como prefixo (:*), para os dois bancos darem o mesmo resultado.
+    """
+    return ' & '.join(f'{token}:*' for token in _TOKEN.findall(term))
+
+
+def search_posts_query(dialect_name: str, term: str):
+    """
+    Consulta dos posts ativos que casam com o termo, ordenados por
+    relevância. Usa o tsvector com índice GIN no Postgres e a tabela FTS5
+    no SQLite. Retorna None quando o termo não tem palavras.
+    """
+    if not _TOKEN.search(term):
+        return None
+
+    query = select(Post).where(Post.status == 1)
+
+    if dialect_name == 'postgresql':
+        tsquery = func.to_tsquery(
+            cast(SEARCH_CONFIG, REGCONFIG), build_tsquery(term)
+        )
+        busca = literal_column(f'posts.{SEARCH_COLUMN}')
+        return query.where(busca.op('@@')(tsquery)).order_by(
+            func.ts_rank(busca, tsquery).desc(), Post.id
+        )
+
+    fts = table(SEARCH_TABLE, column('rowid'))
+    return (
+        query.join(fts, fts.c.rowid == Post.id)
+        .where(text(f'{SEARCH_TABLE} MATCH :match'))
+        .params(match=build_fts5_match(term))
+        .order_by(
+            func.bm25(literal_column(SEARCH_TABLE), *_FTS5_WEIGHTS), Post.id
+        )
+    )
+
+
+def search_posts(
+    db: Session, term: str, offset: int = 0, limit: int = 10
+) -> list:
+    query = search_posts_query(db.get_bind().dialect.name, term)
+    if query is None:
+        return []
+
+    result = db.scalars(query.offset(offset).limit(limit))
+    return result.unique().all()
+
+
+async def search_posts_async(
+    db: AsyncSession, term: str, offset: int = 0, limit: int = 10
+) -> list:
+    query = search_posts_query(db.get_bind().dialect.name, term)
+    if query is None:
+        return []
+
+    result = await db.scalars(
+        query.options(
+            joinedload(Post.organizations),
+            joinedload(Post.categories),
+            joinedload(Post.uploader),
+        )
+        .offset(offset)
+        .limit(limit)
+    )
+    return result.unique().all()
+
+
+def invalidate_autocomplete():
+    autocomplete_index.invalidate()
+
+
+async def load_autocomplete_entries(db: AsyncSession) -> list:
+    entries = []
+
+    organizations = await db.execute(
+        select(Organization.id, Organization.nome, Organization.cidade)
+    )
+    for organization_id, nome, cidade in organizations:
+        value = ('organizacao', organization_id, nome, cidade)
+        entries.extend([(nome, value), (cidade, value)])
+
+    categories = await db.execute(
+        select(Category.id, Category.categoria, Category.slug)
+    )
+    entries.extend(
+        (categoria, ('categoria', category_id, categoria, slug))
+        for category_id, categoria, slug in categories
+    )
+
+    events = await db.execute(select(Event.id, Event.titulo, Event.slug))
+    entries.extend(
+        (titulo, ('evento', event_id, titulo, slug))
+        for event_id, titulo, slug in events
+    )
+
+    return entries
+
+
+async def autocomplete(term: str, limit: int = 10):
+    """
+    Sugestões cujo nome (ou cidade, para organizações) começa com o termo,
+    sem diferenciar acentos. O índice só vai ao banco quando foi
+    invalidado por uma escrita ou expirou, e a reconstrução roda em
+    segundo plano; só a primeira montagem é esperada pela requisição.
+    """
+    if autocomplete_index.expired(settings.AUTOCOMPLETE_INDEX_TTL):
+        rebuild = autocomplete_rebuild.schedule()
+        if not autocomplete_index.built:
+            await asyncio.shield(rebuild)
+    return autocomplete_index.search(term, limit)
+
+
+async def warm_autocomplete_index():
+    """Monta o índice na inicialização da aplicação."""
+    await autocomplete_rebuild.schedule()
@@ -0,0 +1,195 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from http import HTTPStatus
+from pathlib import Path
+from typing import Optional
+
+from fastapi import HTTPException, UploadFile
+from PIL import Image, ImageOps
+from starlette.concurrency import run_in_threadpool
+
+from fast_rafa.core.logger import setup_logger
+from fast_rafa.core.settings import settings
+
+STATIC_DIR = Path('fast_rafa/static')
+UPLOAD_DIR = STATIC_DIR / 'img/uploads/profile_images'
+ALLOWED_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
+CHUNK_SIZE = 1024 * 1024
+
+# Derivados gerados para cada imagem: nome -> maior lado em pixels.
+# O arquivo fica ao lado do original: <hash>.<nome>.webp
+IMAGE_VARIANTS = {'avatar': 96, 'card': 480, 'full': 1280}
+DEFAULT_VARIANT = 'full'
+WEBP_QUALITY = 80
+
+logger = setup_logger()
+
+
+@lru_cache(maxsize=1)
+def get_image_executor() -> ProcessPoolExecutor:
+    """Pool de processos do redimensionamento, criado no primeiro uso."""
+    return ProcessPoolExecutor(max_workers=settings.IMAGE_WORKERS)
+
+
+def shutdown_image_executor(wait: bool = True):
+    """Encerra o pool; o próximo uso cria outro."""
+    if get_image_executor.cache_info().currsize:
+        get_image_executor().shutdown(wait=wait, cancel_futures=True)
+        get_image_executor.cache_clear()
+
+
+def validate_image(file: UploadFile) -> str:
+    """Confere tipo, extensão e tamanho declarado; retorna a extensão."""
+    if not (file.content_type or '').startswith('image/'):
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail='O arquivo deve ser uma imagem',
+        )
+
+    extension = Path(file.filename or '').suffix.lower()
+    if extension not in ALLOWED_EXTENSIONS:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail='Formato de arquivo não permitido',
+        )
+
+    if file.size is not None and file.size > settings.UPLOAD_MAX_BYTES:
+        raise_too_large()
+    return extension
+
+
+def raise_too_large():
+    limit = settings.UPLOAD_MAX_BYTES // (1024 * 1024)
+    raise HTTPException(
+        status_code=HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+        detail=f'A imagem deve ter no máximo {limit} MB',
+    )
+
+
+def write_upload(source, directory: Path, extension: str) -> Optional[Path]:
+    """
+    Copia o arquivo em blocos para um temporário, calculando o hash do
+    conteúdo, e renomeia para <hash><extensão>. Arquivos idênticos caem no
+    mesmo nome, então o segundo envio só descarta o temporário. Retorna
+    None quando o limite de tamanho é ultrapassado.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+
+    with tempfile.NamedTemporaryFile(
+        dir=directory, suffix='.part', delete=False
+    ) as buffer:
+        while chunk := source.read(CHUNK_SIZE):
+            size += len(chunk)
+            if size > settings.UPLOAD_MAX_BYTES:
+                break
+            digest.update(chunk)
+            buffer.write(chunk)
+
+    if size > settings.UPLOAD_MAX_BYTES:
+        os.remove(buffer.name)
+        return None
+
+    path = directory / f'{digest.hexdigest()}{extension}'
+    if path.exists():
+        os.remove(buffer.name)
+    else:
+        # O temporário nasce com permissão 0600; o arquivo é público
+        os.chmod(buffer.name, 0o644)
+        os.replace(buffer.name, path)
+    return path
+
+
+def variant_path(path: Path, name: str) -> Path:
+    return path.with_name(f'{path.stem}.{name}.webp')
+
+
+def build_derivatives(path: str) -> list:
+    """
+    Executado no pool de processos: gera as versões WebP redimensionadas
+    da imagem. Derivados já existentes (mesmo hash) são reaproveitados.
+    """
+    source = Path(path)
+    pending = {
+        name: size
+        for name, size in IMAGE_VARIANTS.items()
+        if not variant_path(source, name).exists()
+    }
+    if pending:
+        with Image.open(source) as original:
+            image = ImageOps.exif_transpose(original)
+            if image.mode not in {'RGB', 'RGBA'}:
+                image = image.convert('RGBA')
+            for name, size in pending.items():
+                resized = image.copy()
+                resized.thumbnail((size, size))
+                resized.save(
+                    variant_path(source, name),
+                    'WEBP',
+                    quality=WEBP_QUALITY,
+                    method=6,
+                )
+    return list(IMAGE_VARIANTS)
+
+
+def static_url_path(path: Path) -> str:
+    return '/' + path.relative_to(STATIC_DIR).as_posix()
+
+
+async def store_image(file: UploadFile, directory: Path = UPLOAD_DIR):
+    """
+    Salva a imagem enviada e gera os derivados. Retorna o caminho que vai
+    para o banco (o derivado 'full', ou o original se o pool de processos
+    falhar) e o caminho de cada derivado.
+    """
+    extension = validate_image(file)
+    await file.seek(0)
+    path = await run_in_threadpool(
+        write_upload, file.file, directory, extension
+    )
+    if path is None:
+        raise_too_large()
+
+    loop = asyncio.get_running_loop()
+    try:
+        names = await loop.run_in_executor(
+            get_image_executor(), build_derivatives, str(path)
+        )
+    except BrokenProcessPool:
+        # Um processo do pool morreu (ex.: falta de memória): o pool
+        # quebrado é descartado e a imagem fica só com o original
+        logger.error(
+            f'Pool de imagens quebrado; derivados de {path.name} '
+            'não gerados'
+        )
+        shutdown_image_executor(wait=False)
+        return static_url_path(path), {}
+    except (OSError, Image.DecompressionBombError):
+        logger.warning(f'Imagem inválida descartada: {path.name}')
+        await run_in_threadpool(path.unlink, missing_ok=True)
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail='O arquivo deve ser uma imagem',
+        )
+
+    variants = {
+        name: static_url_path(variant_path(path, name)) for name in names
+    }
+    return variants[DEFAULT_VARIANT], variants
+
+
+def image_variant(url: Optional[str], name: str) -> Optional[str]:
+    """
+    Helper dos templates: troca o derivado 'full' salvo no banco pelo
+    tamanho pedido. URLs antigas (sem derivados) voltam sem alteração.
+    """
+    suffix = f'.{DEFAULT_VARIANT}.webp'
+    if url and url.endswith(suffix):
+        return f'{url[: -len(suffix)]}.{name}.webp'
+    return url
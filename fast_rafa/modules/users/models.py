@@ -10,6 +10,7 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
 )
@@ -74,6 +75,8 @@ class User:
         nullable=False,
     )
 
+    __table_args__ = (Index('ix_users_id_organizacao', 'id_organizacao'),)
+
     favorites = relationship(
         'Favorite', back_populates='user', cascade='all, delete-orphan'
     )
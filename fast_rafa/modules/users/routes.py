@@ -1,4 +1,3 @@
-import os
 import re
 from http import HTTPStatus
 
@@ -9,14 +8,16 @@ from fastapi import (
     Request,
     UploadFile,
 )
+from fastapi.responses import JSONResponse
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from fast_rafa.core.database import get_session
+from fast_rafa.core.database import get_read_session, get_session
 from fast_rafa.core.logger import setup_logger
 from fast_rafa.core.security import (
     get_current_user,
-    get_password_hash,
+    get_password_hash_async,
+    invalidate_cached_user,
 )
 from fast_rafa.modules.deliveries.models import Delivery
 from fast_rafa.modules.events.models import Event
@@ -24,7 +25,11 @@ from fast_rafa.modules.favorites.models import Favorite
 from fast_rafa.modules.messages.models import Message
 from fast_rafa.modules.organizations.models import Organization
 from fast_rafa.modules.posts.models import Post
-from fast_rafa.modules.posts.schemas import PostResponse
+from fast_rafa.modules.posts.schemas import (
+    PostResponse,
+    post_list_serializer,
+)
+from fast_rafa.modules.uploads.services import store_image
 from fast_rafa.modules.users.models import User
 from fast_rafa.modules.users.schemas import (
     CreateUser,
@@ -32,6 +37,8 @@ from fast_rafa.modules.users.schemas import (
     UpdateUserRequest,
     UpdateUserResponse,
     UserResponse,
+    user_home_serializer,
+    user_profile_serializer,
 )
 from fast_rafa.modules.watchlists.models import Watchlist
 from fast_rafa.utils.error_messages import (
@@ -42,26 +49,11 @@ from fast_rafa.utils.error_messages import (
     get_unexpected_error_message,
     get_update_error_message,
 )
+from fast_rafa.utils.pagination import NEXT_CURSOR_HEADER, CursorPage
 from fast_rafa.utils.sel import check_related_models, get_by_sel
 
 router = APIRouter()
 
-UPLOAD_FOLDER = 'uploads/profile_images'
-
-
-def allowed_file(filename: str) -> bool:
-    ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif'}
-    return (
-        '.' in filename
-        and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
-    )
-
-
-def secure_filename(filename):
-    filename = re.sub(r'[^a-zA-Z0-9_.-]', '_', filename)
-    return filename
-
-
 logger = setup_logger()
 
 
@@ -89,23 +81,7 @@ async def create_user(
         logger.info(
             f'Processando upload da imagem de perfil: {imagem_perfil.filename}'
         )
-        if not allowed_file(imagem_perfil.filename):
-            raise HTTPException(
-                status_code=HTTPStatus.BAD_REQUEST,
-                detail='Formato de arquivo não permitido',
-            )
-
-        filename = secure_filename(imagem_perfil.filename)
-        filepath = os.path.join(UPLOAD_FOLDER, filename)
-
-        if not os.path.exists(UPLOAD_FOLDER):
-            os.makedirs(UPLOAD_FOLDER)
-
-        # Salvar imagem no diretório especificado
-        with open(filepath, 'wb') as f:
-            f.write(imagem_perfil.file.read())
-
-        user_data.url_imagem_perfil = filepath
+        user_data.url_imagem_perfil, _ = await store_image(imagem_perfil)
     else:
         user_data.url_imagem_perfil = None
 
@@ -126,7 +102,7 @@ async def create_user(
         )
 
     # Hash da senha
-    senha_hash = get_password_hash(user_data.senha_hash)
+    senha_hash = await get_password_hash_async(user_data.senha_hash)
     user_data.senha_hash = senha_hash
 
     # Criar novo usuário
@@ -170,17 +146,12 @@ async def create_user(
     '/home', status_code=HTTPStatus.OK, response_model=list[UserResponse]
 )
 def read_users_home(
-    skip: int = 0,
-    limit: int = 10,
-    db: Session = Depends(get_session),
+    page: CursorPage = Depends(),
+    db: Session = Depends(get_read_session),
     current_user=Depends(get_current_user),
 ):
-    usuarios = (
-        get_by_sel(db, User, current_user.id, filters={})
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    query = get_by_sel(db, User, current_user.id, filters={})
+    usuarios, next_cursor = page.split(page.apply(query, User).all())
 
     if not usuarios:
         raise HTTPException(
@@ -188,25 +159,20 @@ def read_users_home(
             detail=get_not_found_message('Nenhum usuário'),
         )
 
-    users = [UserResponse.from_home(usuario) for usuario in usuarios]
-    return users
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return user_home_serializer.response(usuarios, headers)
 
 
 @router.get(
     '/profile', status_code=HTTPStatus.OK, response_model=list[UserResponse]
 )
 def read_users_profile(
-    skip: int = 0,
-    limit: int = 10,
-    db: Session = Depends(get_session),
+    page: CursorPage = Depends(),
+    db: Session = Depends(get_read_session),
     current_user=Depends(get_current_user),
 ):
-    usuarios = (
-        get_by_sel(db, User, current_user.id, filters={})
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    query = get_by_sel(db, User, current_user.id, filters={})
+    usuarios, next_cursor = page.split(page.apply(query, User).all())
 
     if not usuarios:
         raise HTTPException(
@@ -214,23 +180,18 @@ def read_users_profile(
             detail=get_not_found_message('Nenhum usuário'),
         )
 
-    users = [UserResponse.from_profile(usuario) for usuario in usuarios]
-    return users
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return user_profile_serializer.response(usuarios, headers)
 
 
 @router.get('/full', status_code=HTTPStatus.OK, response_model=dict)
 def read_users_full(
-    skip: int = 0,
-    limit: int = 10,
-    db: Session = Depends(get_session),
+    page: CursorPage = Depends(),
+    db: Session = Depends(get_read_session),
     current_user=Depends(get_current_user),
 ):
-    usuarios = (
-        get_by_sel(db, User, current_user.id, filters={})
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    query = get_by_sel(db, User, current_user.id, filters={})
+    usuarios, next_cursor = page.split(page.apply(query, User).all())
 
     if not usuarios:
         raise HTTPException(
@@ -238,8 +199,10 @@ def read_users_full(
             detail=get_not_found_message('Nenhum usuário'),
         )
 
-    users = [UserResponse.from_home(usuario) for usuario in usuarios]
-    return {'users': users}
+    return JSONResponse({
+        'users': user_home_serializer.to_python(usuarios),
+        'next_cursor': next_cursor,
+    })
 
 
 @router.get(
@@ -247,7 +210,7 @@ def read_users_full(
 )
 def read_user_by_id(
     user_id: int,
-    db: Session = Depends(get_session),
+    db: Session = Depends(get_read_session),
     current_user=Depends(get_current_user),
 ):
     usuario = get_by_sel(
@@ -275,7 +238,7 @@ def read_user_by_id(
 )
 def read_user_by_email(
     user_email: str,
-    db: Session = Depends(get_session),
+    db: Session = Depends(get_read_session),
     current_user=Depends(get_current_user),
 ):
     usuario = get_by_sel(
@@ -305,24 +268,19 @@ def read_user_by_email(
 )
 def read_user_by_id_organization(
     id_organizacao: int,
-    skip: int = 0,
-    limit: int = 10,
-    db: Session = Depends(get_session),
+    page: CursorPage = Depends(),
+    db: Session = Depends(get_read_session),
     current_user=Depends(get_current_user),
 ):
-    usuarios = (
-        get_by_sel(
-            db,
-            User,
-            current_user.id,
-            filters={
-                'filter_plus': {'id_organizacao': id_organizacao},
-            },
-        )
-        .offset(skip)
-        .limit(limit)
-        .all()
+    query = get_by_sel(
+        db,
+        User,
+        current_user.id,
+        filters={
+            'filter_plus': {'id_organizacao': id_organizacao},
+        },
     )
+    usuarios, next_cursor = page.split(page.apply(query, User).all())
 
     if not usuarios:
         raise HTTPException(
@@ -330,11 +288,10 @@ def read_user_by_id_organization(
             detail=get_not_found_message('Usuário'),
         )
 
-    user_by_id_organization = [
-        UserResponse.from_home(usuario) for usuario in usuarios
-    ]
-
-    return {'users': user_by_id_organization}
+    return JSONResponse({
+        'users': user_home_serializer.to_python(usuarios),
+        'next_cursor': next_cursor,
+    })
 
 
 @router.get(
@@ -346,7 +303,7 @@ def read_posts_by_user(
     user_id: int,
     skip: int = 0,
     limit: int = 10,
-    db: Session = Depends(get_session),
+    db: Session = Depends(get_read_session),
 ):
     usuario = get_by_sel(
         db,
@@ -368,11 +325,7 @@ def read_posts_by_user(
         .all()
     )
 
-    if not posts:
-        posts = []
-
-    postagens_resposta = [PostResponse.from_home(post) for post in posts]
-    return postagens_resposta
+    return post_list_serializer.response(posts)
 
 
 @router.patch('/{user_id}/status', status_code=HTTPStatus.OK)
@@ -412,6 +365,7 @@ def update_status(
 
     try:
         db.commit()
+        invalidate_cached_user(current_user.username)
         db.refresh(current_user)
     except Exception as e:
         db.rollback()
@@ -461,10 +415,11 @@ async def update_user(
     if 'senha_hash' in update_data:
         senha = update_data['senha_hash']
         if senha:
-            update_data['senha_hash'] = get_password_hash(senha)
+            update_data['senha_hash'] = await get_password_hash_async(senha)
         else:
             update_data.pop('senha_hash')
 
+    username_anterior = current_user.username
     usuario = User.update(current_user, update_data)
 
     print('Updated user:', usuario)
@@ -479,6 +434,7 @@ async def update_user(
         for key, value in update_data.items():
             setattr(usuario, key, value)
         db.commit()
+        invalidate_cached_user(username_anterior, usuario.username)
         db.refresh(usuario)
     except IntegrityError as e:
         db.rollback()
@@ -539,6 +495,7 @@ def delete_user(
         related_models=related_models,
     )
 
+    username = current_user.username
     try:
         if tem_vinculos_impeditivos:
             current_user.eh_deletado = True
@@ -547,6 +504,7 @@ def delete_user(
             db.delete(current_user)
 
         db.commit()
+        invalidate_cached_user(username)
 
         if tem_vinculos_impeditivos:
             db.refresh(current_user)
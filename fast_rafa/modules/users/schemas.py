@@ -3,9 +3,17 @@ import re
 from datetime import date, datetime
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr, constr, validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    EmailStr,
+    computed_field,
+    constr,
+    validator,
+)
 
 from fast_rafa.core.logger import setup_logger
+from fast_rafa.utils.serializers import ListSerializer
 
 logger = setup_logger()
 
@@ -204,59 +212,85 @@ class UserResponse(BaseModel):
     aniversario: Optional[date] = None
     sexo: Optional[SexoEnum] = None
 
+    model_config = ConfigDict(from_attributes=True)
+
     @classmethod
     def from_home(cls, usuario):
-        url_imagem = (
-            usuario.url_imagem_perfil if usuario.url_imagem_perfil else ''
-        )
-        return cls(
-            id=usuario.id,
-            primeiro_nome=usuario.primeiro_nome,
-            sobrenome=getattr(usuario, 'sobrenome', 'Nome não disponível'),
-            email=usuario.email,
-            url_imagem_perfil=url_imagem,
-            id_organizacao=usuario.id_organizacao
-            if hasattr(usuario, 'id_organizacao')
-            else None,
-            eh_deletado=usuario.eh_deletado
-            if hasattr(usuario, 'eh_deletado')
-            else False,
-            eh_voluntario=usuario.eh_voluntario
-            if hasattr(usuario, 'eh_voluntario')
-            else False,
-            eh_gerente=usuario.eh_gerente
-            if hasattr(usuario, 'eh_gerente')
-            else False,
-        )
+        return UserHomeResponse.model_validate(usuario)
 
     @classmethod
     def from_profile(cls, usuario):
-        url_imagem = (
-            usuario.url_imagem_perfil if usuario.url_imagem_perfil else ''
-        )
-        return cls(
-            id=usuario.id,
-            id_organizacao=usuario.id_organizacao,
-            eh_deletado=usuario.eh_deletado,
-            eh_voluntario=usuario.eh_voluntario,
-            eh_gerente=usuario.eh_gerente,
-            primeiro_nome=usuario.primeiro_nome,
-            sobrenome=usuario.sobrenome,
-            email=usuario.email,
-            telefone=usuario.telefone,
-            url_imagem_perfil=url_imagem,
-        )
+        return UserProfileResponse.model_validate(usuario)
 
     @validator('telefone', pre=False, always=True)
     def format_phone(cls, value: Optional[str]) -> Optional[str]:
-        mdez = 10
-        monze = 11
-        if value and len(value) == monze:
-            return f'({value[:2]}) {value[2:7]}-{value[7:]}'
-        elif value and len(value) == mdez:
-            return f'({value[:2]}) {value[2:6]}-{value[6:]}'
-        return value
+        return format_phone(value)
+
+
+def format_phone(value: Optional[str]) -> Optional[str]:
+    mdez = 10
+    monze = 11
+    if value and len(value) == monze:
+        return f'({value[:2]}) {value[2:7]}-{value[7:]}'
+    elif value and len(value) == mdez:
+        return f'({value[:2]}) {value[2:6]}-{value[6:]}'
+    return value
+
+
+def hidden_field():
+    """Campo que sai sempre como null, sem ler o atributo do objeto."""
+    return computed_field(property(lambda self: None), return_type=None)
 
 
 class UpdateUserResponse(UserResponse):
     pass
+
+
+class UserListResponse(BaseModel):
+    """
+    Campos comuns às listagens de usuários. Só estes são lidos do objeto;
+    os dados pessoais sensíveis saem como null.
+    """
+
+    id: int
+    primeiro_nome: str
+    sobrenome: str
+    email: str
+    url_imagem_perfil: str = ''
+    id_organizacao: Optional[int]
+    eh_deletado: bool
+    eh_voluntario: bool
+    eh_gerente: bool
+
+    model_config = ConfigDict(from_attributes=True)
+
+    lgbtq = hidden_field()
+    deficiencia_auditiva = hidden_field()
+    deficiencia_cognitiva = hidden_field()
+    usa_cadeira_rodas = hidden_field()
+    aniversario = hidden_field()
+    sexo = hidden_field()
+
+    @validator('url_imagem_perfil', pre=True, always=True)
+    def default_image(cls, value: Optional[str]) -> str:
+        return value or ''
+
+
+class UserProfileResponse(UserListResponse):
+    """Usuário nas listagens de perfil, com o telefone."""
+
+    telefone: Optional[str] = None
+
+    @validator('telefone', pre=False, always=True)
+    def format_phone(cls, value: Optional[str]) -> Optional[str]:
+        return format_phone(value)
+
+
+class UserHomeResponse(UserListResponse):
+    """Usuário nas listagens da home: também sem o telefone."""
+
+    telefone = hidden_field()
+
+
+user_home_serializer = ListSerializer(UserHomeResponse)
+user_profile_serializer = ListSerializer(UserProfileResponse)
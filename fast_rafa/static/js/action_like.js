@@ -32,31 +32,33 @@ document.addEventListener('DOMContentLoaded', function () {
                 }
 
                 const isCurrentlyLiked = likeIcon.classList.contains('fas');
-                const url = isCurrentlyLiked
-                    ? `/api/v1/favorites/${postId}`
-                    : `/api/v1/favorites/${userId}/${postId}`;
 
-                const method = isCurrentlyLiked ? 'DELETE' : 'POST';
-
-                const response = await fetch(url, {
-                    method: method,
+                // Rota em lote: curtir e descurtir usam a mesma chamada
+                const response = await fetch(`/api/v1/favorites/${userId}/batch`, {
+                    method: 'POST',
                     headers: {
                         'Content-Type': 'application/json',
-                    }
+                    },
+                    body: JSON.stringify({
+                        operacoes: [
+                            { id_postagem: parseInt(postId), curtido: !isCurrentlyLiked },
+                        ],
+                    }),
                 });
 
                 if (response.ok) {
                     const data = await response.json();
+                    const totalLikes = data.total_likes[postId] ?? 0;
 
                     // Atualiza o ícone
                     likeIcon.classList.toggle('far');
                     likeIcon.classList.toggle('fas');
 
                     // Atualiza o contador com o número exato de likes
-                    likesCount.textContent = data.total_likes;
+                    likesCount.textContent = totalLikes;
 
                     // Atualiza também o like na listagem e no modal, se existirem
-                    updateRelatedLikeButtons(postId, data.total_likes, isCurrentlyLiked);
+                    updateRelatedLikeButtons(postId, totalLikes, isCurrentlyLiked);
                 } else {
                     const errorData = await response.json();
                     showFeedback(`Erro: ${errorData.detail}`);
@@ -113,38 +115,39 @@ document.addEventListener('DOMContentLoaded', function () {
         }
     });
 
-    // Função para verificar status inicial de like
+    // Função para verificar status inicial de like: uma única consulta
+    // com todos os posts da página
     async function checkInitialLikeStatus() {
-        likeButtons.forEach(async (likeButton) => {
-            let postId = likeButton.dataset.postId;
-            let userId = likeButton.dataset.userId;
-
-            // Se não encontrar, tenta buscar do modal
-            if (!postId || !userId) {
-                const modalImage = document.getElementById('modal-large-image');
-                if (modalImage) {
-                    postId = modalImage.dataset.postid;
-                    userId = modalImage.dataset.userid;
-                }
-            }
-
-            const likeIcon = likeButton.querySelector('i');
-
-            try {
-                const response = await fetch(`/api/v1/favorites/user/${userId}`);
-                if (response.ok) {
-                    const favorites = await response.json();
-                    const isLiked = favorites.some(fav => fav.id_postagem === parseInt(postId));
+        const buttons = [...likeButtons].filter(
+            (button) => button.dataset.postId && button.dataset.userId
+        );
+        if (!buttons.length) {
+            return;
+        }
 
-                    if (isLiked) {
+        const userId = buttons[0].dataset.userId;
+        const params = new URLSearchParams();
+        new Set(buttons.map((button) => button.dataset.postId)).forEach(
+            (postId) => params.append('ids', postId)
+        );
+
+        try {
+            const response = await fetch(`/api/v1/favorites/${userId}/status?${params}`);
+            if (response.ok) {
+                const data = await response.json();
+                const favorites = new Set(data.favoritos.map(String));
+
+                buttons.forEach((button) => {
+                    if (favorites.has(button.dataset.postId)) {
+                        const likeIcon = button.querySelector('i');
                         likeIcon.classList.remove('far');
                         likeIcon.classList.add('fas');
                     }
-                }
-            } catch (error) {
-                console.error('Erro ao verificar status de like:', error);
+                });
             }
-        });
+        } catch (error) {
+            console.error('Erro ao verificar status de like:', error);
+        }
     }
 
     // checkInitialLikeStatus();
@@ -1,7 +1,8 @@
-import locale
 import re
 import unicodedata
 from datetime import datetime
+from functools import lru_cache
+from typing import Iterable, Optional
 
 from faker import Faker
 from sqlalchemy import or_
@@ -9,10 +10,15 @@ from sqlalchemy import or_
 fake = Faker()
 
 
+def remover_acentos(texto: str) -> str:
+    """Remove acentos e caracteres não ASCII (ex.: 'Doação' -> 'Doacao')."""
+    texto = unicodedata.normalize('NFKD', texto)
+    return texto.encode('ascii', 'ignore').decode('utf-8')
+
+
 def gerar_slug(nome: str) -> str:
     """Gera um slug a partir do nome da categoria."""
-    slug = unicodedata.normalize('NFKD', nome)
-    slug = slug.encode('ascii', 'ignore').decode('utf-8')
+    slug = remover_acentos(nome)
     slug = re.sub(r'[^\w\s-]', '', slug).strip().lower()
     return re.sub(r'[-\s]+', '-', slug)
 
@@ -60,24 +66,110 @@ def iniciais(nome):
     return ''.join([palavra[0] for palavra in palavras])
 
 
-def formatar_data(date: datetime, language: str) -> str:
-    try:
-        locale.setlocale(locale.LC_TIME, 'pt_BR.UTF-8')
-    except locale.Error:
-        print(
-            'Warning: Locale não suportado. Usando locale padrão (en_US.UTF-8).'
-        )
-
-    now = datetime.utcnow()
-    delta = now - date
-
-    if delta.days == 0:
-        # Mostrar "Horas atrás"
-        hours = delta.seconds // 3600
-        if hours == 0:
-            minutes = delta.seconds // 60
-            return f'{minutes} minuto{"s" if minutes > 1 else ""} atrás'
-        return f'{hours} hora{"s" if hours > 1 else ""} atrás'
-    else:
-        # Mostrar data por extenso
-        return date.strftime('%d de %B de %Y')
+# Textos das datas relativas por idioma (prefixo do Accept-Language).
+# Tabelas fixas, sem locale.setlocale, que é global ao processo e não é
+# seguro entre threads.
+TABELAS_DATAS = {
+    'pt': {
+        'minutos': ('{} minuto atrás', '{} minutos atrás'),
+        'horas': ('{} hora atrás', '{} horas atrás'),
+        'data': '{dia:02d} de {mes} de {ano}',
+        'meses': (
+            'janeiro',
+            'fevereiro',
+            'março',
+            'abril',
+            'maio',
+            'junho',
+            'julho',
+            'agosto',
+            'setembro',
+            'outubro',
+            'novembro',
+            'dezembro',
+        ),
+    },
+    'en': {
+        'minutos': ('{} minute ago', '{} minutes ago'),
+        'horas': ('{} hour ago', '{} hours ago'),
+        'data': '{mes} {dia}, {ano}',
+        'meses': (
+            'January',
+            'February',
+            'March',
+            'April',
+            'May',
+            'June',
+            'July',
+            'August',
+            'September',
+            'October',
+            'November',
+            'December',
+        ),
+    },
+    'es': {
+        'minutos': ('hace {} minuto', 'hace {} minutos'),
+        'horas': ('hace {} hora', 'hace {} horas'),
+        'data': '{dia:02d} de {mes} de {ano}',
+        'meses': (
+            'enero',
+            'febrero',
+            'marzo',
+            'abril',
+            'mayo',
+            'junio',
+            'julio',
+            'agosto',
+            'septiembre',
+            'octubre',
+            'noviembre',
+            'diciembre',
+        ),
+    },
+}
+
+
+@lru_cache(maxsize=64)
+def tabela_datas(language: str) -> dict:
+    """Tabela do idioma ('pt-BR' -> 'pt'); português quando não houver."""
+    idioma = (language or '').split('-')[0].strip().lower()
+    return TABELAS_DATAS.get(idioma, TABELAS_DATAS['pt'])
+
+
+def formatar_datas(
+    datas: Iterable[datetime], language: str, now: Optional[datetime] = None
+) -> list:
+    """
+    Formata um lote de datas (ex.: uma página de posts) com a mesma
+    referência de "agora": minutos ou horas atrás no mesmo dia, data por
+    extenso nos demais casos.
+    """
+    tabela = tabela_datas(language)
+    now = now or datetime.utcnow()
+
+    textos = []
+    for data in datas:
+        delta = now - data
+        if delta.days == 0:
+            horas = delta.seconds // 3600
+            if horas == 0:
+                unidade, valor = tabela['minutos'], delta.seconds // 60
+            else:
+                unidade, valor = tabela['horas'], horas
+            textos.append(unidade[valor != 1].format(valor))
+        else:
+            textos.append(
+                tabela['data'].format(
+                    dia=data.day,
+                    mes=tabela['meses'][data.month - 1],
+                    ano=data.year,
+                )
+            )
+    return textos
+
+
+def formatar_data(
+    date: datetime, language: str, now: Optional[datetime] = None
+) -> str:
+    return formatar_datas([date], language, now)[0]
@@ -0,0 +1,87 @@
+import base64
+import json
+from datetime import date, datetime
+from http import HTTPStatus
+from typing import Any, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import tuple_
+
+NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+
+
+def encode_cursor(sort_value: Any, item_id: int) -> str:
+    """Codifica a chave de ordenação e o id do último item em um cursor."""
+    if isinstance(sort_value, (date, datetime)):
+        sort_value = sort_value.isoformat()
+    raw = json.dumps([sort_value, item_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, column) -> tuple:
+    """
+    Decodifica o cursor e converte a chave de ordenação para o tipo da
+    coluna. Cursores inválidos geram 400.
+    """
+    try:
+        padding = '=' * (-len(cursor) % 4)
+        sort_value, item_id = json.loads(
+            base64.urlsafe_b64decode(cursor + padding)
+        )
+        python_type = column.type.python_type
+        if sort_value is not None and python_type in {date, datetime}:
+            sort_value = python_type.fromisoformat(sort_value)
+        return sort_value, int(item_id)
+    except (ValueError, TypeError, NotImplementedError):
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail='Cursor de paginação inválido.',
+        )
+
+
+class CursorPage:
+    """
+    Parâmetros de paginação das listagens (use com Depends()).
+
+    Ordena a consulta por (sort_field, id) e aplica a paginação por cursor
+    (keyset): a próxima página começa depois do último item da anterior,
+    sem varrer as linhas já vistas como o OFFSET. Sem cursor, o skip
+    continua aceito para compatibilidade.
+    """
+
+    def __init__(
+        self, skip: int = 0, limit: int = 10, cursor: Optional[str] = None
+    ):
+        self.skip = skip
+        self.limit = limit
+        self.cursor = cursor
+
+    def apply(self, query, model, sort_field: str = 'id'):
+        """Busca um item a mais para saber se existe próxima página."""
+        column = getattr(model, sort_field)
+        if self.cursor:
+            sort_value, item_id = decode_cursor(self.cursor, column)
+            if sort_field == 'id':
+                query = query.filter(model.id > item_id)
+            else:
+                query = query.filter(
+                    tuple_(column, model.id) > tuple_(sort_value, item_id)
+                )
+        elif self.skip:
+            query = query.offset(self.skip)
+
+        if sort_field == 'id':
+            query = query.order_by(model.id)
+        else:
+            query = query.order_by(column, model.id)
+
+        return query.limit(self.limit + 1)
+
+    def split(self, items: list, sort_field: str = 'id') -> tuple:
+        """Retorna (itens da página, próximo cursor ou None)."""
+        if len(items) <= self.limit:
+            return items, None
+
+        items = items[: self.limit]
+        last = items[-1]
+        return items, encode_cursor(getattr(last, sort_field), last.id)
@@ -0,0 +1,37 @@
+from typing import Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+class ListSerializer:
+    """
+    Serializa listas de objetos ORM (ou linhas do SQLAlchemy) com um único
+    TypeAdapter: a leitura dos atributos, a validação e a geração do JSON
+    acontecem no pydantic-core, sem montar um schema por item em Python.
+
+    Use response() para devolver a resposta pronta; como a rota retorna
+    uma Response, o FastAPI não valida o resultado de novo pelo
+    response_model (que continua documentando o formato no OpenAPI).
+    """
+
+    def __init__(self, schema):
+        self.schema = schema
+        self.adapter = TypeAdapter(list[schema])
+
+    def validate(self, items) -> list:
+        return self.adapter.validate_python(items, from_attributes=True)
+
+    def to_python(self, items) -> list:
+        """Lista de dicts prontos para JSON, para embutir em outra resposta."""
+        return self.adapter.dump_python(self.validate(items), mode='json')
+
+    def to_json(self, items) -> bytes:
+        return self.adapter.dump_json(self.validate(items))
+
+    def response(self, items, headers: Optional[dict] = None) -> Response:
+        return Response(
+            content=self.to_json(items),
+            media_type='application/json',
+            headers=headers,
+        )
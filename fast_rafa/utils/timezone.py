@@ -1,21 +1,46 @@
-from datetime import datetime
+from datetime import datetime, timezone, tzinfo
+from functools import lru_cache
+from typing import Iterable, Optional
 
-import pytz
 from tzlocal import get_localzone
+from zoneinfo import ZoneInfo
 
+from fast_rafa.core.settings import settings
 
-def get_local_time_native():
+
+@lru_cache(maxsize=1)
+def get_timezone() -> tzinfo:
+    """
+    Fuso horário da aplicação, resolvido uma única vez por processo:
+    settings.TIMEZONE (ex.: 'America/Sao_Paulo') ou, se vazio, o fuso
+    detectado no sistema.
+    """
+    if settings.TIMEZONE:
+        return ZoneInfo(settings.TIMEZONE)
+    return get_localzone()
+
+
+def get_utc_time_native() -> datetime:
+    """Retorna o horário UTC atual sem tzinfo (naive datetime)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def get_local_time_native() -> datetime:
     """
-    Retorna o horário local baseado no fuso horário do sistema,
+    Retorna o horário local baseado no fuso horário da aplicação,
     mas sem informações de fuso horário (naive datetime).
     """
-    local_tz = get_localzone()  # Detecta o fuso horário local
-    local_time = datetime.now(
-        local_tz
-    )  # Obtém o horário local com fuso horário
-    return local_time.replace(
-        tzinfo=None
-    )  # Remove a informação de fuso horário
+    return datetime.now(get_timezone()).replace(tzinfo=None)
+
+
+def get_timestamp_native() -> datetime:
+    """
+    Horário gravado em criado_em/atualizado_em das organizações: UTC
+    quando settings.TIMESTAMPS_UTC está ativo, senão o horário local.
+    """
+    if settings.TIMESTAMPS_UTC:
+        return get_utc_time_native()
+    return get_local_time_native()
 
 
 def set_local_time_native(utc_time: datetime) -> datetime:
@@ -25,7 +50,60 @@ def set_local_time_native(utc_time: datetime) -> datetime:
     :param utc_time: O horário em UTC que será convertido
     :return: O horário convertido para o fuso horário local sem tzinfo
     """
-    local_tz = get_localzone()  # Detecta o fuso horário local
-    utc_time = pytz.utc.localize(utc_time)  # Torna o horário UTC-aware
-    local_time = utc_time.astimezone(local_tz)  # Converte para horário local
-    return local_time.replace(tzinfo=None)  # Remove o fuso horário
+    return to_local_native_many([utc_time])[0]
+
+
+def to_local_native_many(
+    utc_times: Iterable[Optional[datetime]],
+) -> list:
+    """
+    Converte uma lista de horários UTC (naive) para o fuso local, sem
+    tzinfo. Valores None são mantidos.
+    """
+    local_tz = get_timezone()
+    return [
+        None
+        if value is None
+        else value.replace(tzinfo=timezone.utc)
+        .astimezone(local_tz)
+        .replace(tzinfo=None)
+        for value in utc_times
+    ]
+
+
+def to_utc_native_many(
+    local_times: Iterable[Optional[datetime]],
+) -> list:
+    """
+    Converte uma lista de horários locais (naive) para UTC, sem tzinfo.
+    Valores None são mantidos.
+    """
+    local_tz = get_timezone()
+    return [
+        None
+        if value is None
+        else value.replace(tzinfo=local_tz)
+        .astimezone(timezone.utc)
+        .replace(tzinfo=None)
+        for value in local_times
+    ]
+
+
+def localtime(value: Optional[datetime]) -> Optional[datetime]:
+    """
+    Filtro dos templates: exibe no fuso local um horário gravado sempre em
+    UTC (ex.: mensagens e watchlists). A conversão acontece só na
+    renderização.
+    """
+    return None if value is None else set_local_time_native(value)
+
+
+def organization_localtime(value: Optional[datetime]) -> Optional[datetime]:
+    """
+    Filtro dos templates para criado_em/atualizado_em das organizações:
+    só converte quando settings.TIMESTAMPS_UTC está ativo, pois sem ele
+    esses horários já são gravados no fuso local.
+    """
+    if not settings.TIMESTAMPS_UTC:
+        return value
+    return localtime(value)
@@ -6,6 +6,7 @@ from sqlalchemy import pool
 from alembic import context
 from fast_rafa.modules.base.models import table_registry
 from fast_rafa.core.settings import Settings
+from fast_rafa.modules.search.models import is_search_object
 
 config = context.config
 config.set_main_option("sqlalchemy.url", Settings().DATABASE_URL)
@@ -27,6 +28,11 @@ target_metadata = table_registry.metadata
 # ... etc.
 
 
+def include_object(object, name, type_, reflected, compare_to):
+    # A busca textual (tsvector/FTS5) é mantida à mão nas migrações
+    return not (reflected and is_search_object(name, type_))
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -43,6 +49,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -66,7 +73,9 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
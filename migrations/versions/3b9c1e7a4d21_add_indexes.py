@@ -0,0 +1,52 @@
+"""add indexes
+
+Revision ID: 3b9c1e7a4d21
+Revises: fafc40bf8718
+Create Date: 2026-10-18 10:02:11.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9c1e7a4d21'
+down_revision: Union[str, None] = 'fafc40bf8718'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Remove favoritos duplicados antes de criar o índice único,
+    # mantendo o registro mais antigo de cada par usuário/postagem
+    op.execute(
+        'DELETE FROM favorites WHERE id NOT IN ('
+        'SELECT MIN(id) FROM favorites GROUP BY id_usuario, id_postagem)'
+    )
+    op.create_index('uix_favorites_usuario_postagem', 'favorites', ['id_usuario', 'id_postagem'], unique=True)
+    op.create_index('ix_favorites_id_postagem', 'favorites', ['id_postagem'], unique=False)
+    op.create_index('ix_posts_id_organizacao_status', 'posts', ['id_organizacao', 'status'], unique=False)
+    op.create_index('ix_posts_id_categoria', 'posts', ['id_categoria'], unique=False)
+    op.create_index('ix_posts_criado_em', 'posts', ['criado_em'], unique=False)
+    op.create_index('ix_events_slug', 'events', ['slug'], unique=False)
+    op.create_index('ix_events_fechado', 'events', ['fechado'], unique=False)
+    op.create_index('ix_message_its_usuario_um_usuario_dois', 'message_its', ['usuario_um', 'usuario_dois'], unique=False)
+    op.create_index('ix_message_its_usuario_dois', 'message_its', ['usuario_dois'], unique=False)
+    op.create_index('ix_messages_id_mensagem_it_criado_em', 'messages', ['id_mensagem_it', 'criado_em'], unique=False)
+    op.create_index('ix_users_id_organizacao', 'users', ['id_organizacao'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_id_organizacao', table_name='users')
+    op.drop_index('ix_messages_id_mensagem_it_criado_em', table_name='messages')
+    op.drop_index('ix_message_its_usuario_dois', table_name='message_its')
+    op.drop_index('ix_message_its_usuario_um_usuario_dois', table_name='message_its')
+    op.drop_index('ix_events_fechado', table_name='events')
+    op.drop_index('ix_events_slug', table_name='events')
+    op.drop_index('ix_posts_criado_em', table_name='posts')
+    op.drop_index('ix_posts_id_categoria', table_name='posts')
+    op.drop_index('ix_posts_id_organizacao_status', table_name='posts')
+    op.drop_index('ix_favorites_id_postagem', table_name='favorites')
+    op.drop_index('uix_favorites_usuario_postagem', table_name='favorites')
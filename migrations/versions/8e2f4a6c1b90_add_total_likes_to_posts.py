@@ -0,0 +1,32 @@
+"""add total_likes to posts
+
+Revision ID: 8e2f4a6c1b90
+Revises: 3b9c1e7a4d21
+Create Date: 2026-10-18 10:31:47.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e2f4a6c1b90'
+down_revision: Union[str, None] = '3b9c1e7a4d21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('posts', sa.Column('total_likes', sa.Integer(), server_default='0', nullable=False))
+    # Preenche o contador com os favoritos já existentes
+    op.execute(
+        'UPDATE posts SET total_likes = ('
+        'SELECT COUNT(favorites.id) FROM favorites '
+        'WHERE favorites.id_postagem = posts.id)'
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('posts', 'total_likes')
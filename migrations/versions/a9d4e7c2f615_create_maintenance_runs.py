@@ -0,0 +1,30 @@
+"""create maintenance_runs
+
+Revision ID: a9d4e7c2f615
+Revises: f2c6a9e1b384
+Create Date: 2026-10-18 16:05:41.218734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d4e7c2f615'
+down_revision: Union[str, None] = 'f2c6a9e1b384'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('maintenance_runs',
+    sa.Column('nome', sa.String(length=50), nullable=False),
+    sa.Column('executado_em', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('nome')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('maintenance_runs')
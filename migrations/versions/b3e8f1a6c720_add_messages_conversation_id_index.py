@@ -0,0 +1,25 @@
+"""add messages conversation id index
+
+Revision ID: b3e8f1a6c720
+Revises: a9d4e7c2f615
+Create Date: 2026-10-18 18:20:13.504127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e8f1a6c720'
+down_revision: Union[str, None] = 'a9d4e7c2f615'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_messages_id_mensagem_it_id', 'messages', ['id_mensagem_it', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_messages_id_mensagem_it_id', table_name='messages')
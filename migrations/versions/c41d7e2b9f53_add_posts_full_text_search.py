@@ -0,0 +1,69 @@
+"""add posts full text search
+
+Revision ID: c41d7e2b9f53
+Revises: 8e2f4a6c1b90
+Create Date: 2026-10-18 11:12:05.318427
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d7e2b9f53'
+down_revision: Union[str, None] = '8e2f4a6c1b90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        # Coluna gerada: o Postgres mantém o tsvector a cada escrita
+        op.execute(
+            "ALTER TABLE posts ADD COLUMN busca tsvector "
+            "GENERATED ALWAYS AS ("
+            "setweight(to_tsvector('portuguese', coalesce(titulo, '')), 'A') || "
+            "setweight(to_tsvector('portuguese', coalesce(descricao, '')), 'B')"
+            ") STORED"
+        )
+        op.create_index('ix_posts_busca', 'posts', ['busca'], unique=False, postgresql_using='gin')
+        return
+
+    op.execute(
+        "CREATE VIRTUAL TABLE posts_fts USING fts5("
+        "titulo, descricao, content='posts', content_rowid='id', "
+        "tokenize='unicode61 remove_diacritics 2')"
+    )
+    op.execute(
+        "CREATE TRIGGER posts_fts_ai AFTER INSERT ON posts BEGIN "
+        "INSERT INTO posts_fts(rowid, titulo, descricao) "
+        "VALUES (new.id, new.titulo, new.descricao); END"
+    )
+    op.execute(
+        "CREATE TRIGGER posts_fts_ad AFTER DELETE ON posts BEGIN "
+        "INSERT INTO posts_fts(posts_fts, rowid, titulo, descricao) "
+        "VALUES ('delete', old.id, old.titulo, old.descricao); END"
+    )
+    op.execute(
+        "CREATE TRIGGER posts_fts_au AFTER UPDATE OF titulo, descricao ON posts BEGIN "
+        "INSERT INTO posts_fts(posts_fts, rowid, titulo, descricao) "
+        "VALUES ('delete', old.id, old.titulo, old.descricao); "
+        "INSERT INTO posts_fts(rowid, titulo, descricao) "
+        "VALUES (new.id, new.titulo, new.descricao); END"
+    )
+    # Indexa os posts já existentes
+    op.execute("INSERT INTO posts_fts(posts_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_posts_busca', table_name='posts', postgresql_using='gin')
+        op.drop_column('posts', 'busca')
+        return
+
+    op.execute('DROP TRIGGER IF EXISTS posts_fts_au')
+    op.execute('DROP TRIGGER IF EXISTS posts_fts_ad')
+    op.execute('DROP TRIGGER IF EXISTS posts_fts_ai')
+    op.execute('DROP TABLE IF EXISTS posts_fts')
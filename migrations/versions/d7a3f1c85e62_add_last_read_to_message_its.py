@@ -0,0 +1,28 @@
+"""add last read message to message_its
+
+Revision ID: d7a3f1c85e62
+Revises: c41d7e2b9f53
+Create Date: 2026-10-18 12:04:27.551903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a3f1c85e62'
+down_revision: Union[str, None] = 'c41d7e2b9f53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('message_its', sa.Column('id_ultima_lida_um', sa.Integer(), nullable=True))
+    op.add_column('message_its', sa.Column('id_ultima_lida_dois', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('message_its', 'id_ultima_lida_dois')
+    op.drop_column('message_its', 'id_ultima_lida_um')
@@ -0,0 +1,38 @@
+"""create feed_entries
+
+Revision ID: e5b8c2d9a417
+Revises: d7a3f1c85e62
+Create Date: 2026-10-18 13:21:45.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b8c2d9a417'
+down_revision: Union[str, None] = 'd7a3f1c85e62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Preenchida com `task refresh_feed` após a migração
+    op.create_table('feed_entries',
+    sa.Column('id_postagem', sa.Integer(), nullable=False),
+    sa.Column('nao_governamental', sa.Boolean(), nullable=False),
+    sa.Column('id_organizacao', sa.Integer(), nullable=False),
+    sa.Column('data_validade', sa.Date(), nullable=False),
+    sa.Column('pontuacao_base', sa.Float(), nullable=False),
+    sa.Column('pontuacao', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['id_postagem'], ['posts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id_postagem')
+    )
+    op.create_index('ix_feed_entries_publico_pontuacao', 'feed_entries', ['nao_governamental', 'pontuacao', 'id_postagem'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_feed_entries_publico_pontuacao', table_name='feed_entries')
+    op.drop_table('feed_entries')
@@ -0,0 +1,35 @@
+"""create leaderboard_entries
+
+Revision ID: f2c6a9e1b384
+Revises: e5b8c2d9a417
+Create Date: 2026-10-18 14:37:12.640581
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c6a9e1b384'
+down_revision: Union[str, None] = 'e5b8c2d9a417'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Preenchida com `task refresh_leaderboards` após a migração
+    op.create_table('leaderboard_entries',
+    sa.Column('tipo', sa.String(length=20), nullable=False),
+    sa.Column('id_referencia', sa.Integer(), nullable=False),
+    sa.Column('id_organizacao', sa.Integer(), nullable=False),
+    sa.Column('pontuacao', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('tipo', 'id_referencia')
+    )
+    op.create_index('ix_leaderboard_entries_tipo_pontuacao', 'leaderboard_entries', ['tipo', 'pontuacao'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_leaderboard_entries_tipo_pontuacao', table_name='leaderboard_entries')
+    op.drop_table('leaderboard_entries')
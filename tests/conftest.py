@@ -1,5 +1,5 @@
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import pytest
 from fastapi.testclient import TestClient
@@ -8,12 +8,19 @@ from sqlalchemy.orm import Session
 from sqlalchemy.pool import StaticPool
 
 from fast_rafa.app import app
-from fast_rafa.database import get_session
-from fast_rafa.models.base import table_registry
-from fast_rafa.models.organization import Organization
-from fast_rafa.models.user import User
-from fast_rafa.schemas.user import CreateUser
-from fast_rafa.security import get_password_hash
+from fast_rafa.core.database import get_read_session, get_session
+from fast_rafa.core.security import get_password_hash
+from fast_rafa.modules.base.models import table_registry
+from fast_rafa.modules.categories.models import Category
+from fast_rafa.modules.categories.schemas import CreateCategory
+from fast_rafa.modules.categories_main.models import CategoryMain
+from fast_rafa.modules.categories_main.schemas import CategoryMainCreate
+from fast_rafa.modules.organizations.models import Organization
+from fast_rafa.modules.organizations.schemas import OrganizationCreate
+from fast_rafa.modules.posts.models import Post
+from fast_rafa.modules.posts.schemas import CreatePost
+from fast_rafa.modules.users.models import User
+from fast_rafa.modules.users.schemas import CreateUser
 
 
 @pytest.fixture
@@ -32,6 +39,7 @@ def client(session):
 
     with TestClient(app) as client:
         app.dependency_overrides[get_session] = get_session_override
+        app.dependency_overrides[get_read_session] = get_session_override
         yield client
     app.dependency_overrides.clear()
 
@@ -71,7 +79,7 @@ def mock_db_time():
 
 @pytest.fixture
 def organization(session):
-    organization_data = Organization.CreateOrganization(
+    organization_data = OrganizationCreate(
         id_federal='12345678901',
         nao_governamental=True,
         url_logo='https://example.com/logo.png',
@@ -126,3 +134,50 @@ def user(session):
     user.clean_password = pwd  # Monkey patching
 
     return user
+
+
+@pytest.fixture
+def category(session):
+    category_main = CategoryMain.create(
+        CategoryMainCreate(categoria='Alimentos', slug='alimentos')
+    )
+    session.add(category_main)
+    session.flush()
+
+    category = Category.create(
+        CreateCategory(
+            id_categoria_principal=category_main.id,
+            categoria='Cestas',
+            slug='cestas',
+        )
+    )
+    session.add(category)
+    session.commit()
+    session.refresh(category)
+
+    return category
+
+
+@pytest.fixture
+def make_post(session, organization, user, category):
+    """Cria posts ativos da organização do usuário; campos podem mudar."""
+
+    def _make_post(titulo, descricao='Doação', **fields):
+        data = {
+            'item': True,
+            'id_organizacao': organization.id,
+            'id_usuario': user.id,
+            'titulo': titulo,
+            'descricao': descricao,
+            'quantidade': '1',
+            'id_categoria': category.id,
+            'data_validade': datetime.utcnow() + timedelta(days=7),
+        }
+        data.update(fields)
+        post = Post.create(CreatePost(**data))
+        session.add(post)
+        session.commit()
+        session.refresh(post)
+        return post
+
+    return _make_post
@@ -1,8 +1,14 @@
 from sqlalchemy import select
 
-from fast_rafa.models.organization import Organization as OrganizationModel
-from fast_rafa.models.user import User
-from fast_rafa.schemas.user import CreateUser
+from fast_rafa.modules.organizations.models import (
+    Organization as OrganizationModel,
+)
+from fast_rafa.modules.organizations.schemas import (
+    OrganizationCreate,
+    OrganizationDeleteResponse,
+)
+from fast_rafa.modules.users.models import User
+from fast_rafa.modules.users.schemas import CreateUser
 
 
 def test_create_organization(session):
@@ -25,7 +31,7 @@ def test_create_organization(session):
         'email': 'eduardolirainfO@gmail.com',
     }
 
-    organization_data = OrganizationModel.CreateOrganization(**data)
+    organization_data = OrganizationCreate(**data)
     organization = OrganizationModel.create(organization_data)
 
     session.add(organization)
@@ -77,7 +83,7 @@ def test_update_organization(session):
         'email': 'initial_email@gmail.com',
     }
 
-    organization_data = OrganizationModel.CreateOrganization(**initial_data)
+    organization_data = OrganizationCreate(**initial_data)
     organization = OrganizationModel.create(organization_data)
 
     update_data = {
@@ -136,7 +142,7 @@ def test_delete_organization(session):
         'email': 'delete_email@gmail.com',
     }
 
-    organization_data = OrganizationModel.CreateOrganization(**data)
+    organization_data = OrganizationCreate(**data)
     organization = OrganizationModel.create(organization_data)
 
     session.add(organization)
@@ -157,11 +163,11 @@ def test_delete_organization(session):
     )
 
     if deleted_organization is None:
-        delete_response = OrganizationModel.DeleteResponseOrganization(
+        delete_response = OrganizationDeleteResponse(
             message='Organização excluída'
         )
     else:
-        delete_response = OrganizationModel.DeleteResponseOrganization(
+        delete_response = OrganizationDeleteResponse(
             message='Falha ao excluir a organização'
         )
 
@@ -0,0 +1,108 @@
+from http import HTTPStatus
+
+from fast_rafa.modules.favorites import routes
+from fast_rafa.modules.favorites.models import Favorite
+from fast_rafa.modules.posts.models import Post
+from fast_rafa.modules.posts.services import reconcile_total_likes
+
+BATCH_URL = '/api/v1/favorites/{}/batch'
+
+
+def toggle(client, user, *operations):
+    return client.post(
+        BATCH_URL.format(user.id),
+        json={
+            'operacoes': [
+                {'id_postagem': post_id, 'curtido': curtido}
+                for post_id, curtido in operations
+            ]
+        },
+    )
+
+
+def total_likes(session, post):
+    session.expire_all()
+    return session.get(Post, post.id).total_likes
+
+
+def test_batch_likes_and_unlikes_update_counters(client, user, make_post):
+    leite = make_post('Leite')
+    arroz = make_post('Arroz')
+
+    response = toggle(client, user, (leite.id, True), (arroz.id, True))
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {
+        'total_likes': {str(leite.id): 1, str(arroz.id): 1},
+        'favoritos': [leite.id, arroz.id],
+    }
+
+    response = toggle(client, user, (leite.id, False))
+    assert response.json() == {
+        'total_likes': {str(leite.id): 0},
+        'favoritos': [],
+    }
+
+
+def test_repeated_post_keeps_the_last_operation(
+    client, session, user, make_post
+):
+    leite = make_post('Leite')
+
+    response = toggle(
+        client, user, (leite.id, True), (leite.id, False), (leite.id, True)
+    )
+
+    assert response.json() == {
+        'total_likes': {str(leite.id): 1},
+        'favoritos': [leite.id],
+    }
+    assert session.query(Favorite).count() == 1
+
+
+def test_repeated_like_and_unlike_not_liked_keep_counters(
+    client, session, user, make_post
+):
+    leite = make_post('Leite')
+    arroz = make_post('Arroz')
+    toggle(client, user, (leite.id, True))
+
+    response = toggle(client, user, (leite.id, True), (arroz.id, False))
+
+    assert response.json() == {
+        'total_likes': {str(leite.id): 1, str(arroz.id): 0},
+        'favoritos': [leite.id],
+    }
+    assert total_likes(session, arroz) == 0
+
+
+def test_batch_is_rolled_back_when_feed_update_fails(
+    client, session, user, make_post, monkeypatch
+):
+    leite = make_post('Leite')
+
+    def update_feed_likes(db, total_likes):
+        raise RuntimeError('feed indisponível')
+
+    monkeypatch.setattr(routes, 'update_feed_likes', update_feed_likes)
+    response = toggle(client, user, (leite.id, True))
+
+    assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+    assert total_likes(session, leite) == 0
+    assert session.query(Favorite).count() == 0
+
+
+def test_reconcile_fixes_counters_in_the_caller_transaction(
+    client, session, user, make_post
+):
+    leite = make_post('Leite')
+    toggle(client, user, (leite.id, True))
+    leite.total_likes = 5
+    session.commit()
+
+    assert reconcile_total_likes(session) == 1
+    session.rollback()
+    assert total_likes(session, leite) == 5  # noqa: PLR2004
+
+    reconcile_total_likes(session)
+    session.commit()
+    assert total_likes(session, leite) == 1
@@ -0,0 +1,145 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from fast_rafa.modules.feed.models import FeedEntry
+from fast_rafa.modules.feed.services import (
+    LIKES_WEIGHT,
+    base_score,
+    get_feed,
+    likes_score,
+    refresh_feed_entries,
+    update_feed_likes,
+)
+from fast_rafa.modules.organizations.models import Organization
+from fast_rafa.modules.organizations.schemas import OrganizationCreate
+from fast_rafa.modules.posts.models import Post
+from fast_rafa.utils.pagination import CursorPage
+
+AGORA = datetime(2024, 1, 1, 12, 0)
+
+
+@pytest.fixture
+def viewer_organization(session, organization):
+    """Outra organização do mesmo público, que vê os posts no feed."""
+    organization = Organization.create(
+        OrganizationCreate(
+            id_federal='98765432100',
+            nao_governamental=True,
+            url_logo='https://example.com/outra-logo.png',
+            url_imagem='https://example.com/outra-image.jpg',
+            abertura='08:00',
+            fechamento='18:00',
+            intervalo='12:00-13:00',
+            nome='Outra ONG',
+            descricao='Organização não governamental',
+            rua='Rua das ONGs',
+            cep='12345-678',
+            cidade='Recife',
+            estado='PE',
+            telefone='(81) 99999-9999',
+            email='outra@example.com',
+        )
+    )
+    session.add(organization)
+    session.commit()
+    return organization
+
+
+@pytest.fixture
+def make_feed_post(session, make_post):
+    def _make_feed_post(titulo, horas_atras=0, **fields):
+        post = make_post(titulo, **fields)
+        post.criado_em = datetime.utcnow() - timedelta(hours=horas_atras)
+        session.commit()
+        return post
+
+    return _make_feed_post
+
+
+def feed_titles(session, user, organization):
+    posts, _ = get_feed(session, user.id, organization, CursorPage(limit=10))
+    return [post.titulo for post in posts]
+
+
+def test_newer_posts_and_closer_expiry_score_higher():
+    validade = AGORA + timedelta(days=10)
+
+    assert base_score(AGORA, validade) > base_score(
+        AGORA - timedelta(hours=1), validade
+    )
+    assert base_score(AGORA, validade) > base_score(
+        AGORA, validade + timedelta(days=1)
+    )
+    # Validades além do horizonte não contam mais
+    assert base_score(AGORA, AGORA + timedelta(days=60)) == base_score(
+        AGORA, AGORA + timedelta(days=90)
+    )
+
+
+def test_likes_score_grows_with_each_doubling():
+    assert likes_score(0) == 0
+    assert likes_score(1) == LIKES_WEIGHT
+    assert likes_score(3) == 2 * LIKES_WEIGHT
+    assert likes_score(-5) == 0
+
+
+def test_refresh_keeps_only_active_posts_within_expiry(
+    session, user, viewer_organization, make_feed_post
+):
+    make_feed_post('Antigo', horas_atras=5)
+    make_feed_post('Novo')
+    make_feed_post('Inativo', status=0)
+    make_feed_post('Vencido', data_validade=datetime.utcnow() - timedelta(2))
+
+    assert refresh_feed_entries(session) == 2  # noqa: PLR2004
+    session.commit()
+
+    assert feed_titles(session, user, viewer_organization) == [
+        'Novo',
+        'Antigo',
+    ]
+
+
+def test_refresh_twice_updates_rows_and_removes_hidden_posts(
+    session, make_feed_post
+):
+    post = make_feed_post('Leite')
+    refresh_feed_entries(session)
+    refresh_feed_entries(session, Post.id == post.id)
+    assert session.query(FeedEntry).count() == 1
+
+    post.status = 0
+    session.flush()
+    refresh_feed_entries(session, Post.id == post.id)
+    session.commit()
+
+    assert session.query(FeedEntry).count() == 0
+
+
+def test_update_feed_likes_moves_post_up(
+    session, user, viewer_organization, make_feed_post
+):
+    antigo = make_feed_post('Antigo', horas_atras=5)
+    make_feed_post('Novo')
+    refresh_feed_entries(session)
+
+    update_feed_likes(session, {antigo.id: 3, 999: 10})
+    session.commit()
+
+    assert feed_titles(session, user, viewer_organization) == [
+        'Antigo',
+        'Novo',
+    ]
+    entry = session.get(FeedEntry, antigo.id)
+    assert entry.pontuacao == entry.pontuacao_base + likes_score(3)
+
+
+def test_feed_hides_posts_of_the_viewer_organization(
+    session, user, organization, make_feed_post
+):
+    make_feed_post('Leite')
+    refresh_feed_entries(session)
+    session.commit()
+
+    assert feed_titles(session, user, organization) == []
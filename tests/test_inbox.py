@@ -0,0 +1,129 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from fast_rafa.modules.messages.models import Message
+from fast_rafa.modules.messages.services import (
+    get_inbox,
+    mark_conversation_read,
+)
+from fast_rafa.modules.messages_it.models import MessageItem
+from fast_rafa.modules.users.models import User
+from fast_rafa.modules.users.schemas import CreateUser
+from fast_rafa.utils.pagination import CursorPage
+
+INICIO = datetime(2024, 1, 1, 12, 0)
+
+
+@pytest.fixture
+def other_user(session, organization):
+    other = User.create(
+        CreateUser(
+            id_organizacao=organization.id,
+            primeiro_nome='Bia',
+            sobrenome='Lima',
+            email='bia@example.com',
+            username='bialima',
+            senha_hash='hash',
+            telefone='(11) 99999-9999',
+        )
+    )
+    session.add(other)
+    session.commit()
+    return other
+
+
+@pytest.fixture
+def make_conversation(session, user):
+    def _make_conversation(other, *senders):
+        """Conversa com uma mensagem por remetente, um minuto entre elas."""
+        conversa = MessageItem(usuario_um=user.id, usuario_dois=other.id)
+        session.add(conversa)
+        session.flush()
+        for minuto, sender in enumerate(senders):
+            message = Message(
+                id_mensagem_it=conversa.id,
+                id_remetente=sender.id,
+                id_postagem=None,
+                conteudo=f'mensagem {minuto}',
+                url_imagem=None,
+            )
+            message.criado_em = INICIO + timedelta(minutes=minuto)
+            session.add(message)
+        session.commit()
+        return conversa
+
+    return _make_conversation
+
+
+def inbox_summary(session, user, **page):
+    items, cursor = get_inbox(session, user.id, CursorPage(**page))
+    return [
+        (
+            item['id'],
+            (item['ultima_mensagem'] or {}).get('conteudo'),
+            item['mensagens_nao_lidas'],
+        )
+        for item in items
+    ], cursor
+
+
+def test_inbox_counts_only_unread_messages_from_the_other_user(
+    session, user, other_user, make_conversation
+):
+    conversa = make_conversation(other_user, other_user, user, other_user)
+
+    assert inbox_summary(session, user) == (
+        [(conversa.id, 'mensagem 2', 2)],
+        None,
+    )
+    assert inbox_summary(session, other_user) == (
+        [(conversa.id, 'mensagem 2', 1)],
+        None,
+    )
+
+
+def test_mark_conversation_read_clears_unread_for_the_reader(
+    session, user, other_user, make_conversation
+):
+    conversa = make_conversation(other_user, other_user, other_user)
+    id_ultima = max(message.id for message in conversa.messages)
+
+    assert mark_conversation_read(session, conversa, user.id) == id_ultima
+    assert inbox_summary(session, user)[0] == [(conversa.id, 'mensagem 1', 0)]
+
+    # Mensagens novas depois da leitura voltam a contar
+    message = Message(
+        id_mensagem_it=conversa.id,
+        id_remetente=other_user.id,
+        id_postagem=None,
+        conteudo='nova',
+        url_imagem=None,
+    )
+    session.add(message)
+    session.commit()
+
+    assert inbox_summary(session, user)[0] == [(conversa.id, 'nova', 1)]
+
+
+def test_mark_conversation_read_without_messages_keeps_none(
+    session, user, other_user, make_conversation
+):
+    conversa = make_conversation(other_user)
+
+    assert mark_conversation_read(session, conversa, user.id) is None
+    assert inbox_summary(session, user)[0] == [(conversa.id, None, 0)]
+
+
+def test_inbox_orders_by_last_activity_and_paginates(
+    session, user, other_user, make_conversation
+):
+    antiga = make_conversation(other_user, other_user)
+    recente = make_conversation(other_user, other_user, other_user)
+
+    first, cursor = inbox_summary(session, user, limit=1)
+    second, last_cursor = inbox_summary(session, user, limit=1, cursor=cursor)
+
+    assert first == [(recente.id, 'mensagem 1', 2)]
+    assert second == [(antiga.id, 'mensagem 0', 1)]
+    assert last_cursor is None
@@ -0,0 +1,58 @@
+from fast_rafa.modules.leaderboards.models import LeaderboardEntry
+from fast_rafa.modules.leaderboards.services import (
+    ORGANIZATIONS,
+    refresh_organization_scores,
+    remove_organization_entries,
+)
+
+
+def scores(session):
+    return {
+        (entry.tipo, entry.id_referencia): entry.pontuacao
+        for entry in session.query(LeaderboardEntry)
+    }
+
+
+def test_refresh_counts_active_posts_and_can_run_again(
+    session, organization, make_post
+):
+    make_post('Leite')
+    make_post('Arroz')
+    make_post('Inativo', status=0)
+
+    assert refresh_organization_scores(session, [organization.id]) == 1
+    refresh_organization_scores(session)
+    session.commit()
+
+    assert scores(session) == {(ORGANIZATIONS, organization.id): 2}
+
+
+def test_refresh_removes_organizations_without_active_posts(
+    session, organization, make_post
+):
+    post = make_post('Leite')
+    refresh_organization_scores(session)
+    session.commit()
+
+    post.status = 0
+    session.flush()
+    refresh_organization_scores(session, [organization.id])
+    session.commit()
+
+    assert scores(session) == {}
+
+
+def test_refresh_and_removal_are_left_to_the_caller_transaction(
+    session, organization, make_post
+):
+    make_post('Leite')
+    refresh_organization_scores(session)
+    session.rollback()
+    assert scores(session) == {}
+
+    refresh_organization_scores(session)
+    session.commit()
+    remove_organization_entries(session, organization.id)
+    session.rollback()
+
+    assert scores(session) == {(ORGANIZATIONS, organization.id): 1}
@@ -0,0 +1,107 @@
+from datetime import datetime
+from http import HTTPStatus
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+
+from fast_rafa.modules.users.models import User
+from fast_rafa.modules.users.schemas import CreateUser
+from fast_rafa.utils.pagination import CursorPage, decode_cursor, encode_cursor
+
+
+def create_users(session, organization, nomes):
+    for index, nome in enumerate(nomes):
+        user = User.create(
+            CreateUser(
+                id_organizacao=organization.id,
+                primeiro_nome=nome,
+                sobrenome='Teste',
+                email=f'usuario{index}@example.com',
+                username=f'usuario{index}',
+                senha_hash='hash',
+                telefone='(11) 99999-9999',
+            )
+        )
+        session.add(user)
+    session.commit()
+
+
+def read_all_pages(session, limit, sort_field='id'):
+    """Percorre as páginas seguindo o cursor até a última."""
+    pages = []
+    cursor = None
+    while True:
+        page = CursorPage(limit=limit, cursor=cursor)
+        query = page.apply(select(User), User, sort_field)
+        items, cursor = page.split(session.scalars(query).all(), sort_field)
+        pages.append(items)
+        if cursor is None:
+            return pages
+
+
+def test_first_page_returns_limit_and_cursor(session, organization):
+    create_users(session, organization, ['Ana', 'Bia', 'Caio'])
+
+    page = CursorPage(limit=2)
+    items, cursor = page.split(
+        session.scalars(page.apply(select(User), User)).all()
+    )
+
+    assert [user.primeiro_nome for user in items] == ['Ana', 'Bia']
+    assert cursor == encode_cursor(items[-1].id, items[-1].id)
+
+
+def test_last_page_has_no_cursor(session, organization):
+    create_users(session, organization, ['Ana', 'Bia', 'Caio', 'Davi'])
+
+    pages = read_all_pages(session, limit=2)
+
+    assert [[user.primeiro_nome for user in page] for page in pages] == [
+        ['Ana', 'Bia'],
+        ['Caio', 'Davi'],
+    ]
+
+
+def test_single_page_when_items_fit_the_limit(session, organization):
+    create_users(session, organization, ['Ana', 'Bia'])
+
+    page = CursorPage(limit=2)
+    items, cursor = page.split(
+        session.scalars(page.apply(select(User), User)).all()
+    )
+
+    assert [user.primeiro_nome for user in items] == ['Ana', 'Bia']
+    assert cursor is None
+
+
+def test_ties_are_broken_by_id(session, organization):
+    nomes = ['Bia', 'Ana', 'Bia', 'Ana', 'Bia', 'Caio', 'Ana']
+    create_users(session, organization, nomes)
+
+    pages = read_all_pages(session, limit=2, sort_field='primeiro_nome')
+    users = [user for page in pages for user in page]
+
+    # Cada usuário aparece uma única vez, na ordem (primeiro_nome, id)
+    assert [(user.primeiro_nome, user.id) for user in users] == sorted(
+        (user.primeiro_nome, user.id)
+        for user in session.scalars(select(User)).all()
+    )
+    assert len(users) == len(nomes)
+
+
+def test_cursor_keeps_date_types():
+    column = User.criado_em
+    criado_em = datetime(2024, 1, 1, 12, 30)
+
+    assert decode_cursor(encode_cursor(criado_em, 7), column) == (
+        criado_em,
+        7,
+    )
+
+
+def test_invalid_cursor_returns_bad_request():
+    with pytest.raises(HTTPException) as error:
+        decode_cursor('cursor-invalido', User.id)
+
+    assert error.value.status_code == HTTPStatus.BAD_REQUEST
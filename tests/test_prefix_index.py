@@ -0,0 +1,93 @@
+import asyncio
+
+from fast_rafa.core.prefix_index import PrefixIndex, fold_text
+from fast_rafa.modules.search import services
+
+BANCO = ('organizacao', 1, 'Banco de Alimentos', 'Recife')
+ABRIGO = ('organizacao', 2, 'Abrigo São José', 'Olinda')
+
+
+def build_index(*values):
+    index = PrefixIndex()
+    index.build((value[2], value) for value in values)
+    return index
+
+
+def test_fold_text_removes_accents_and_punctuation():
+    assert fold_text('  São-José, PE ') == 'sao jose pe'
+
+
+def test_search_matches_any_word_prefix():
+    index = build_index(BANCO, ABRIGO)
+
+    assert index.search('banco') == [BANCO]
+    assert index.search('alim') == [BANCO]
+    assert index.search('de alimentos') == [BANCO]
+    assert index.search('jose') == [ABRIGO]
+    assert index.search('recife') == []
+
+
+def test_search_returns_each_value_once_up_to_limit():
+    index = PrefixIndex()
+    index.build([('Banco Bom', BANCO), ('Banco', BANCO), ('Bazar', ABRIGO)])
+
+    assert index.search('b') == [BANCO, ABRIGO]
+    assert index.search('b', limit=1) == [BANCO]
+    assert index.search('') == []
+
+
+def test_invalidate_keeps_serving_the_previous_version():
+    index = build_index(BANCO)
+
+    index.invalidate()
+
+    assert index.expired(ttl=300)
+    assert index.search('banco') == [BANCO]
+
+
+def test_build_started_before_invalidation_stays_expired():
+    index = PrefixIndex()
+    generation = index.generation
+
+    index.invalidate()
+    index.build([(BANCO[2], BANCO)], generation)
+
+    assert index.built
+    assert index.expired(ttl=300)
+
+
+def test_autocomplete_rebuilds_once_for_concurrent_requests(monkeypatch):
+    index = PrefixIndex()
+    monkeypatch.setattr(services, 'autocomplete_index', index)
+    monkeypatch.setattr(
+        services, 'autocomplete_rebuild', services.IndexRebuild(index)
+    )
+    entries = [[(BANCO[2], BANCO)], [(ABRIGO[2], ABRIGO)]]
+    loads = []
+
+    async def load_autocomplete_entries(db):
+        loads.append(db)
+        await asyncio.sleep(0)
+        return entries[len(loads) - 1]
+
+    monkeypatch.setattr(
+        services, 'load_autocomplete_entries', load_autocomplete_entries
+    )
+
+    async def scenario():
+        # Sem índice montado, todas esperam a mesma reconstrução
+        first = await asyncio.gather(
+            *(services.autocomplete('banco') for _ in range(5))
+        )
+        assert first == [[BANCO]] * 5
+        assert len(loads) == 1
+
+        # Depois de uma escrita, a versão anterior responde até a nova
+        index.invalidate()
+        assert await services.autocomplete('banco') == [BANCO]
+        assert await services.autocomplete('banco') == [BANCO]
+        await services.autocomplete_rebuild.task
+        assert len(loads) == 2  # noqa: PLR2004
+        assert await services.autocomplete('abrigo') == [ABRIGO]
+
+    asyncio.run(scenario())
@@ -0,0 +1,27 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from fast_rafa.core import query_counter
+
+
+@pytest.fixture
+def stats():
+    stats = query_counter.QueryStats()
+    token = query_counter._current_stats.set(stats)
+    yield stats
+    query_counter._current_stats.reset(token)
+
+
+def test_failed_statement_does_not_leave_a_start_time(stats):
+    engine = create_engine('sqlite:///:memory:')
+
+    with engine.connect() as conn:
+        with pytest.raises(OperationalError):
+            conn.execute(text('SELECT * FROM tabela_inexistente'))
+        assert not conn.info['query_start_time']
+
+        conn.execute(text('SELECT 1'))
+        assert not conn.info['query_start_time']
+
+    assert stats.count == 2  # noqa: PLR2004
@@ -0,0 +1,82 @@
+from http import HTTPStatus
+
+import pytest
+
+from fast_rafa.modules.search.services import (
+    build_fts5_match,
+    build_tsquery,
+    search_posts,
+)
+
+
+def titles(posts):
+    return [post.titulo for post in posts]
+
+
+def test_search_matches_title_and_description(session, make_post):
+    make_post('Cesta básica', 'Arroz e feijão')
+    make_post('Roupas de inverno', 'Casacos e cobertores')
+
+    assert titles(search_posts(session, 'cesta')) == ['Cesta básica']
+    assert titles(search_posts(session, 'cobertores')) == ['Roupas de inverno']
+
+
+def test_search_ignores_accents_and_matches_prefixes(session, make_post):
+    make_post('Feijão carioca', 'Pacotes de 1kg')
+
+    assert titles(search_posts(session, 'feijao')) == ['Feijão carioca']
+    assert titles(search_posts(session, 'cari')) == ['Feijão carioca']
+
+
+def test_search_ranks_title_above_description(session, make_post):
+    make_post('Roupas', 'Leite em pó para bebês')
+    make_post('Leite integral', 'Caixas fechadas')
+
+    assert titles(search_posts(session, 'leite')) == [
+        'Leite integral',
+        'Roupas',
+    ]
+
+
+def test_search_skips_inactive_posts(session, make_post):
+    make_post('Leite integral', status=0)
+
+    assert search_posts(session, 'leite') == []
+
+
+def test_search_without_words_returns_nothing(session, make_post):
+    make_post('Leite integral')
+
+    assert search_posts(session, '  ') == []
+    assert search_posts(session, '"*(') == []
+
+
+def test_search_paginates(session, make_post):
+    for index in range(3):
+        make_post(f'Leite {index}')
+
+    first = search_posts(session, 'leite', limit=2)
+    second = search_posts(session, 'leite', offset=2, limit=2)
+
+    assert titles(first) + titles(second) == ['Leite 0', 'Leite 1', 'Leite 2']
+
+
+def test_fts5_match_quotes_each_word():
+    assert build_fts5_match('banco "de" alimentos*') == (
+        '"banco"* "de"* "alimentos"*'
+    )
+
+
+def test_tsquery_matches_the_same_prefixes_as_fts5():
+    assert build_tsquery('banco "de" alimentos*') == (
+        'banco:* & de:* & alimentos:*'
+    )
+    assert build_tsquery('cesta_basica') == 'cesta:* & basica:*'
+    assert build_fts5_match('cesta_basica') == '"cesta"* "basica"*'
+
+
+@pytest.mark.parametrize('params', ['limit=0', 'limit=1000000', 'offset=-1'])
+def test_search_page_rejects_out_of_range_pagination(client, params):
+    response = client.get(f'/search?query=leite&{params}')
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
@@ -2,7 +2,7 @@ from http import HTTPStatus
 
 from jwt import decode
 
-from fast_rafa.security import ALGORITHM, SECRET_KEY, create_access_token
+from fast_rafa.core.security import ALGORITHM, SECRET_KEY, create_access_token
 
 
 def test_jwt_token(client):
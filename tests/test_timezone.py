@@ -0,0 +1,38 @@
+from datetime import datetime
+
+import pytest
+from zoneinfo import ZoneInfo
+
+from fast_rafa.utils import timezone
+
+UTC_NOON = datetime(2024, 1, 1, 12, 0)
+SAO_PAULO_NOON = datetime(2024, 1, 1, 9, 0)
+
+
+@pytest.fixture(autouse=True)
+def sao_paulo(monkeypatch):
+    monkeypatch.setattr(
+        timezone, 'get_timezone', lambda: ZoneInfo('America/Sao_Paulo')
+    )
+
+
+@pytest.mark.parametrize('timestamps_utc', [False, True])
+def test_localtime_always_converts_utc_columns(monkeypatch, timestamps_utc):
+    monkeypatch.setattr(timezone.settings, 'TIMESTAMPS_UTC', timestamps_utc)
+
+    assert timezone.localtime(UTC_NOON) == SAO_PAULO_NOON
+    assert timezone.localtime(None) is None
+
+
+def test_organization_localtime_keeps_local_timestamps(monkeypatch):
+    monkeypatch.setattr(timezone.settings, 'TIMESTAMPS_UTC', False)
+
+    assert timezone.organization_localtime(UTC_NOON) == UTC_NOON
+    assert timezone.organization_localtime(None) is None
+
+
+def test_organization_localtime_converts_utc_timestamps(monkeypatch):
+    monkeypatch.setattr(timezone.settings, 'TIMESTAMPS_UTC', True)
+
+    assert timezone.organization_localtime(UTC_NOON) == SAO_PAULO_NOON
+    assert timezone.organization_localtime(None) is None